@@ -0,0 +1,105 @@
+"""
+A2ADiscoveryClient 에이전트 선택 마이크로벤치마크 (대규모 합성 레지스트리)
+
+네트워크 없이 레지스트리를 직접 채우고, 파이프라인 에이전트 선택 비용이
+등록된 에이전트 수에 따라 어떻게 늘어나는지 측정합니다.
+    find_optimal_agents_for_pipeline   전체 파이프라인(5 스킬) / research + write + send_email
+    find_agent_by_skill                스킬 하나 (파이프라인 힌트 없음)
+    registry rebuild                   에이전트 하나 등록 시 스냅샷/스킬 인덱스 재생성
+
+레지스트리는 고정 시드로 생성하므로 실행마다 같은 구성입니다.
+
+Usage:
+    python benchmarks/bench_discovery.py
+    python benchmarks/bench_discovery.py --quick --json results/discovery.json
+"""
+import argparse
+import random
+from typing import Dict, List
+
+from common import measure, print_table, save_results
+
+from src.adk.discovery import A2ADiscoveryClient, AgentInfo
+
+
+# 실제 에이전트 스킬 (start_agents_5.py 구성)
+PIPELINE_SKILLS = ["deep_research", "write", "quality_review", "revise", "save_to_file", "send_email"]
+# 합성 스킬 어휘 크기 (실제 스킬 포함)
+VOCABULARY_SIZE = 64
+
+FULL_PIPELINE = ["deep_research", "write", "quality_review", "revise", "save_to_file"]
+EMAIL_PIPELINE = ["deep_research", "write", "send_email"]
+
+
+def synthetic_agents(count: int, seed: int = 0) -> Dict[str, AgentInfo]:
+    """
+    스킬 1~6개를 가진 에이전트 count개 (url → AgentInfo)
+
+    스킬은 실제 파이프라인 스킬과 합성 스킬에서 고르며, 일부는 Attacker Agent처럼 여러 파이프라인 스킬을 가집니다.
+    """
+    rng = random.Random(seed)
+    vocabulary = PIPELINE_SKILLS + [f"skill_{i:02d}" for i in range(VOCABULARY_SIZE - len(PIPELINE_SKILLS))]
+    agents = {}
+    for i in range(count):
+        names = rng.sample(vocabulary, rng.randint(1, 6))
+        url = f"http://agent-{i:05d}.bench:9000"
+        agents[url] = AgentInfo(
+            url=url,
+            name=f"Bench Agent {i}",
+            description="합성 벤치마크 에이전트",
+            skills=[{"name": name, "description": name} for name in names],
+            agent_card={},
+        )
+    return agents
+
+
+def populated_client(agents: Dict[str, AgentInfo]) -> A2ADiscoveryClient:
+    """네트워크 조회 없이 레지스트리를 채운 디스커버리 클라이언트"""
+    client = A2ADiscoveryClient()
+    client._update_registry(lambda registry: registry.update(agents))
+    return client
+
+
+def registry_benchmarks(sizes: List[int], number: int, repeat: int):
+    results = []
+    for size in sizes:
+        agents = synthetic_agents(size)
+        client = populated_client(agents)
+        extra = synthetic_agents(1, seed=size)
+        # 레지스트리가 클수록 한 번의 비용이 커지므로 측정 시간이 비슷하도록 반복 횟수 조정
+        n = max(number * 10 // size, 5)
+
+        results += [
+            measure(f"{size:>5} agents: optimal pipeline (5 skills)",
+                    lambda: client.find_optimal_agents_for_pipeline(FULL_PIPELINE), n, repeat),
+            measure(f"{size:>5} agents: optimal pipeline (3 skills)",
+                    lambda: client.find_optimal_agents_for_pipeline(EMAIL_PIPELINE), n, repeat),
+            measure(f"{size:>5} agents: find_agent_by_skill",
+                    lambda: client.find_agent_by_skill("write"), n, repeat),
+            measure(f"{size:>5} agents: registry rebuild (+1 agent)",
+                    lambda: client._update_registry(lambda registry: registry.update(extra)), n, repeat),
+        ]
+        client.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A2ADiscoveryClient agent selection microbenchmark")
+    parser.add_argument("--quick", action="store_true", help="적은 반복으로 빠르게 실행")
+    parser.add_argument("--sizes", default=None, help="레지스트리 크기 (쉼표 구분, 기본 10,100,1000,10000)")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    number, repeat = (200, 3) if args.quick else (2000, 5)
+    default_sizes = "10,100,1000" if args.quick else "10,100,1000,10000"
+    sizes = [int(s) for s in (args.sizes or default_sizes).split(",")]
+
+    results = registry_benchmarks(sizes, number, repeat)
+    print_table("Agent selection (per call)", results)
+
+    if args.json:
+        save_results(args.json, "discovery", results, sizes=sizes)
+
+
+if __name__ == "__main__":
+    main()
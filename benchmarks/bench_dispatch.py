@@ -0,0 +1,119 @@
+"""
+A2AServer 스킬 디스패치 오버헤드 마이크로벤치마크
+
+요청 하나당 디스패치 비용을 측정합니다.
+    legacy        agent.get_skill() + agent.execute_skill() (이전 handle_rpc 경로)
+    table         디스패치 테이블 조회 한 번 + 호출
+    handle_rpc    JSON-RPC 검증 + 파라미터 검증 + 취소 토큰 포함 전체 경로
+    ASGI          httpx.ASGITransport로 FastAPI 앱을 직접 호출 (소켓 없이 라우팅/인코딩/미들웨어 포함)
+    inproc        A2AClient("inproc://...") (InProcessTransport)
+
+Usage:
+    python benchmarks/bench_dispatch.py
+    python benchmarks/bench_dispatch.py --quick --json results/dispatch.json
+"""
+import argparse
+import time
+
+import httpx
+
+from common import measure, measure_async, print_table, save_results
+
+from src.adk import A2AAgent, A2AClient, agent_skill, A2AServer, codec
+
+
+class EchoAgent(A2AAgent):
+    """디스패치 비용만 남도록 아무 일도 하지 않는 스킬을 가진 에이전트"""
+
+    def __init__(self):
+        super().__init__(
+            agent_id="bench_echo",
+            name="Bench Echo Agent",
+            description="디스패치 벤치마크용 에이전트"
+        )
+
+    @agent_skill("echo", "입력을 그대로 반환")
+    def echo(self, text: str) -> str:
+        return text
+
+    @agent_skill("summarize", "벤치마크용 두 번째 스킬")
+    def summarize(self, text: str, max_length: int = 100) -> str:
+        return text[:max_length]
+
+
+def asgi_benchmarks(server: A2AServer, number: int, repeat: int):
+    """FastAPI 라우트를 in-process ASGI로 호출 (HTTP 파싱/소켓 제외 전체 요청 경로)"""
+    transport = httpx.ASGITransport(app=server.app, client=("127.0.0.1", 50000))
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+    request = codec.encode({"jsonrpc": "2.0", "method": "echo", "params": {"text": "hello"}, "id": 1})
+    bad_request = codec.encode({"jsonrpc": "2.0", "method": "echo", "params": {}, "id": 1})
+    json_headers = {"content-type": codec.JSON_MEDIA_TYPE}
+
+    def post(body: bytes, headers: dict):
+        return lambda: client.post("/rpc", content=body, headers=headers)
+
+    results = [
+        measure_async("ASGI: GET /health", lambda: client.get("/health"), number, repeat),
+        measure_async("ASGI: POST /rpc (json)", post(request, json_headers), number, repeat),
+        measure_async("ASGI: POST /rpc (json, X-A2A-Timeout)",
+                      post(request, dict(json_headers, **{"x-a2a-timeout": "60"})), number, repeat),
+        measure_async("ASGI: POST /rpc (invalid params)", post(bad_request, json_headers), number, repeat),
+    ]
+    if codec.is_supported(codec.MSGPACK_MEDIA_TYPE):
+        msgpack_request = codec.encode(
+            {"jsonrpc": "2.0", "method": "echo", "params": {"text": "hello"}, "id": 1}, codec.MSGPACK_MEDIA_TYPE
+        )
+        msgpack_headers = {"content-type": codec.MSGPACK_MEDIA_TYPE, "accept": codec.MSGPACK_MEDIA_TYPE}
+        results.append(measure_async("ASGI: POST /rpc (msgpack)", post(msgpack_request, msgpack_headers), number, repeat))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A2AServer dispatch microbenchmark")
+    parser.add_argument("--quick", action="store_true", help="적은 반복으로 빠르게 실행")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    number, repeat = (2000, 3) if args.quick else (50000, 5)
+
+    agent = EchoAgent()
+    server = A2AServer(agent, port=0)
+    params = {"text": "hello"}
+    request = {"jsonrpc": "2.0", "method": "echo", "params": params, "id": 1}
+    bad_request = {"jsonrpc": "2.0", "method": "echo", "params": {}, "id": 1}
+    entry = server.skills["echo"]
+
+    def legacy():
+        skill = agent.get_skill("echo")
+        if skill:
+            return agent.execute_skill("echo", **params)
+
+    def table():
+        return server.skills["echo"].invoke(params)
+
+    results = [
+        measure("direct method call", lambda: agent.echo(**params), number, repeat),
+        measure("legacy: get_skill + execute_skill", legacy, number, repeat),
+        measure("table: lookup + invoke", table, number, repeat),
+        measure("table: validator only", lambda: entry.validator.validate(params), number, repeat),
+        measure("handle_rpc (valid)", lambda: server.handle_rpc(request), number, repeat),
+        measure("handle_rpc (valid, with deadline)", lambda: server.handle_rpc(request, time.monotonic() + 60), number, repeat),
+        measure("handle_rpc (invalid params)", lambda: server.handle_rpc(bad_request), number, repeat),
+    ]
+    print_table("Skill dispatch (per call)", results, {
+        "table: lookup + invoke": "legacy: get_skill + execute_skill",
+    })
+
+    inproc = A2AClient(server.local_url)
+    request_results = asgi_benchmarks(server, number // 10, repeat)
+    request_results.append(measure(
+        "inproc: A2AClient.execute_skill", lambda: inproc.execute_skill("echo", **params), number // 10, repeat
+    ))
+    print_table("Request path (per call)", request_results)
+
+    if args.json:
+        save_results(args.json, "dispatch", results + request_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+A2A 에이전트 fleet 부하 테스트 (end-to-end)
+
+benchmarks/fleet.py로 start_agents_5.py(또는 4) 설정의 에이전트를 시뮬레이션 LLM과 함께 띄우고,
+워크로드를 지정한 동시성/도착률로 실행하여 지연 분포, 처리량, 오류율을 측정합니다.
+    rpc         POST /rpc (A2AClient.execute_skill)
+    tasks       POST /tasks + 롱폴링 대기 (create_task + wait_for_task)
+    pipeline    run_dynamic_pipeline (쿼리 분석 → Discovery → 단계별 스킬 호출 → 파일 저장)
+
+부하 모델:
+    --rate 0 (기본)   closed loop: --concurrency개 워커가 응답을 받자마자 다음 요청
+    --rate R          open loop: 초당 R개 요청이 포아송 과정으로 도착하고 --concurrency개 워커가 처리
+                      (지연은 예정된 도착 시각부터 재므로 대기열에서 기다린 시간도 포함)
+
+지연 백분위수는 성공한 요청만 집계합니다.
+
+Usage:
+    python benchmarks/bench_load.py --quick
+    python benchmarks/bench_load.py --workload rpc,tasks --concurrency 32 --duration 30
+    python benchmarks/bench_load.py --workload pipeline --rate 2 --llm-latency 1.0 --json results/load.json
+"""
+import argparse
+import collections
+import contextlib
+import importlib
+import io
+import itertools
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from common import latency_summary, save_results
+from fleet import Fleet, SimulatedLLM, install, load_agents
+
+from src.adk import A2AClient
+from src.adk.log import configure_logging
+
+
+WORKLOADS = ("rpc", "tasks", "pipeline")
+
+# 스킬 → (에이전트 mode, 파라미터)
+SKILLS = {
+    "deep_research": ("research", {"query": "AI 에이전트 간 협업"}),
+    "write": ("writer", {"bullets": "- A2A 프로토콜\n- 에이전트 간 협업\n- 동적 파이프라인"}),
+    "quality_review": ("reviewer", {"draft": "A2A 프로토콜은 에이전트 간 협업을 위한 표준입니다."}),
+}
+
+# 키워드가 없는 쿼리 → 전체 파이프라인 (research → write → review → revise → save_to_file)
+DEFAULT_QUERY = "AI 에이전트 협업의 미래"
+
+
+class _Clients:
+    """워커 스레드별 A2AClient (연결 풀을 스레드끼리 공유하지 않음)"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._all: List[A2AClient] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> A2AClient:
+        clients = self._local.__dict__.setdefault("clients", {})
+        client = clients.get(url)
+        if client is None:
+            client = clients[url] = A2AClient(url)
+            with self._lock:
+                self._all.append(client)
+        return client
+
+    def close(self):
+        for client in self._all:
+            client.close()
+
+
+def rpc_op(clients: _Clients, url: str, skill: str, params: Dict[str, Any]) -> Callable[[], None]:
+    def op():
+        clients.get(url).execute_skill(skill, **params)
+    return op
+
+
+def tasks_op(clients: _Clients, url: str, skill: str, params: Dict[str, Any],
+             timeout: float) -> Callable[[], None]:
+    def op():
+        client = clients.get(url)
+        task = client.create_task(input_data=params, metadata={"skill": skill})
+        final = client.wait_for_task(task["taskId"], timeout=timeout, cancel_on_timeout=True)
+        status = final["task"]["status"]
+        if status != "completed":
+            raise RuntimeError(f"task {status}")
+    return op
+
+
+def pipeline_op(module: Any, query: str) -> Callable[[], None]:
+    def op():
+        if module.run_dynamic_pipeline(query) is None:
+            raise RuntimeError("pipeline failed")
+    return op
+
+
+def _call(op: Callable[[], None]) -> Optional[str]:
+    """op 실행 (오류면 예외 타입 이름 반환)"""
+    try:
+        op()
+        return None
+    except Exception as e:
+        return type(e).__name__
+
+
+def run_load(name: str, op: Callable[[], None], concurrency: int, duration: float,
+             rate: float = 0.0, max_requests: Optional[int] = None, seed: int = 0) -> Dict[str, Any]:
+    """
+    op을 부하 모델에 따라 반복 실행하고 결과 요약
+
+    Args:
+        name: 워크로드 이름
+        op: 요청 하나 (실패하면 예외)
+        concurrency: 워커 스레드 수
+        duration: 요청을 보낼 시간 (초, 진행 중인 요청은 끝날 때까지 기다림)
+        rate: 초당 도착 요청 수 (0이면 closed loop)
+        max_requests: 최대 요청 수
+        seed: 도착 간격 난수 시드
+
+    Returns:
+        {"name", "requests", "ok", "errors", "error_rate", "throughput_rps", "latency_ms", ...}
+    """
+    records: List[List[Tuple[float, Optional[str]]]] = [[] for _ in range(concurrency)]
+    start = time.perf_counter()
+    deadline = start + duration
+    threads = []
+
+    if rate <= 0:
+        issued = itertools.count()
+
+        def worker(out: List[Tuple[float, Optional[str]]]):
+            while time.perf_counter() < deadline:
+                if max_requests is not None and next(issued) >= max_requests:
+                    return
+                t0 = time.perf_counter()
+                error = _call(op)
+                out.append((time.perf_counter() - t0, error))
+    else:
+        arrivals: "queue.Queue[Optional[float]]" = queue.Queue()
+
+        def schedule():
+            rng = random.Random(seed)
+            at = start
+            count = 0
+            while max_requests is None or count < max_requests:
+                at += rng.expovariate(rate)
+                if at >= deadline:
+                    break
+                delay = at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                arrivals.put(at)
+                count += 1
+            for _ in range(concurrency):
+                arrivals.put(None)
+
+        def worker(out: List[Tuple[float, Optional[str]]]):
+            while True:
+                scheduled = arrivals.get()
+                if scheduled is None:
+                    return
+                error = _call(op)
+                out.append((time.perf_counter() - scheduled, error))
+
+        threads.append(threading.Thread(target=schedule, name="load-scheduler"))
+
+    threads += [
+        threading.Thread(target=worker, args=(records[i],), name=f"load-{name}-{i}")
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    all_records = [r for worker_records in records for r in worker_records]
+    latencies = [latency for latency, error in all_records if error is None]
+    errors = collections.Counter(error for _, error in all_records if error is not None)
+    total = len(all_records)
+    return {
+        "name": name,
+        "concurrency": concurrency,
+        "rate": rate or None,
+        "elapsed_s": round(elapsed, 3),
+        "requests": total,
+        "ok": len(latencies),
+        "errors": total - len(latencies),
+        "error_rate": round((total - len(latencies)) / total, 4) if total else None,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "latency_ms": latency_summary(latencies),
+        "error_types": dict(errors),
+    }
+
+
+def print_load_table(results: List[Dict[str, Any]]):
+    """부하 테스트 결과 표 출력"""
+    def ms(value: Optional[float]) -> str:
+        return f"{value:>9,.1f}" if value is not None else f"{'-':>9}"
+
+    print("\nLoad test")
+    print("-" * 92)
+    print(f"{'workload':<10} {'reqs':>7} {'err%':>6} {'req/s':>9} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  errors")
+    for r in results:
+        latency = r["latency_ms"]
+        error_rate = f"{r['error_rate'] * 100:>5.1f}%" if r["error_rate"] is not None else f"{'-':>6}"
+        print(f"{r['name']:<10} {r['requests']:>7,} {error_rate} {r['throughput_rps']:>9,.2f} "
+              f"{ms(latency['p50'])} {ms(latency['p95'])} {ms(latency['p99'])} {ms(latency['max'])}  "
+              f"{', '.join(f'{k}={v}' for k, v in r['error_types'].items())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end load test for the A2A agent fleet")
+    parser.add_argument("--workload", default=",".join(WORKLOADS),
+                        help=f"실행할 워크로드 (쉼표 구분: {', '.join(WORKLOADS)})")
+    parser.add_argument("--agents", type=int, choices=(4, 5), default=5,
+                        help="start_agents_4.py / start_agents_5.py 설정")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수 (워커 스레드)")
+    parser.add_argument("--rate", type=float, default=0.0, help="초당 도착 요청 수 (0이면 closed loop)")
+    parser.add_argument("--duration", type=float, default=10.0, help="워크로드당 요청을 보낼 시간 (초)")
+    parser.add_argument("--requests", type=int, default=None, help="워크로드당 최대 요청 수")
+    parser.add_argument("--skill", default="write", choices=sorted(SKILLS), help="rpc/tasks에서 호출할 스킬")
+    parser.add_argument("--query", default=DEFAULT_QUERY, help="pipeline 워크로드의 쿼리")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="시뮬레이션 LLM 지연 중앙값 (초)")
+    parser.add_argument("--llm-sigma", type=float, default=0.3, help="시뮬레이션 LLM 지연의 로그 표준편차")
+    parser.add_argument("--llm-chars", type=int, default=800, help="시뮬레이션 LLM 응답 길이")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="짧게 실행 (워크로드당 3초, 동시성 4)")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.duration, args.concurrency = 3.0, 4
+    workloads = [w.strip() for w in args.workload.split(",") if w.strip()]
+    unknown = set(workloads) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"unknown workload(s): {', '.join(sorted(unknown))}")
+
+    configure_logging(level=os.getenv("A2A_LOG_LEVEL", "WARNING"))
+
+    # 파이프라인의 QueryAnalyzer도 같은 시뮬레이션 LLM 사용
+    import src.llm_gemini
+    install(SimulatedLLM(args.llm_latency, args.llm_sigma, args.llm_chars, args.seed), src.llm_gemini)
+
+    mode, params = SKILLS[args.skill]
+    timeout = max(args.duration, 60.0)
+    results = []
+    fleet = Fleet(load_agents(args.agents), args.llm_latency, args.llm_sigma, args.llm_chars)
+    print(f"Starting {len(fleet.agents)} agents (simulated LLM, median {args.llm_latency * 1000:.0f} ms, "
+          f"workdir {fleet.workdir})")
+
+    with fleet:
+        clients = _Clients()
+        pipeline = importlib.import_module(f"run_dynamic_pipeline_{args.agents}")
+        # 벤치마크 실행이 사용자의 디스커버리 캐시를 덮어쓰지 않도록
+        pipeline.DEFAULT_CACHE_PATH = os.path.join(fleet.workdir, "discovery_cache.json")
+
+        ops = {
+            "rpc": rpc_op(clients, fleet.urls[mode], args.skill, params),
+            "tasks": tasks_op(clients, fleet.urls[mode], args.skill, params, timeout),
+            "pipeline": pipeline_op(pipeline, args.query),
+        }
+
+        try:
+            for name in workloads:
+                print(f"  {name}: {args.duration:g}s, concurrency {args.concurrency}"
+                      + (f", {args.rate:g} req/s" if args.rate else ""))
+                # 파이프라인은 최종 결과를 stdout에 출력하므로 측정 중에는 버림
+                quiet = contextlib.redirect_stdout(io.StringIO()) if name == "pipeline" else contextlib.nullcontext()
+                with quiet:
+                    _call(ops[name])  # 워밍업 (연결, Agent Card, 디스커버리 캐시)
+                    results.append(run_load(
+                        name, ops[name], args.concurrency, args.duration, args.rate, args.requests, args.seed
+                    ))
+        finally:
+            clients.close()
+
+    print_load_table(results)
+
+    if args.json:
+        save_results(args.json, "load", results, config={
+            "agents": args.agents,
+            "workloads": workloads,
+            "concurrency": args.concurrency,
+            "rate": args.rate or None,
+            "duration_s": args.duration,
+            "max_requests": args.requests,
+            "skill": args.skill,
+            "query": args.query,
+            "llm": {"latency_s": args.llm_latency, "sigma": args.llm_sigma, "chars": args.llm_chars},
+        })
+
+
+if __name__ == "__main__":
+    main()
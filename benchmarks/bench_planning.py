@@ -0,0 +1,65 @@
+"""
+QueryAnalyzer 키워드 분석 마이크로벤치마크
+
+LLM 없이 쓰는 _analyze_with_keywords()의 분기별 비용과,
+여러 유형의 쿼리를 섞은 코퍼스 처리량을 측정합니다.
+
+Usage:
+    python benchmarks/bench_planning.py
+    python benchmarks/bench_planning.py --quick --json results/planning.json
+"""
+import argparse
+
+from common import measure, print_table, save_results
+
+from src.adk.query_analyzer import QueryAnalyzer
+
+
+# 분기별 대표 쿼리 (키워드 검사 순서대로)
+QUERIES = {
+    "review_only": "이 글 검토해줘",
+    "write_only": "회의록 요약해줘",
+    "research + email": "양자컴퓨팅 분석해서 이메일로 보내줘",
+    "research + file": "반도체 시장 조사 후 파일로 저장해줘",
+    "research": "AI 에이전트 간 협업의 미래에 대해 분석해줘",
+    "full_pipeline": "AI 에이전트 협업의 미래",
+}
+
+# 긴 쿼리 (키워드가 뒤쪽에 있어 모든 검사를 끝까지 수행)
+LONG_QUERY = "에이전트 간 협업 프로토콜의 설계 원칙과 운영 경험을 정리하고 " * 20 + "분석해줘"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QueryAnalyzer keyword planning microbenchmark")
+    parser.add_argument("--quick", action="store_true", help="적은 반복으로 빠르게 실행")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    number, repeat = (2000, 3) if args.quick else (20000, 5)
+
+    analyzer = QueryAnalyzer(use_llm=False)
+    corpus = list(QUERIES.values())
+
+    def analyze_corpus():
+        for query in corpus:
+            analyzer._analyze_with_keywords(query)
+
+    results = [
+        measure(f"keywords: {name}", lambda q=query: analyzer._analyze_with_keywords(q), number, repeat)
+        for name, query in QUERIES.items()
+    ]
+    results += [
+        measure(f"keywords: long query ({len(LONG_QUERY)} chars)",
+                lambda: analyzer._analyze_with_keywords(LONG_QUERY), number, repeat),
+        measure(f"keywords: mixed corpus ({len(corpus)} queries)", analyze_corpus, number // len(corpus), repeat),
+        measure("analyze_query (use_llm=False, span)",
+                lambda: analyzer.analyze_query(QUERIES["full_pipeline"]), number, repeat),
+    ]
+    print_table("Query planning (per call)", results)
+
+    if args.json:
+        save_results(args.json, "planning", results)
+
+
+if __name__ == "__main__":
+    main()
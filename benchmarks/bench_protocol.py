@@ -0,0 +1,136 @@
+"""
+a2a_protocol 모델 생성/직렬화 마이크로벤치마크
+
+이전 구현(uuid.uuid4 기본 ID)과 현재 구현을 같은 프로세스에서 비교합니다.
+타임스탬프를 지연 생성하는 경우(생성 시 None)의 상한도 함께 측정합니다.
+
+Usage:
+    python benchmarks/bench_protocol.py
+    python benchmarks/bench_protocol.py --quick --json results/protocol.json
+"""
+import argparse
+import json
+import uuid
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from pydantic import BaseModel, Field
+
+from common import measure, print_table, save_results
+
+from src.a2a_protocol import (
+    CreateTaskRequest, CreateTaskResponse, JsonRpcRequest, StreamEvent, Task, TaskInput,
+    TaskOutput, TaskStatus, new_id
+)
+from src.adk import codec
+
+
+# ============================================
+# 비교 기준: 이전 구현 (매 생성마다 str(uuid.uuid4()))
+# ============================================
+
+class LegacyJsonRpcRequest(BaseModel):
+    jsonrpc: str = "2.0"
+    method: str
+    params: Optional[Dict[str, Any]] = None
+    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+
+
+class LegacyTask(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    status: TaskStatus = "submitted"
+    input: TaskInput
+    output: Optional[TaskOutput] = None
+    createdAt: datetime = Field(default_factory=datetime.utcnow)
+    updatedAt: datetime = Field(default_factory=datetime.utcnow)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class LazyTimestampTask(BaseModel):
+    """타임스탬프를 지연 생성할 때 얻을 수 있는 최대 이득 (생성 시 datetime.utcnow를 호출하지 않음)"""
+    id: str = Field(default_factory=new_id)
+    status: TaskStatus = "submitted"
+    input: TaskInput
+    output: Optional[TaskOutput] = None
+    createdAt: Optional[datetime] = None
+    updatedAt: Optional[datetime] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+def construction_benchmarks(number: int, repeat: int):
+    task_input = TaskInput(text="AI 트렌드", data={"query": "AI 트렌드"})
+    request_body = {"input": {"text": "AI 트렌드", "data": {"query": "AI 트렌드"}}, "metadata": {"skill": "write"}}
+    now = datetime.utcnow()
+
+    results = [
+        measure("id: str(uuid.uuid4())", lambda: str(uuid.uuid4()), number, repeat),
+        measure("id: new_id()", new_id, number, repeat),
+        measure("Task(): legacy", lambda: LegacyTask(input=task_input, metadata={"skill": "write"}), number, repeat),
+        measure("Task(): current", lambda: Task(input=task_input, metadata={"skill": "write"}), number, repeat),
+        measure("Task(): lazy timestamps", lambda: LazyTimestampTask(input=task_input, metadata={"skill": "write"}), number, repeat),
+        measure("Task.model_construct()", lambda: Task.model_construct(
+            id="t", status="submitted", input=task_input, output=None,
+            createdAt=now, updatedAt=now, metadata={"skill": "write"}
+        ), number, repeat),
+        measure("JsonRpcRequest(): legacy", lambda: LegacyJsonRpcRequest(method="write", params={"bullets": "x"}), number, repeat),
+        measure("JsonRpcRequest(): current", lambda: JsonRpcRequest(method="write", params={"bullets": "x"}), number, repeat),
+        measure("StreamEvent()", lambda: StreamEvent(type="status", data={"status": "working"}), number, repeat),
+        measure("CreateTaskRequest.model_validate()", lambda: CreateTaskRequest.model_validate(request_body), number, repeat),
+        measure("CreateTaskResponse()", lambda: CreateTaskResponse(taskId="t", status="submitted"), number, repeat),
+    ]
+    baseline = {
+        "id: new_id()": "id: str(uuid.uuid4())",
+        "Task(): current": "Task(): legacy",
+        "Task(): lazy timestamps": "Task(): current",
+        "Task.model_construct()": "Task(): current",
+        "JsonRpcRequest(): current": "JsonRpcRequest(): legacy",
+    }
+    return results, baseline
+
+
+def serialization_benchmarks(number: int, repeat: int):
+    task = Task(
+        input=TaskInput(text="AI 트렌드", data={"query": "AI 트렌드"}),
+        output=TaskOutput(text="본문 " * 200),
+        metadata={"skill": "write"}
+    )
+    status_only = {"task": {"id": task.id, "status": task.status}}
+
+    results = [
+        measure("full task: model_dump() + codec.dumps", lambda: codec.dumps({"task": task.model_dump()}), number, repeat),
+        measure("full task: model_dump_json()", lambda: task.model_dump_json(), number, repeat),
+        measure("full task: model_dump(mode=json) + json", lambda: json.dumps({"task": task.model_dump(mode="json")}), number, repeat),
+        measure("status only: codec.dumps", lambda: codec.dumps(status_only), number, repeat),
+    ]
+    if codec.is_supported(codec.MSGPACK_MEDIA_TYPE):
+        results.append(measure(
+            "full task: model_dump() + msgpack",
+            lambda: codec.encode({"task": task.model_dump()}, codec.MSGPACK_MEDIA_TYPE), number, repeat
+        ))
+    baseline = {
+        "full task: model_dump() + codec.dumps": "full task: model_dump(mode=json) + json",
+        "full task: model_dump_json()": "full task: model_dump(mode=json) + json",
+    }
+    return results, baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="a2a_protocol microbenchmarks")
+    parser.add_argument("--quick", action="store_true", help="적은 반복으로 빠르게 실행")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    number, repeat = (2000, 3) if args.quick else (20000, 5)
+
+    construction, construction_base = construction_benchmarks(number, repeat)
+    print_table("Model construction", construction, construction_base)
+
+    serialization, serialization_base = serialization_benchmarks(number, repeat)
+    print_table("Serialization", serialization, serialization_base)
+
+    if args.json:
+        save_results(args.json, "protocol", construction + serialization)
+
+
+if __name__ == "__main__":
+    main()
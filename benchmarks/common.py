@@ -0,0 +1,187 @@
+"""
+벤치마크 공용 유틸리티
+반복 측정, 지연 분포 요약, 결과 표 출력, JSON 저장
+"""
+import asyncio
+import gc
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Sequence
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def measure(name: str, fn: Callable[[], Any], number: int = 20000, repeat: int = 5) -> Dict[str, Any]:
+    """
+    fn을 number번 호출하는 측정을 repeat번 반복하여 가장 빠른 값 기록
+
+    최솟값은 다른 프로세스/GC의 간섭이 가장 적은 측정이므로 비교에 안정적입니다.
+
+    Args:
+        name: 측정 이름
+        fn: 인자 없는 호출 대상
+        number: 측정 한 번당 호출 횟수
+        repeat: 측정 반복 횟수
+
+    Returns:
+        {"name", "ns_per_op", "ops_per_sec", "number", "repeat"}
+    """
+    fn()  # 워밍업 (지연 초기화, 캐시)
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                fn()
+            timings.append((time.perf_counter_ns() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return _result(name, min(timings), number, repeat)
+
+
+def measure_async(name: str, fn: Callable[[], Awaitable[Any]], number: int = 2000, repeat: int = 5) -> Dict[str, Any]:
+    """
+    measure()의 코루틴 버전 (하나의 이벤트 루프 안에서 fn()을 number번 await)
+
+    호출마다 이벤트 루프를 새로 돌리지 않으므로 루프 시작 비용이 측정에 섞이지 않습니다.
+
+    Args:
+        name: 측정 이름
+        fn: 인자 없이 awaitable을 반환하는 호출 대상
+        number: 측정 한 번당 호출 횟수
+        repeat: 측정 반복 횟수
+
+    Returns:
+        measure()와 같은 형식
+    """
+    async def run() -> List[float]:
+        await fn()  # 워밍업
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                await fn()
+            timings.append((time.perf_counter_ns() - start) / number)
+        return timings
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = asyncio.run(run())
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return _result(name, min(timings), number, repeat)
+
+
+def _result(name: str, best: float, number: int, repeat: int) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "ns_per_op": round(best, 1),
+        "ops_per_sec": round(1e9 / best) if best else None,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> Optional[float]:
+    """
+    nearest-rank 백분위수
+
+    Args:
+        sorted_values: 오름차순 정렬된 값
+        q: 백분위 (0~100)
+    """
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(seconds: Sequence[float]) -> Dict[str, Optional[float]]:
+    """지연 목록(초) → p50/p95/p99/평균/최대 (밀리초)"""
+    values = sorted(seconds)
+    summary = {f"p{q}": percentile(values, q) for q in (50, 95, 99)}
+    summary["mean"] = sum(values) / len(values) if values else None
+    summary["max"] = values[-1] if values else None
+    return {k: None if v is None else round(v * 1000, 2) for k, v in summary.items()}
+
+
+def print_table(title: str, results: List[Dict[str, Any]], baseline: Optional[Dict[str, str]] = None):
+    """
+    결과 표 출력
+
+    Args:
+        title: 표 제목
+        results: measure() 결과 목록
+        baseline: 측정 이름 → 비교 기준 측정 이름 (지정하면 배속 표시)
+    """
+    by_name = {r["name"]: r for r in results}
+    width = max(len(r["name"]) for r in results)
+
+    print(f"\n{title}")
+    print("-" * (width + 40))
+    for r in results:
+        line = f"{r['name']:<{width}}  {r['ns_per_op']:>12,.1f} ns/op  {r['ops_per_sec']:>12,} op/s"
+        base = (baseline or {}).get(r["name"])
+        if base in by_name:
+            line += f"  x{by_name[base]['ns_per_op'] / r['ns_per_op']:.2f}"
+        print(line)
+
+
+def git_revision() -> Optional[str]:
+    """측정한 코드의 커밋 (git이 없거나 저장소가 아니면 None)"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": os.cpu_count(),
+        "commit": git_revision(),
+    }
+
+
+def save_results(path: str, suite: str, results: List[Dict[str, Any]], **extra):
+    """
+    결과를 JSON으로 저장 (커밋 간 비교용)
+
+    Args:
+        path: 저장 경로
+        suite: 벤치마크 이름
+        results: 측정 결과 목록
+        **extra: 함께 저장할 추가 정보
+    """
+    report = {
+        "suite": suite,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "results": results,
+        **extra,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n Saved: {path}")
@@ -0,0 +1,256 @@
+"""
+벤치마크용 에이전트 fleet
+start_agents_4.py / start_agents_5.py와 같은 설정으로 에이전트를 띄우되, Gemini 대신 시뮬레이션 LLM 사용
+
+    with Fleet(load_agents(5), llm_latency=0.2) as fleet:
+        ...  # http://localhost:9201 ~ 9205
+
+각 에이전트는 별도 프로세스로 실행됩니다 (examples/adk_with_gemini.py의 에이전트 클래스 그대로).
+시뮬레이션 LLM은 로그 정규 분포 지연(중앙값 latency) 후 정해진 길이의 텍스트를 반환하므로,
+API 키와 쿼터 없이 서버/클라이언트/파이프라인 오버헤드만 재현 가능하게 측정할 수 있습니다.
+
+직접 실행 (에이전트 하나):
+    python benchmarks/fleet.py --mode writer --port 9202 --llm-latency 0.2
+"""
+import argparse
+import dataclasses
+import importlib
+import importlib.util
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from common import ROOT
+
+from src.adk.cancellation import check_cancelled, remaining_time
+
+
+# start_agents_*.py의 mode → examples/adk_with_gemini.py의 에이전트 클래스
+AGENT_CLASSES = {
+    "research": "GeminiResearchAgent",
+    "writer": "GeminiWriterAgent",
+    "reviewer": "GeminiReviewerAgent",
+    "reporter": "GeminiReporterAgent",
+    "attacker": "GeminiAttackerAgent",
+}
+
+_FILLER = (
+    "Agent-to-agent collaboration lets specialised agents divide a task, exchange intermediate "
+    "results and review each other's work. "
+)
+
+
+class SimulatedLLM:
+    """
+    src.llm_gemini.generate / generate_stream 대체
+
+    지연은 중앙값 latency, 표준편차 sigma(로그 스케일)인 로그 정규 분포를 따릅니다.
+    실제 LLM 호출처럼 취소 토큰과 deadline을 확인합니다.
+    """
+
+    def __init__(self, latency: float = 0.2, sigma: float = 0.3, chars: int = 800,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            latency: 응답 지연 중앙값 (초)
+            sigma: 지연 분포의 로그 표준편차 (0이면 항상 latency)
+            chars: 응답 텍스트 길이
+            seed: 지연 난수 시드
+        """
+        self.latency = latency
+        self.sigma = sigma
+        self.chars = chars
+        self._random = random.Random(seed)
+
+    def _delay(self) -> float:
+        if self.latency <= 0:
+            return 0.0
+        return self.latency * math.exp(self._random.gauss(0.0, self.sigma)) if self.sigma else self.latency
+
+    def _sleep(self, seconds: float):
+        remaining = remaining_time()
+        if remaining is not None and remaining < seconds:
+            time.sleep(max(remaining, 0.0))
+            check_cancelled()
+            return
+        time.sleep(seconds)
+
+    def _respond(self, system: str, user: str) -> str:
+        if "task analyzer" in system.lower():
+            return self._plan(user)
+        head = f"[simulated] {user[:80]}\n\n"
+        body = (_FILLER * (self.chars // len(_FILLER) + 1))[:max(self.chars - len(head), 0)]
+        return head + body
+
+    @staticmethod
+    def _plan(user: str) -> str:
+        """QueryAnalyzer 프롬프트에는 키워드 분석과 같은 계획을 JSON으로 응답"""
+        from src.adk.query_analyzer import QueryAnalyzer
+
+        query = user.split("\n", 1)[0].removeprefix("Query:").strip()
+        plan = QueryAnalyzer(use_llm=False)._analyze_with_keywords(query)
+        return json.dumps(dataclasses.asdict(plan), ensure_ascii=False)
+
+    def generate(self, system: str, user: str) -> str:
+        check_cancelled()
+        self._sleep(self._delay())
+        return self._respond(system, user)
+
+    def generate_stream(self, system: str, user: str, chunk_chars: int = 40):
+        check_cancelled()
+        text = self._respond(system, user)
+        chunks = [text[i:i + chunk_chars] for i in range(0, len(text), chunk_chars)] or [""]
+        per_chunk = self._delay() / len(chunks)
+        for chunk in chunks:
+            self._sleep(per_chunk)
+            check_cancelled()
+            yield chunk
+
+
+def install(llm: SimulatedLLM, *modules: Any):
+    """모듈의 generate / generate_stream을 시뮬레이션 LLM으로 교체"""
+    for module in modules:
+        if hasattr(module, "generate"):
+            module.generate = llm.generate
+        if hasattr(module, "generate_stream"):
+            module.generate_stream = llm.generate_stream
+
+
+def load_agents(count: int = 5) -> List[Dict[str, Any]]:
+    """start_agents_{count}.py의 AGENTS 설정"""
+    return list(importlib.import_module(f"start_agents_{count}").AGENTS)
+
+
+def _port_in_use(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
+class Fleet:
+    """시뮬레이션 LLM을 쓰는 에이전트 프로세스 묶음"""
+
+    def __init__(self, agents: List[Dict[str, Any]], llm_latency: float = 0.2, llm_sigma: float = 0.3,
+                 llm_chars: int = 800, workdir: Optional[str] = None, startup_timeout: float = 30.0):
+        """
+        Args:
+            agents: start_agents_*.py 형식의 에이전트 설정 [{"name", "mode", "port"}, ...]
+            llm_latency: 시뮬레이션 LLM 지연 중앙값 (초)
+            llm_sigma: 시뮬레이션 LLM 지연의 로그 표준편차
+            llm_chars: 시뮬레이션 LLM 응답 길이
+            workdir: 에이전트 작업 디렉터리 (Reporter가 저장하는 파일, 에이전트 로그. None이면 임시 디렉터리)
+            startup_timeout: 모든 에이전트가 /health에 응답할 때까지 기다릴 시간 (초)
+        """
+        self.agents = agents
+        self.llm_args = [
+            "--llm-latency", str(llm_latency), "--llm-sigma", str(llm_sigma), "--llm-chars", str(llm_chars)
+        ]
+        self.workdir = workdir or tempfile.mkdtemp(prefix="a2a-bench-")
+        self.startup_timeout = startup_timeout
+        self.processes: List[subprocess.Popen] = []
+
+    @property
+    def urls(self) -> Dict[str, str]:
+        """mode → URL"""
+        return {a["mode"]: f"http://localhost:{a['port']}" for a in self.agents}
+
+    def start(self):
+        """
+        에이전트 프로세스 시작 후 모두 준비될 때까지 대기
+
+        Raises:
+            RuntimeError: 포트가 이미 사용 중이거나 에이전트가 시간 안에 뜨지 않음
+        """
+        busy = [a["port"] for a in self.agents if _port_in_use(a["port"])]
+        if busy:
+            raise RuntimeError(f"Ports already in use: {busy} (stop start_agents_*.py before benchmarking)")
+
+        env = dict(os.environ, A2A_LOG_LEVEL=os.getenv("A2A_LOG_LEVEL", "WARNING"))
+        env.pop("GEMINI_API_KEY", None)
+        for i, agent in enumerate(self.agents):
+            log = open(os.path.join(self.workdir, f"{agent['mode']}.log"), "w", encoding="utf-8")
+            cmd = [
+                sys.executable, os.path.abspath(__file__),
+                "--mode", agent["mode"], "--port", str(agent["port"]), "--seed", str(i), *self.llm_args
+            ]
+            self.processes.append(subprocess.Popen(
+                cmd, cwd=self.workdir, env=env, stdout=log, stderr=subprocess.STDOUT
+            ))
+            log.close()
+
+        deadline = time.monotonic() + self.startup_timeout
+        pending = dict(self.urls)
+        while pending:
+            for mode, url in list(pending.items()):
+                try:
+                    if httpx.get(f"{url}/health", timeout=1.0).status_code == 200:
+                        del pending[mode]
+                except httpx.HTTPError:
+                    pass
+            if any(p.poll() is not None for p in self.processes):
+                self.stop()
+                raise RuntimeError(f"An agent exited during startup (logs: {self.workdir})")
+            if pending and time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(f"Agents did not start within {self.startup_timeout}s: {list(pending)}")
+            time.sleep(0.1)
+
+    def stop(self):
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self.processes = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def serve(mode: str, port: int, llm: SimulatedLLM):
+    """examples/adk_with_gemini.py의 에이전트를 시뮬레이션 LLM으로 실행"""
+    spec = importlib.util.spec_from_file_location(
+        "adk_with_gemini", os.path.join(ROOT, "examples", "adk_with_gemini.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    import src.llm_gemini
+    install(llm, module, src.llm_gemini)
+
+    from src.adk import A2AServer
+
+    agent = getattr(module, AGENT_CLASSES[mode])()
+    A2AServer(agent, port=port).run(log_level="warning", access_log=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run one benchmark agent with a simulated LLM")
+    parser.add_argument("--mode", required=True, choices=sorted(AGENT_CLASSES))
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="LLM 지연 중앙값 (초)")
+    parser.add_argument("--llm-sigma", type=float, default=0.3, help="LLM 지연의 로그 표준편차")
+    parser.add_argument("--llm-chars", type=int, default=800, help="LLM 응답 길이")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    serve(args.mode, args.port, SimulatedLLM(args.llm_latency, args.llm_sigma, args.llm_chars, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+마이크로벤치마크 스위트 실행 및 커밋 간 비교
+
+각 벤치마크를 별도 프로세스에서 같은 조건(PYTHONHASHSEED 고정, trace 비활성, 로그 WARNING)으로 실행하고
+결과를 디렉터리에 <suite>.json으로 저장합니다.
+    protocol    a2a_protocol 모델 생성/직렬화 (bench_protocol.py)
+    dispatch    스킬 디스패치, in-process ASGI /rpc (bench_dispatch.py)
+    discovery   대규모 레지스트리에서 파이프라인 에이전트 선택 (bench_discovery.py)
+    planning    QueryAnalyzer 키워드 분석 (bench_planning.py)
+
+end-to-end 부하 테스트는 에이전트 프로세스를 띄우므로 따로 실행합니다 (bench_load.py).
+
+Usage:
+    python benchmarks/run_suite.py --out results/$(git rev-parse --short HEAD)
+    python benchmarks/run_suite.py --quick --only dispatch,planning --out results/wip --baseline results/main
+    python benchmarks/run_suite.py --compare results/main results/wip
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+from common import ROOT
+
+
+SUITES = ("protocol", "dispatch", "discovery", "planning")
+
+# 이 비율 이상 차이 나면 비교 결과에 표시
+DEFAULT_THRESHOLD = 0.10
+
+
+def _suite_env() -> Dict[str, str]:
+    env = dict(os.environ, PYTHONHASHSEED="0", A2A_LOG_LEVEL="WARNING")
+    for name in ("A2A_TRACE_FILE", "A2A_OTLP_ENDPOINT", "A2A_VERBOSE"):
+        env.pop(name, None)
+    return env
+
+
+def run_suite(names: List[str], out_dir: str, quick: bool = False) -> List[str]:
+    """
+    벤치마크를 차례로 실행하고 결과 JSON 경로 목록 반환
+
+    Raises:
+        RuntimeError: 벤치마크 프로세스가 실패함
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name in names:
+        path = os.path.join(out_dir, f"{name}.json")
+        cmd = [sys.executable, os.path.join(ROOT, "benchmarks", f"bench_{name}.py"), "--json", path]
+        if quick:
+            cmd.append("--quick")
+        print(f"\n=== {name} ===", flush=True)
+        if subprocess.run(cmd, env=_suite_env()).returncode != 0:
+            raise RuntimeError(f"Benchmark '{name}' failed")
+        paths.append(path)
+    return paths
+
+
+def _load(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(old_dir: str, new_dir: str, names: List[str] = SUITES,
+            threshold: float = DEFAULT_THRESHOLD) -> int:
+    """
+    두 결과 디렉터리의 ns/op 비교 표 출력
+
+    Returns:
+        threshold 이상 느려진 측정 수
+    """
+    regressions = 0
+    for name in names:
+        old, new = _load(os.path.join(old_dir, f"{name}.json")), _load(os.path.join(new_dir, f"{name}.json"))
+        if old is None or new is None:
+            continue
+        old_results = {r["name"]: r for r in old["results"]}
+        rows = [(r, old_results[r["name"]]) for r in new["results"] if r["name"] in old_results]
+        if not rows:
+            continue
+
+        width = max(len(r["name"]) for r, _ in rows)
+        print(f"\n{name}: {old['environment'].get('commit') or old_dir} → {new['environment'].get('commit') or new_dir}")
+        print("-" * (width + 52))
+        for r, base in rows:
+            change = r["ns_per_op"] / base["ns_per_op"] - 1 if base["ns_per_op"] else 0.0
+            mark = ""
+            if change >= threshold:
+                mark = "  slower"
+                regressions += 1
+            elif change <= -threshold:
+                mark = "  faster"
+            print(f"{r['name']:<{width}}  {base['ns_per_op']:>14,.1f}  {r['ns_per_op']:>14,.1f} ns/op  "
+                  f"{change * 100:>+7.1f}%{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the microbenchmark suite and compare runs")
+    parser.add_argument("--only", default=",".join(SUITES), help=f"실행할 벤치마크 (쉼표 구분: {', '.join(SUITES)})")
+    parser.add_argument("--quick", action="store_true", help="적은 반복으로 빠르게 실행")
+    parser.add_argument("--out", default=os.path.join(ROOT, "benchmarks", "results", "latest"),
+                        help="결과 JSON 디렉터리")
+    parser.add_argument("--baseline", metavar="DIR", help="실행 후 이 디렉터리의 결과와 비교")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="실행하지 않고 두 결과 디렉터리만 비교")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="변화로 표시할 비율 (기본 0.10)")
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.only.split(",") if n.strip()]
+    unknown = set(names) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    if args.compare:
+        regressions = compare(*args.compare, names=names, threshold=args.threshold)
+    else:
+        run_suite(names, args.out, args.quick)
+        print(f"\n Results: {args.out}")
+        regressions = compare(args.baseline, args.out, names, args.threshold) if args.baseline else 0
+
+    if regressions:
+        print(f"\n{regressions} measurement(s) slower by {args.threshold:.0%} or more")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,57 +6,123 @@ A2A 동적 파이프라인 실행 - 5 Agents 버전 (Attacker Agent 포함)
 
 Usage:
     python run_dynamic_pipeline_5.py "여기 안에 쿼리 작성하면 됩니당"
+    python run_dynamic_pipeline_5.py --verbose "쿼리"     # 단계별 배너와 중간 결과 출력
+    python run_dynamic_pipeline_5.py --batch topics.jsonl --concurrency 8 --output results.jsonl
+    cat topics.jsonl | python run_dynamic_pipeline_5.py --batch -      # stdin → stdout
+
+배치 모드는 JSONL로 받은 쿼리를 최대 --concurrency개씩 동시에 실행하고, 끝나는 대로 결과를
+한 줄씩 JSONL로 기록합니다 (형식은 src/adk/batch.py 참고). QueryAnalyzer와 에이전트 등록은
+모든 쿼리가 공유합니다. 실패한 쿼리가 있으면 종료 코드 1.
+
+진행 상황은 구조화 로그(stderr)로 남고, 최종 결과만 stdout에 출력됩니다.
+A2A_LOG_FORMAT=json, A2A_LOG_LEVEL, A2A_VERBOSE 환경 변수로 조정할 수 있습니다.
 
 """
+import argparse
 import sys
 import os
+from typing import Optional
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # .env 파일 먼저 로드 (이메일 전송 등을 위해 필요)
 import src.config_loader
 
-from src.adk import A2ADiscoveryClient
+from src.adk import A2ADiscoveryClient, batch, tracing
+from src.adk.log import banner, configure_logging, echo, flush_logging, get_logger, is_verbose
+from src.adk.discovery import DEFAULT_CACHE_PATH
 from src.adk.query_analyzer import QueryAnalyzer
+from src.adk.streaming import SkillStream
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
+logger = get_logger("a2a.pipeline")
+
+REPORT_TITLE = "a2a_5agents_report"
 
-def run_dynamic_pipeline(query: str):
+
+def run_dynamic_pipeline(query: str, analyzer: Optional[QueryAnalyzer] = None,
+                         discovery: Optional[A2ADiscoveryClient] = None, title: str = REPORT_TITLE):
     """
     쿼리 기반 동적 파이프라인 실행 (5 Agents)
     
+    A2A_TRACE_FILE(또는 A2A_OTLP_ENDPOINT)이 설정되어 있으면 실행 전체를 하나의 trace로 기록합니다.
+    쿼리 분석, 에이전트 검색, 각 스킬 호출과 에이전트 안의 LLM 호출이 이 span의 자식이 됩니다.
+    
     Args:
         query: 사용자 쿼리
-    """
-    print("=" * 80)
-    print(" A2A 동적 파이프라인 (5 Agents)")
-    print("=" * 80)
-    print()
+        analyzer: 공유할 QueryAnalyzer (None이면 새로 생성)
+        discovery: 에이전트를 등록해 둔 A2ADiscoveryClient (배치 모드에서 공유하며 닫지 않음).
+                   None이면 새로 만들어 등록하고 끝나면 닫습니다.
+        title: 저장할 파일 이름 (실제 파일명은 title_타임스탬프)
     
-    # Step 1: 쿼리 분석
-    print("─" * 80)
-    print(" Step 1: 쿼리 분석")
-    print("─" * 80)
-    print()
-    print(f" Query: {query}")
-    print()
+    Returns:
+        단계별 결과 {"research", "draft", "review", "revised", "saved_files", ...}
+        (에이전트가 없거나 실행 중 오류가 나면 None)
+    """
+    with tracing.start_span("pipeline", attributes={"query": query, "agents": 5}) as span:
+        results = _run_pipeline(query, analyzer or QueryAnalyzer(use_llm=True), discovery, title)
     
-    analyzer = QueryAnalyzer(use_llm=True)
-    plan = analyzer.analyze_query(query)
+    if span.context is not None:
+        tracing.get_tracer().flush()
+        trace_file = os.getenv("A2A_TRACE_FILE")
+        logger.info(
+            "pipeline.trace", trace_id=span.context.trace_id,
+            view=f"python -m src.adk.tracing {trace_file} --trace {span.context.trace_id}" if trace_file else None
+        )
+    flush_logging()
+    return results
+
+
+def _stream_stage(discovery: A2ADiscoveryClient, agent, skill: str, **params):
+    """
+    LLM 단계를 스트리밍으로 시작 (요청은 결과를 순회할 때 전송)
     
-    analyzer.print_plan(plan)
+    verbose면 조각을 받는 대로 출력합니다. 에이전트가 /rpc:stream을 지원하지 않으면 한 번에 실행한 결과를 반환합니다.
+    """
+    if not agent.supports_streaming():
+        return discovery.execute_skill(agent.url, skill, **params)
+    stream = discovery.stream_skill(agent.url, skill, **params)
+    if is_verbose():
+        stream.on_chunk = lambda chunk: print(chunk, end="", flush=True)
+    return stream
+
+
+def _stage_text(stage) -> str:
+    """단계 결과 텍스트 (스트리밍이면 남은 조각을 모두 받은 뒤)"""
+    if isinstance(stage, SkillStream):
+        text = stage.result()
+        echo()
+        return text
+    echo(stage)
+    return stage
+
+
+def _feeds_next_stage(stage, pipeline, index: int, skill_agents) -> bool:
+    """
+    이 단계의 결과 스트림을 다음 단계(save_to_file)에 그대로 넘길 수 있는지
     
-    # Step 2: 에이전트 Discovery
-    print("─" * 80)
-    print(" Step 2: 필요한 에이전트 검색")
-    print("─" * 80)
-    print()
+    다음 에이전트가 content를 조각 스트림으로 받으면 이 단계가 생성하는 동안 파일에 쓰기 시작합니다.
+    """
+    if not isinstance(stage, SkillStream) or index + 1 >= len(pipeline):
+        return False
+    next_skill = pipeline[index + 1]['skill']
+    next_agent = skill_agents.get(next_skill)
+    return next_skill == "save_to_file" and next_agent is not None and next_agent.stream_input(next_skill) == "content"
+
+
+def _connect_agents() -> Optional[A2ADiscoveryClient]:
+    """
+    에이전트 등록
     
-    discovery = A2ADiscoveryClient()
+    Returns:
+        에이전트를 등록한 A2ADiscoveryClient (하나도 연결하지 못하면 None)
+    """
+    # 디스커버리 캐시: 이전 실행에서 받은 Agent Card를 재사용하고 백그라운드에서 재확인
+    discovery = A2ADiscoveryClient(cache_path=DEFAULT_CACHE_PATH)
     
     # 에이전트 등록 (5개 버전 - Attacker Agent 포함)
-    print(" 에이전트 연결 중...")
+    echo(" 에이전트 연결 중...")
     agent_urls = [
         "http://localhost:9201",  # Research Agent
         "http://localhost:9202",  # Writer Agent
@@ -68,122 +134,168 @@ def run_dynamic_pipeline(query: str):
     registered = discovery.register_agents(agent_urls)
     
     if len(registered) == 0:
-        print(" 연결된 에이전트가 없습니다.")
-        print()
-        print("에이전트 서버를 먼저 실행하세요:")
-        print("  python start_agents_5.py")
+        logger.error("pipeline.no_agents", urls=agent_urls, hint="python start_agents_5.py")
         discovery.close()
-        return
+        return None
     
-    print(f" {len(registered)}개의 에이전트 연결됨")
-    print()
+    logger.info("pipeline.agents_registered", count=len(registered))
+    return discovery
+
+
+def _run_pipeline(query: str, analyzer: QueryAnalyzer, discovery: Optional[A2ADiscoveryClient], title: str):
+    """파이프라인 본문 (run_dynamic_pipeline 참고)"""
+    banner(" A2A 동적 파이프라인 (5 Agents)")
+    
+    # Step 1: 쿼리 분석
+    banner(" Step 1: 쿼리 분석", char="─")
+    logger.info("pipeline.start", query=query)
+    
+    plan = analyzer.analyze_query(query)
+    
+    logger.info("pipeline.plan", task_type=plan.task_type, skills=plan.required_skills)
+    if is_verbose():
+        analyzer.print_plan(plan)
+    
+    # Step 2: 에이전트 Discovery
+    banner(" Step 2: 필요한 에이전트 검색", char="─")
+    
+    # 배치 모드에서는 등록해 둔 에이전트를 공유 (닫지 않음)
+    owns_discovery = discovery is None
+    if owns_discovery:
+        discovery = _connect_agents()
+        if discovery is None:
+            return None
     
     # 필요한 스킬에 대해 최적의 에이전트 찾기 (전체 파이프라인 고려)
-    print(" 최적의 에이전트 선택 중...")
-    print()
-    skill_agents = discovery.find_optimal_agents_for_pipeline(plan.required_skills)
-    
-    # 선택 결과 출력
-    print("필요한 스킬 확인:")
-    for skill in plan.required_skills:
-        agent = skill_agents.get(skill)
-        if agent:
-            skill_count = len(agent.skills)
-            coverage = sum(1 for s in plan.required_skills if agent.has_skill(s))
-            print(f"   {skill:20s} → {agent.name} (스킬 {skill_count}개 보유, 커버리지 {coverage}/{len(plan.required_skills)})")
-        else:
-            print(f"   {skill:20s} → 에이전트를 찾을 수 없음")
-    print()
-    
-    # 선택 분석 출력
-    discovery.print_agent_selection_analysis(skill_agents)
+    echo(" 최적의 에이전트 선택 중...")
+    echo()
+    selection = discovery.plan_pipeline(plan.required_skills)
+    skill_agents = selection.agents
+    
+    # 선택 결과
+    logger.info(
+        "pipeline.agents_selected",
+        assignment={skill: agent.name for skill, agent in skill_agents.items()},
+        predicted_ms=round(selection.predicted_ms), method=selection.method
+    )
+    if is_verbose():
+        print("필요한 스킬 확인:")
+        for skill in plan.required_skills:
+            agent = skill_agents.get(skill)
+            if agent:
+                skill_count = len(agent.skills)
+                coverage = sum(1 for s in plan.required_skills if agent.has_skill(s))
+                print(f"   {skill:20s} → {agent.name} (스킬 {skill_count}개 보유, 커버리지 {coverage}/{len(plan.required_skills)})")
+            else:
+                print(f"   {skill:20s} → 에이전트를 찾을 수 없음")
+        print()
+        
+        # 선택 분석 출력
+        discovery.print_agent_selection_analysis(skill_agents)
     
     # 누락된 스킬 확인
     missing_skills = [s for s in plan.required_skills if s not in skill_agents]
     if missing_skills:
-        print(f"  경고: 다음 스킬을 제공하는 에이전트가 없습니다: {', '.join(missing_skills)}")
-        print("파이프라인을 계속 진행할 수 없습니다.")
-        discovery.close()
-        return
+        logger.error("pipeline.missing_skills", skills=missing_skills)
+        if owns_discovery:
+            discovery.close()
+        return None
     
     # Step 3: 동적 파이프라인 실행
-    print("=" * 80)
-    print(" Step 3: 파이프라인 실행")
-    print("=" * 80)
-    print()
+    banner(" Step 3: 파이프라인 실행")
     
     try:
         # 중간 결과 저장
         results = {}
+        # 다음 단계로 그대로 넘길 스트림 (결과 키, SkillStream)
+        handoff = None
         
         # 각 단계 실행
-        for step_info in plan.pipeline:
+        for index, step_info in enumerate(plan.pipeline):
             step = step_info['step']
             skill = step_info['skill']
             description = step_info['description']
             
-            print("─" * 80)
-            print(f" Step {step}: {description}")
-            print("─" * 80)
+            banner(f" Step {step}: {description}", char="─")
             
             agent = skill_agents.get(skill)
             if not agent:
-                print(f"  스킬 '{skill}'을 가진 에이전트를 찾을 수 없습니다.")
+                logger.warning("pipeline.step_skipped", step=step, skill=skill, reason="no agent")
                 continue
             
-            print(f"실행 중: {agent.name} ({agent.url})")
-            print()
+            logger.info("pipeline.step", step=step, skill=skill, agent=agent.name, url=agent.url)
             
             # 스킬별 실행 로직
+            # LLM 단계는 스트리밍으로 실행 (조각을 받는 대로 출력)
             if skill == "deep_research":
-                result = discovery.execute_skill(agent.url, skill, query=query)
-                results['research'] = result
-                print(result)
+                stage = _stream_stage(discovery, agent, skill, query=query)
+                results['research'] = _stage_text(stage)
                 
             elif skill == "write":
                 # 이전 research 결과가 있으면 사용
                 input_data = results.get('research', query)
-                result = discovery.execute_skill(agent.url, skill, bullets=input_data)
-                results['draft'] = result
-                print(result)
+                stage = _stream_stage(discovery, agent, skill, bullets=input_data)
+                if _feeds_next_stage(stage, plan.pipeline, index, skill_agents):
+                    handoff = ('draft', stage)
+                    echo("   → 생성되는 대로 다음 단계(save_to_file)로 전달")
+                else:
+                    results['draft'] = _stage_text(stage)
                 
             elif skill == "quality_review":
                 # draft가 있으면 사용, 없으면 query 사용
                 input_data = results.get('draft', query)
-                result = discovery.execute_skill(agent.url, skill, draft=input_data)
-                results['review'] = result
-                print(result)
+                stage = _stream_stage(discovery, agent, skill, draft=input_data)
+                results['review'] = _stage_text(stage)
                 
             elif skill == "revise":
                 draft = results.get('draft', query)
                 review = results.get('review', "")
-                result = discovery.execute_skill(agent.url, skill, draft=draft, review_feedback=review)
-                results['revised'] = result
-                print(result)
+                stage = _stream_stage(discovery, agent, skill, draft=draft, review_feedback=review)
+                if _feeds_next_stage(stage, plan.pipeline, index, skill_agents):
+                    handoff = ('revised', stage)
+                    echo("   → 생성되는 대로 다음 단계(save_to_file)로 전달")
+                else:
+                    results['revised'] = _stage_text(stage)
                 
             elif skill == "save_to_file":
-                # 최종 콘텐츠 저장
-                content = results.get('revised') or results.get('draft') or query
-                
-                # Markdown 저장
-                print("   Markdown 파일 저장 중...")
-                result_md = discovery.execute_skill(
-                    agent.url, skill,
-                    content=content,
-                    title="a2a_5agents_report",
-                    format="markdown"
-                )
-                print(f"   {result_md['filename']} ({result_md['size_bytes']} bytes)")
+                # Markdown 저장 (앞 단계의 스트림을 받으면 생성되는 동안 파일에 쓰기 시작)
+                echo("   Markdown 파일 저장 중...")
+                if handoff is not None:
+                    key, stage = handoff
+                    handoff = None
+                    try:
+                        result_md = discovery.stream_skill(
+                            agent.url, skill,
+                            input_stream=stage,
+                            title=title,
+                            format="markdown"
+                        ).result()
+                        # 앞 단계가 오류로 끝났으면 여기서 예외 (reporter는 쓰다 만 파일을 지움, file_saved를 남기지 않음)
+                        results[key] = _stage_text(stage)
+                    except Exception:
+                        stage.close()
+                        raise
+                    content = results[key]
+                else:
+                    # 최종 콘텐츠 저장
+                    content = results.get('revised') or results.get('draft') or query
+                    result_md = discovery.execute_skill(
+                        agent.url, skill,
+                        content=content,
+                        title=title,
+                        format="markdown"
+                    )
+                logger.info("pipeline.file_saved", filename=result_md['filename'], size_bytes=result_md['size_bytes'])
                 
                 # HTML 저장
-                print("  HTML 파일 저장 중...")
+                echo("   HTML 파일 저장 중...")
                 result_html = discovery.execute_skill(
                     agent.url, skill,
                     content=content,
-                    title="a2a_5agents_report",
+                    title=title,
                     format="html"
                 )
-                print(f"   {result_html['filename']}")
+                logger.info("pipeline.file_saved", filename=result_html['filename'])
                 results['saved_files'] = [result_md['filename'], result_html['filename']]
                 
             elif skill == "send_email":
@@ -192,10 +304,9 @@ def run_dynamic_pipeline(query: str):
                 recipient = os.getenv("REPORT_RECIPIENT_EMAIL")
                 
                 if not recipient:
-                    print("    수신자 이메일이 설정되지 않았습니다.")
-                    print("     환경변수 REPORT_RECIPIENT_EMAIL을 설정하세요.")
+                    logger.warning("pipeline.email_skipped", reason="REPORT_RECIPIENT_EMAIL is not set")
                 else:
-                    print(f"   이메일 전송 중... → {recipient}")
+                    logger.info("pipeline.email_sending", to=recipient)
                     
                     # zip 파일 첨부 설정 (선택사항)
                     attachment_file = None
@@ -209,9 +320,9 @@ def run_dynamic_pipeline(query: str):
                     if zip_file_path and os.path.exists(zip_file_path):
                         attachment_file = zip_file_path
                     
-                    # 첨부파일이 있으면 출력
+                    # 첨부파일이 있으면 기록
                     if attachment_file:
-                        print(f" 첨부파일: {os.path.basename(attachment_file)}")
+                        logger.info("pipeline.email_attachment", file=os.path.basename(attachment_file))
                     
                     # 이메일 전송 (첨부파일 포함 가능)
                     email_params = {
@@ -230,51 +341,114 @@ def run_dynamic_pipeline(query: str):
                     )
                     
                     if email_result.get("status") == "success":
-                        print(f"   이메일 전송 완료!")
-                        if email_result.get('attachment'):
-                            print(f"     첨부파일: {email_result.get('attachment')}")
+                        logger.info("pipeline.email_sent", to=recipient, attachment=email_result.get('attachment'))
                         results['email_sent'] = True
                     else:
-                        print(f"   이메일 전송 실패: {email_result.get('message')}")
+                        logger.error("pipeline.email_failed", to=recipient, message=email_result.get('message'))
             
-            print()
+            echo()
         
         # 완료
-        print(f"작업 유형: {plan.task_type}")
-        print(f"실행된 단계: {len(plan.pipeline)}개")
-        print(f"사용된 에이전트: {len(skill_agents)}개")
-        
-        if 'saved_files' in results:
-            print()
-            print("생성된 파일:")
-            for filename in results['saved_files']:
-                print(f"  • {filename}")
+        banner(" 파이프라인 완료")
+        logger.info(
+            "pipeline.completed", task_type=plan.task_type, steps=len(plan.pipeline),
+            agents=len(set(a.url for a in skill_agents.values())),
+            files=results.get('saved_files'), email_sent=bool(results.get('email_sent'))
+        )
         
-        if results.get('email_sent'):
-            print()
-            print(" 이메일 전송 완료")
-        
-        print()
+        return results
     
     except Exception as e:
+        logger.exception("pipeline.failed", error=str(e))
+        return None
+    
+    finally:
+        if owns_discovery:
+            discovery.close()
+
+
+def print_results(results):
+    """최종 결과 출력 (verbose가 아니면 단계별 중간 결과 대신 마지막 결과만)"""
+    if not results:
+        return
+    final = results.get('revised') or results.get('draft') or results.get('review') or results.get('research')
+    if final and not is_verbose():
+        print(final)
         print()
-        print(" 오류 발생:")
-        print(f"   {str(e)}")
+    
+    if 'saved_files' in results:
+        print("생성된 파일:")
+        for filename in results['saved_files']:
+            print(f"  • {filename}")
         print()
-        import traceback
-        traceback.print_exc()
+
+
+def run_batch(source, output, concurrency: int = batch.DEFAULT_CONCURRENCY):
+    """
+    배치 모드: JSONL 쿼리를 동시에 실행하고 결과를 JSONL로 기록
+    
+    QueryAnalyzer와 에이전트 등록(Agent Card, 지연 통계)을 모든 쿼리가 공유합니다.
+    동시에 실행되는 쿼리가 같은 초에 저장해도 덮어쓰지 않도록 파일 이름에 입력 줄 번호를 붙입니다.
     
+    Args:
+        source: JSONL 입력 (파일 객체 또는 sys.stdin)
+        output: 결과를 기록할 텍스트 스트림
+        concurrency: 동시에 실행할 최대 쿼리 수
+    
+    Returns:
+        {"queries", "completed", "failed", "elapsed_s"} (에이전트가 없으면 None)
+    """
+    analyzer = QueryAnalyzer(use_llm=True)
+    discovery = _connect_agents()
+    if discovery is None:
+        return None
+    
+    def run(item: batch.BatchItem):
+        return run_dynamic_pipeline(item.query, analyzer, discovery, title=f"{REPORT_TITLE}_{item.line}")
+    
+    try:
+        return batch.run_batch(source, run, output, concurrency)
     finally:
         discovery.close()
+        flush_logging()
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
+    parser = argparse.ArgumentParser(description="A2A 동적 파이프라인 (5 Agents)")
+    parser.add_argument("query", nargs="*", help="쿼리 (없으면 기본 쿼리)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="단계별 배너와 중간 결과 출력")
+    parser.add_argument("--batch", metavar="PATH", help="JSONL 쿼리 파일로 배치 실행 ('-'이면 stdin)")
+    parser.add_argument("--concurrency", type=int, default=batch.DEFAULT_CONCURRENCY,
+                        help="배치 모드에서 동시에 실행할 최대 쿼리 수")
+    parser.add_argument("--output", metavar="PATH", help="배치 결과 JSONL 파일 (기본: stdout)")
+    args = parser.parse_args()
+    
+    if args.batch:
+        if args.query:
+            parser.error("--batch와 쿼리 인자는 함께 쓸 수 없습니다")
+        if args.verbose:
+            parser.error("--verbose는 단일 쿼리에서만 쓸 수 있습니다 (배치 결과가 stdout에 섞임)")
+        if args.concurrency < 1:
+            parser.error("--concurrency는 1 이상이어야 합니다")
+        
+        source = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+        output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            summary = run_batch(source, output, args.concurrency)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if output is not sys.stdout:
+                output.close()
+        sys.exit(0 if summary is not None and summary["failed"] == 0 else 1)
+    
+    if args.verbose:
+        configure_logging(verbose=True)
+    
+    if args.query:
         # 커맨드 라인 쿼리
-        query = " ".join(sys.argv[1:])
-        run_dynamic_pipeline(query)
+        query = " ".join(args.query)
     else:
         # 명령어에 암것도 안썼을 때때
-        default_query = "AI 에이전트 간 협업의 미래에 대해 분석해줘"
-        run_dynamic_pipeline(default_query)
-
+        query = "AI 에이전트 간 협업의 미래에 대해 분석해줘"
+    print_results(run_dynamic_pipeline(query))
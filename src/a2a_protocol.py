@@ -5,7 +5,18 @@ Based on: https://a2a-protocol.org/
 from typing import Optional, Dict, Any, List, Literal
 from pydantic import BaseModel, Field
 from datetime import datetime
-import uuid
+import os
+
+
+def new_id() -> str:
+    """
+    무작위 UUID4 문자열 생성
+    
+    str(uuid.uuid4())와 같은 형식/무작위성(os.urandom)이지만 uuid.UUID 객체를 거치지 않아
+    2배 이상 빠릅니다. Task/Artifact/JSON-RPC 요청마다 호출되므로 기본 ID 생성기로 사용합니다.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
 
 
 # ============================================
@@ -17,7 +28,7 @@ class JsonRpcRequest(BaseModel):
     jsonrpc: str = "2.0"
     method: str
     params: Optional[Dict[str, Any]] = None
-    id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: Optional[str] = Field(default_factory=new_id)
 
 
 class JsonRpcResponse(BaseModel):
@@ -71,7 +82,10 @@ class AgentCard(BaseModel):
 # A2A Task & Message
 # ============================================
 
-TaskStatus = Literal["submitted", "working", "input-needed", "completed", "failed"]
+TaskStatus = Literal["submitted", "working", "input-needed", "completed", "failed", "canceled"]
+
+# 더 이상 상태가 바뀌지 않는 Task 상태
+TERMINAL_TASK_STATUSES = ("completed", "failed", "canceled")
 
 
 class TaskInput(BaseModel):
@@ -88,10 +102,11 @@ class TaskOutput(BaseModel):
 
 class Task(BaseModel):
     """A2A Task"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     status: TaskStatus = "submitted"
     input: TaskInput
     output: Optional[TaskOutput] = None
+    # 타임스탬프는 생성 시 바로 기록 (지연 생성은 Optional 타입이 되어야 하지만 이득은 2% 내외, bench_protocol 참고)
     createdAt: datetime = Field(default_factory=datetime.utcnow)
     updatedAt: datetime = Field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -106,7 +121,7 @@ class Message(BaseModel):
 
 class Artifact(BaseModel):
     """A2A Artifact"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     type: str  # "text", "json", "image", etc.
     content: Any
     metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -116,10 +131,17 @@ class Artifact(BaseModel):
 # A2A API Requests/Responses
 # ============================================
 
+class PushNotificationConfig(BaseModel):
+    """Task 완료 시 이벤트를 받을 webhook"""
+    url: str
+    token: Optional[str] = None
+
+
 class CreateTaskRequest(BaseModel):
     """Task 생성 요청"""
     input: TaskInput
     metadata: Optional[Dict[str, Any]] = None
+    pushNotification: Optional[PushNotificationConfig] = None
 
 
 class CreateTaskResponse(BaseModel):
@@ -133,6 +155,28 @@ class GetTaskStatusResponse(BaseModel):
     task: Task
 
 
+class CreateTasksRequest(BaseModel):
+    """Task 일괄 생성 요청 (POST /tasks:batch)"""
+    tasks: List[CreateTaskRequest]
+
+
+class CreateTasksResponse(BaseModel):
+    """Task 일괄 생성 응답 (요청 순서와 같음)"""
+    tasks: List[CreateTaskResponse]
+
+
+class GetTasksStatusRequest(BaseModel):
+    """Task 일괄 상태 조회 요청 (POST /tasks:status)"""
+    taskIds: List[str]
+    fields: Optional[str] = None
+
+
+class GetTasksStatusResponse(BaseModel):
+    """Task 일괄 상태 조회 응답"""
+    tasks: List[Dict[str, Any]]
+    missing: List[str] = Field(default_factory=list)
+
+
 class SubmitMessageRequest(BaseModel):
     """Message 제출 요청"""
     taskId: str
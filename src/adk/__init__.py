@@ -3,11 +3,43 @@ A2A Agent Development Kit (ADK)
 간편한 에이전트 개발을 위한 프레임워크
 """
 
-from .agent import A2AAgent, agent_skill
-from .server import A2AServer
-from .client import A2AClient
-from .discovery import A2ADiscoveryClient, AgentInfo
-from .query_analyzer import QueryAnalyzer, TaskPlan
+from importlib import import_module
+
+# 공개 이름 → 정의된 서브모듈
+# 패키지를 import할 때 서버(FastAPI)까지 모두 읽지 않도록 처음 접근할 때 import합니다.
+# (src.llm_gemini처럼 cancellation/metrics만 필요한 모듈이 서버 의존성을 끌어오지 않음)
+_EXPORTS = {
+    'A2AAgent': 'agent',
+    'agent_skill': 'agent',
+    'A2AServer': 'server',
+    'A2AClient': 'client',
+    'A2ADiscoveryClient': 'discovery',
+    'AgentInfo': 'discovery',
+    'A2ATransport': 'transport',
+    'HttpTransport': 'transport',
+    'UnixSocketTransport': 'transport',
+    'InProcessTransport': 'transport',
+    'PushReceiver': 'push',
+    'TaskCancelledError': 'cancellation',
+    'check_cancelled': 'cancellation',
+    'QueryAnalyzer': 'query_analyzer',
+    'TaskPlan': 'query_analyzer',
+}
+
+
+def __getattr__(name):
+    """공개 이름을 처음 접근할 때 해당 서브모듈에서 가져옴 (PEP 562)"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     'A2AAgent',
@@ -16,6 +48,13 @@ __all__ = [
     'A2AClient',
     'A2ADiscoveryClient',
     'AgentInfo',
+    'A2ATransport',
+    'HttpTransport',
+    'UnixSocketTransport',
+    'InProcessTransport',
+    'PushReceiver',
+    'TaskCancelledError',
+    'check_cancelled',
     'QueryAnalyzer',
     'TaskPlan',
 ]
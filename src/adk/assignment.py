@@ -0,0 +1,240 @@
+"""
+A2A Agent Development Kit - Pipeline Assignment
+파이프라인 단계마다 어떤 에이전트에 맡길지 전체 단계를 한꺼번에 고려하여 결정
+
+    예상 지연 = Σ 단계 실행 시간(에이전트, 스킬)
+              + Σ 결과 전달 비용 (단계 입력을 만든 에이전트와 실행 에이전트가 다르면 hop_cost)
+
+단계 실행 시간은 호출자가 관측값/부하로 미리 계산해 넘기고, 여기서는 배정만 풉니다.
+    exact       후보 조합 수가 EXACT_LIMIT 이하 → 분기 한정(branch and bound)으로 최적해
+    heuristic   그보다 크면 인접 단계 DP(Viterbi) + 단계별 좌표 하강으로 초기해를 만들고,
+                단계마다 유망한 후보(실행 시간 상위, 여러 단계를 함께 맡을 수 있는 에이전트)만 남겨
+                분기 한정으로 다시 풂
+
+같은 비용이면 후보 목록 앞쪽(호출자가 정한 선호 순서)을 고릅니다.
+"""
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Hashable, List, Sequence
+
+
+# 이 이하의 조합 수면 정확한 해를 구함 (5단계 x 후보 8개 = 32768)
+EXACT_LIMIT = 50_000
+# 좌표 하강 최대 반복 횟수
+MAX_ROUNDS = 10
+
+
+@dataclass
+class Assignment:
+    """단계별 배정 결과"""
+    choice: List[int]  # 단계별 선택한 후보 인덱스
+    cost: float  # 예상 지연 (ms)
+    method: str  # "exact" 또는 "heuristic"
+
+
+def _hop(a: Hashable, b: Hashable, hop_cost: float) -> float:
+    return 0.0 if a == b else hop_cost
+
+
+def total_cost(choice: Sequence[int], agents: Sequence[Sequence[Hashable]],
+               service: Sequence[Sequence[float]], inputs: Sequence[Sequence[int]],
+               hop_cost: float) -> float:
+    """배정 하나의 예상 지연"""
+    cost = 0.0
+    for step, index in enumerate(choice):
+        cost += service[step][index]
+        agent = agents[step][index]
+        for source in inputs[step]:
+            cost += _hop(agents[source][choice[source]], agent, hop_cost)
+    return cost
+
+
+def _viterbi(agents: Sequence[Sequence[Hashable]], service: Sequence[Sequence[float]],
+             hop_cost: float) -> List[int]:
+    """
+    바로 앞 단계에서만 입력을 받는다고 보고 푼 배정 (단계당 O(후보 수))
+    
+    전달 비용이 "같은 에이전트면 0, 아니면 hop_cost"이므로
+    각 후보의 최선 직전 상태는 (같은 에이전트, 직전 단계 전체 최솟값 + hop_cost) 둘 중 하나입니다.
+    """
+    best = list(service[0])
+    back: List[List[int]] = [[-1] * len(service[0])]
+    for step in range(1, len(service)):
+        prev_agents = agents[step - 1]
+        prev_index = {agent: i for i, agent in reversed(list(enumerate(prev_agents)))}
+        min_i = min(range(len(best)), key=best.__getitem__)
+        current, pointers = [], []
+        for agent, cost in zip(agents[step], service[step]):
+            source, incoming = min_i, best[min_i] + hop_cost
+            same = prev_index.get(agent)
+            if same is not None and best[same] <= incoming:
+                source, incoming = same, best[same]
+            current.append(incoming + cost)
+            pointers.append(source)
+        best = current
+        back.append(pointers)
+    
+    choice = [min(range(len(best)), key=best.__getitem__)]
+    for step in range(len(service) - 1, 0, -1):
+        choice.append(back[step][choice[-1]])
+    choice.reverse()
+    return choice
+
+
+def _local_search(choice: List[int], agents: Sequence[Sequence[Hashable]],
+                  service: Sequence[Sequence[float]], inputs: Sequence[Sequence[int]],
+                  hop_cost: float) -> List[int]:
+    """다른 단계를 고정하고 한 단계씩 더 나은 후보로 바꾸기 (개선이 없을 때까지)"""
+    consumers: List[List[int]] = [[] for _ in service]
+    for step, sources in enumerate(inputs):
+        for source in sources:
+            consumers[source].append(step)
+    
+    def step_cost(step: int, index: int) -> float:
+        agent = agents[step][index]
+        cost = service[step][index]
+        for source in inputs[step]:
+            cost += _hop(agents[source][choice[source]], agent, hop_cost)
+        for consumer in consumers[step]:
+            cost += _hop(agent, agents[consumer][choice[consumer]], hop_cost)
+        return cost
+    
+    for _ in range(MAX_ROUNDS):
+        improved = False
+        for step in range(len(service)):
+            current = step_cost(step, choice[step])
+            for index in range(len(service[step])):
+                cost = step_cost(step, index)
+                if cost < current - 1e-9:
+                    choice[step], current, improved = index, cost, True
+        if not improved:
+            break
+    return choice
+
+
+def _branch_and_bound(incumbent: List[int], agents: Sequence[Sequence[Hashable]],
+                      service: Sequence[Sequence[float]], inputs: Sequence[Sequence[int]],
+                      hop_cost: float) -> List[int]:
+    """모든 조합을 탐색하되, 남은 단계의 최소 실행 시간을 더해도 현재 최선보다 나쁘면 가지치기"""
+    steps = len(service)
+    # 남은 단계들의 실행 시간 하한 (전달 비용은 0으로 가정)
+    remaining = [0.0] * (steps + 1)
+    for step in range(steps - 1, -1, -1):
+        remaining[step] = remaining[step + 1] + min(service[step])
+    # 실행 시간이 짧은 후보부터 (같으면 선호 순서) 탐색하여 좋은 해를 먼저 찾음
+    order = [sorted(range(len(s)), key=s.__getitem__) for s in service]
+    
+    best_choice = list(incumbent)
+    best_cost = total_cost(incumbent, agents, service, inputs, hop_cost)
+    choice = [0] * steps
+    
+    def search(step: int, cost: float):
+        nonlocal best_choice, best_cost
+        if step == steps:
+            if cost < best_cost - 1e-9:
+                best_choice, best_cost = list(choice), cost
+            return
+        for index in order[step]:
+            step_cost = service[step][index]
+            if cost + step_cost + remaining[step + 1] >= best_cost - 1e-9:
+                break  # 이후 후보는 실행 시간이 더 길거나 같으므로 모두 가지치기
+            agent = agents[step][index]
+            for source in inputs[step]:
+                step_cost += _hop(agents[source][choice[source]], agent, hop_cost)
+            if cost + step_cost + remaining[step + 1] >= best_cost - 1e-9:
+                continue
+            choice[step] = index
+            search(step + 1, cost + step_cost)
+    
+    search(0, 0.0)
+    return best_choice
+
+
+def _prune(incumbent: List[int], agents: Sequence[Sequence[Hashable]],
+           service: Sequence[Sequence[float]], exact_limit: int) -> List[List[int]]:
+    """
+    단계별로 남길 후보 인덱스 (조합 수가 exact_limit 이하가 되도록)
+    
+    실행 시간이 짧은 후보와, 여러 단계의 후보에 함께 들어 있어 전달 비용을 줄일 수 있는 에이전트를
+    절반씩 남기고 현재 해의 후보는 항상 포함합니다.
+    """
+    steps = len(service)
+    per_step = max(int(exact_limit ** (1.0 / steps)), 2)
+    
+    # 에이전트별 (맡을 수 있는 단계 수, 그 단계들의 실행 시간 합)
+    shared: dict = {}
+    for step in range(steps):
+        for agent, cost in zip(agents[step], service[step]):
+            count, total = shared.get(agent, (0, 0.0))
+            shared[agent] = (count + 1, total + cost)
+    
+    keep = []
+    for step in range(steps):
+        indices = range(len(service[step]))
+        fastest = sorted(indices, key=service[step].__getitem__)
+        consolidating = sorted(
+            (i for i in indices if shared[agents[step][i]][0] > 1),
+            key=lambda i: (-shared[agents[step][i]][0], shared[agents[step][i]][1])
+        )
+        chosen = [incumbent[step]]
+        for i in itertools.chain(*itertools.zip_longest(fastest, consolidating)):
+            if len(chosen) >= per_step:
+                break
+            if i is not None and i not in chosen:
+                chosen.append(i)
+        keep.append(sorted(chosen))
+    return keep
+
+
+def _solve_pruned(incumbent: List[int], agents: Sequence[Sequence[Hashable]],
+                  service: Sequence[Sequence[float]], inputs: Sequence[Sequence[int]],
+                  hop_cost: float, exact_limit: int) -> List[int]:
+    """유망한 후보만 남긴 부분 문제를 분기 한정으로 풀어 원래 인덱스로 반환"""
+    keep = _prune(incumbent, agents, service, exact_limit)
+    sub_agents = [[agents[step][i] for i in indices] for step, indices in enumerate(keep)]
+    sub_service = [[service[step][i] for i in indices] for step, indices in enumerate(keep)]
+    sub_incumbent = [indices.index(incumbent[step]) for step, indices in enumerate(keep)]
+    sub_choice = _branch_and_bound(sub_incumbent, sub_agents, sub_service, inputs, hop_cost)
+    return [keep[step][i] for step, i in enumerate(sub_choice)]
+
+
+def solve(agents: Sequence[Sequence[Hashable]], service: Sequence[Sequence[float]],
+          inputs: Sequence[Sequence[int]], hop_cost: float,
+          exact_limit: int = EXACT_LIMIT) -> Assignment:
+    """
+    예상 지연이 가장 작은 배정 찾기
+    
+    Args:
+        agents: 단계별 후보 에이전트 식별자 (선호 순서, 같은 식별자면 같은 에이전트)
+        service: 단계별 후보의 예상 실행 시간 (ms, agents와 같은 모양)
+        inputs: 단계별로 입력을 받는 이전 단계 인덱스
+        hop_cost: 다른 에이전트로 결과를 넘기는 비용 (ms)
+        exact_limit: 이 이하의 조합 수면 정확한 해
+    
+    Returns:
+        Assignment (단계가 없으면 빈 배정)
+    
+    Raises:
+        ValueError: 후보가 없는 단계가 있거나 입력이 이후 단계를 가리킴
+    """
+    if not service:
+        return Assignment(choice=[], cost=0.0, method="exact")
+    for step, (candidates, sources) in enumerate(zip(service, inputs)):
+        if not candidates:
+            raise ValueError(f"Step {step} has no candidate agents")
+        if any(not 0 <= source < step for source in sources):
+            raise ValueError(f"Step {step} has an input from a later step: {list(sources)}")
+    
+    choice = _local_search(_viterbi(agents, service, hop_cost), agents, service, inputs, hop_cost)
+    if math.prod(len(candidates) for candidates in service) <= exact_limit:
+        choice = _branch_and_bound(choice, agents, service, inputs, hop_cost)
+        method = "exact"
+    else:
+        choice = _solve_pruned(choice, agents, service, inputs, hop_cost, exact_limit)
+        choice = _local_search(choice, agents, service, inputs, hop_cost)
+        method = "heuristic"
+    return Assignment(choice=choice, cost=total_cost(choice, agents, service, inputs, hop_cost), method=method)
+
+
+__all__ = ['Assignment', 'solve', 'total_cost', 'EXACT_LIMIT']
@@ -0,0 +1,150 @@
+"""
+A2A Agent Development Kit - Batch Runner
+JSONL로 받은 쿼리 여러 개를 제한된 동시성으로 실행하고 결과를 JSONL로 기록
+
+입력 (한 줄에 쿼리 하나, 빈 줄 무시):
+    {"id": "topic-001", "query": "양자컴퓨팅의 현재와 미래"}
+    "AI 에이전트 협업의 미래"          문자열만 쓰면 id는 줄 번호
+출력 (끝나는 순서대로 한 줄씩):
+    {"id": "topic-001", "line": 1, "query": "...", "status": "completed", "elapsed_ms": 8421.3, "result": {...}}
+    {"id": 2, "line": 2, "query": "...", "status": "failed", "elapsed_ms": 512.0, "error": "..."}
+
+입력은 읽는 대로 실행하므로 stdin으로 받는 쿼리도 입력이 끝나기 전에 시작합니다.
+해석할 수 없는 줄은 실행하지 않고 failed로 기록한 뒤 다음 줄로 넘어갑니다.
+
+    with open("topics.jsonl", encoding="utf-8") as source:
+        summary = run_batch(source, lambda item: run_dynamic_pipeline(item.query), sys.stdout, concurrency=8)
+"""
+import json
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Set, TextIO, Tuple
+
+from .log import get_logger
+
+
+logger = get_logger("a2a.batch")
+
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class BatchItem:
+    """배치 입력의 쿼리 하나"""
+    line: int  # 입력 줄 번호 (1부터)
+    query: str
+    id: Any  # 입력의 id (없으면 줄 번호)
+
+
+def parse_query(line: str, line_no: int) -> BatchItem:
+    """
+    JSONL 한 줄 → BatchItem
+    
+    Args:
+        line: JSON 문자열 또는 {"query": ..., "id": ...} 객체
+        line_no: 줄 번호
+    
+    Raises:
+        ValueError: JSON이 아니거나 query가 없을 때
+    """
+    record = json.loads(line)
+    if isinstance(record, str):
+        record = {"query": record}
+    if not isinstance(record, dict) or not isinstance(record.get("query"), str) or not record["query"].strip():
+        raise ValueError('expected a JSON string or an object with a non-empty "query"')
+    return BatchItem(line=line_no, query=record["query"], id=record.get("id", line_no))
+
+
+def run_batch(lines: Iterable[str], run: Callable[[BatchItem], Optional[Dict[str, Any]]], output: TextIO,
+              concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, Any]:
+    """
+    쿼리를 최대 concurrency개씩 동시에 실행하고 끝나는 대로 output에 기록
+    
+    실행 중인 쿼리가 concurrency개면 하나가 끝날 때까지 다음 줄을 읽지 않습니다.
+    
+    Args:
+        lines: JSONL 입력 (파일 객체, sys.stdin 등)
+        run: 쿼리 하나를 실행하는 함수 (결과 딕셔너리, 실패하면 None 또는 예외)
+        output: 결과를 기록할 텍스트 스트림
+        concurrency: 동시에 실행할 최대 쿼리 수
+    
+    Returns:
+        {"queries", "completed", "failed", "elapsed_s"}
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    
+    summary = {"queries": 0, "completed": 0, "failed": 0}
+    start = time.perf_counter()
+    pending: Set[Future] = set()
+    executor = ThreadPoolExecutor(concurrency, thread_name_prefix="a2a-batch")
+    
+    def write(record: Dict[str, Any]):
+        summary["queries"] += 1
+        summary[record["status"]] += 1
+        output.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        output.flush()
+        logger.info("batch.item", id=record["id"], status=record["status"], elapsed_ms=record["elapsed_ms"],
+                    done=summary["queries"])
+    
+    def drain(return_when: str):
+        nonlocal pending
+        done, pending = wait(pending, return_when=return_when)
+        for future in done:
+            write(future.result())
+    
+    try:
+        for line_no, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                item = parse_query(line, line_no)
+            except ValueError as e:
+                write({"id": line_no, "line": line_no, "query": None, "status": "failed",
+                       "elapsed_ms": 0.0, "error": f"invalid input: {e}"})
+                continue
+            if len(pending) >= concurrency:
+                drain(FIRST_COMPLETED)
+            pending.add(executor.submit(_run_item, run, item))
+        drain(ALL_COMPLETED)
+    finally:
+        # 중단되면 (Ctrl+C 등) 실행 중인 쿼리만 마치고 종료
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    summary["elapsed_s"] = round(time.perf_counter() - start, 3)
+    logger.info("batch.completed", **summary)
+    return summary
+
+
+def _run_item(run: Callable[[BatchItem], Optional[Dict[str, Any]]], item: BatchItem) -> Dict[str, Any]:
+    """쿼리 하나 실행 → 출력 레코드 (예외도 레코드로)"""
+    start = time.perf_counter()
+    result, error = _call(run, item)
+    record = {
+        "id": item.id,
+        "line": item.line,
+        "query": item.query,
+        "status": "failed" if error else "completed",
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    if error:
+        record["error"] = error
+    else:
+        record["result"] = result
+    return record
+
+
+def _call(run: Callable[[BatchItem], Optional[Dict[str, Any]]], item: BatchItem) -> Tuple[Any, Optional[str]]:
+    """(결과, 오류 메시지)"""
+    try:
+        result = run(item)
+    except Exception as e:
+        logger.warning("batch.item_failed", id=item.id, error=f"{type(e).__name__}: {e}")
+        return None, f"{type(e).__name__}: {e}"
+    if result is None:
+        return None, "pipeline failed (see log)"
+    return result, None
+
+
+__all__ = ['BatchItem', 'DEFAULT_CONCURRENCY', 'parse_query', 'run_batch']
@@ -0,0 +1,191 @@
+"""
+A2A Agent Development Kit - Cancellation & Deadlines
+Task 취소와 호출 deadline을 스킬 코드까지 전달
+
+서버는 스킬을 실행할 때마다 CancelToken을 만들어 현재 context에 넣습니다.
+asyncio.to_thread는 context를 복사하므로 워커 스레드에서 실행되는 스킬에서도 보입니다.
+스킬과 LLM 호출은 비싼 작업 전에 check_cancelled()를 호출하여 협력적으로 중단합니다.
+
+    from src.adk.cancellation import check_cancelled, remaining_time
+    
+    check_cancelled()             # 취소됐거나 deadline이 지났으면 TaskCancelledError
+    timeout = remaining_time()    # 남은 시간 (초, deadline이 없으면 None)
+
+클라이언트는 남은 시간을 DEADLINE_HEADER로 보냅니다 (상대 시간이므로 시계 차이와 무관).
+문자열 id와 Idempotency-Key를 보낸 /rpc 호출은 실행 중에 RPC_CANCEL_METHOD로 취소할 수 있습니다.
+취소 요청에는 원래 호출과 같은 Idempotency-Key를 붙입니다 (id만 알아서는 다른 호출자의 요청을 취소할 수 없음).
+
+    Idempotency-Key: <원래 호출의 키>
+    {"jsonrpc": "2.0", "method": "rpc.cancel", "params": {"id": "<취소할 요청 id>"}, "id": null}
+"""
+import contextvars
+import threading
+import time
+from typing import Optional
+
+
+# 호출자가 기다릴 수 있는 남은 시간 (초)
+DEADLINE_HEADER = "X-A2A-Timeout"
+# 실행 중인 JSON-RPC 호출 취소 (JSON-RPC 2.0에서 "rpc."은 확장용 예약 접두사)
+RPC_CANCEL_METHOD = "rpc.cancel"
+
+
+class TaskCancelledError(Exception):
+    """Task가 취소되었거나 deadline이 지나 실행을 중단할 때 발생"""
+    pass
+
+
+class CancelToken:
+    """
+    하나의 스킬 실행에 대한 취소 상태
+    
+    cancel()로 명시적으로 취소하거나, deadline(time.monotonic() 기준)이 지나면 취소된 것으로 봅니다.
+    요청마다 만들어지므로 생성 비용을 줄이기 위해 threading.Event는 sleep()에서 필요할 때만 만듭니다.
+    """
+    
+    __slots__ = ("deadline", "reason", "_cancelled", "_event")
+    
+    _event_lock = threading.Lock()
+    
+    def __init__(self, deadline: Optional[float] = None):
+        """
+        Args:
+            deadline: 실행 마감 시각 (time.monotonic() 기준, None이면 없음)
+        """
+        self.deadline = deadline
+        self.reason: Optional[str] = None
+        self._cancelled = False
+        self._event: Optional[threading.Event] = None
+    
+    def cancel(self, reason: str = "Task canceled"):
+        """취소 (처음 사유만 유지)"""
+        if self.reason is None:
+            self.reason = reason
+        self._cancelled = True
+        event = self._event
+        if event is not None:
+            event.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """취소되었거나 deadline이 지났는지 여부"""
+        if self._cancelled:
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel("Deadline exceeded")
+            return True
+        return False
+    
+    def remaining(self) -> Optional[float]:
+        """deadline까지 남은 시간 (초, deadline이 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def raise_if_cancelled(self):
+        """
+        Raises:
+            TaskCancelledError: 취소되었거나 deadline이 지났을 때
+        """
+        if self.cancelled:
+            raise TaskCancelledError(self.reason)
+    
+    def sleep(self, seconds: float) -> bool:
+        """
+        취소되면 바로 깨어나는 sleep
+        
+        Returns:
+            취소되었으면 True
+        """
+        if self._event is None:
+            with self._event_lock:
+                if self._event is None:
+                    self._event = threading.Event()
+        # 이벤트를 만들기 전에 취소되었을 수 있으므로 대기 전에 다시 확인
+        if self.cancelled:
+            return True
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._event.wait(seconds)
+        return self.cancelled
+
+
+_current_token: contextvars.ContextVar[Optional[CancelToken]] = contextvars.ContextVar(
+    "a2a_cancel_token", default=None
+)
+
+
+class use_token:
+    """
+    블록 안에서 실행되는 코드에 token을 현재 취소 토큰으로 노출
+    
+        with use_token(token):
+            agent.execute_skill(...)
+    """
+    
+    __slots__ = ("token", "_reset")
+    
+    def __init__(self, token: CancelToken):
+        self.token = token
+    
+    def __enter__(self) -> CancelToken:
+        self._reset = _current_token.set(self.token)
+        return self.token
+    
+    def __exit__(self, *args):
+        _current_token.reset(self._reset)
+
+
+def current_token() -> Optional[CancelToken]:
+    """현재 실행 중인 스킬의 취소 토큰 (서버 밖에서 호출되면 None)"""
+    return _current_token.get()
+
+
+def check_cancelled():
+    """
+    현재 스킬이 취소되었으면 중단
+    
+    Raises:
+        TaskCancelledError: 취소되었거나 deadline이 지났을 때
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def remaining_time() -> Optional[float]:
+    """현재 스킬의 deadline까지 남은 시간 (초, 없으면 None)"""
+    token = _current_token.get()
+    return token.remaining() if token is not None else None
+
+
+def deadline_from_header(value: Optional[str]) -> Optional[float]:
+    """
+    DEADLINE_HEADER 값(남은 초)을 time.monotonic() 기준 마감 시각으로 변환
+    
+    Returns:
+        마감 시각 (헤더가 없거나 잘못되었으면 None)
+    """
+    if not value:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+    if timeout != timeout or timeout < 0:  # NaN / 음수
+        return None
+    return time.monotonic() + timeout
+
+
+__all__ = [
+    'CancelToken',
+    'TaskCancelledError',
+    'use_token',
+    'current_token',
+    'check_cancelled',
+    'remaining_time',
+    'deadline_from_header',
+    'DEADLINE_HEADER',
+    'RPC_CANCEL_METHOD',
+]
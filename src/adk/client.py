@@ -2,8 +2,15 @@
 A2A Agent Development Kit - Simple HTTP Client
 단일 에이전트와 통신하는 간단한 클라이언트
 """
-import httpx
-from typing import Dict, Any, Optional, List
+import time
+import uuid
+from typing import Dict, Any, Iterable, Optional, List
+
+from ..a2a_protocol import TERMINAL_TASK_STATUSES
+from . import tracing
+from .retry import RetryPolicy
+from .streaming import SkillStream, traced
+from .transport import A2ATransport, transport_for_url
 
 
 class A2AClient:
@@ -22,24 +29,44 @@ class A2AClient:
             
             # 스킬 실행 (JSON-RPC)
             result = client.execute_skill("research", query="AI")
+            
+            # 스트리밍 실행 (조각을 만들어지는 대로)
+            for chunk in client.stream_skill("write", bullets="..."):
+                print(chunk, end="")
+        
+        # 같은 호스트 / 같은 프로세스의 에이전트
+        A2AClient("unix:///tmp/writer.sock")
+        A2AClient(server.local_url)  # inproc://agent_id
+        
+        # 재시도 정책 (기본: 일시적 오류에 최대 3번 시도, 재시도하지 않으려면 retry.NO_RETRY)
+        A2AClient("http://localhost:9204", retry=RetryPolicy(max_attempts=5))
     """
     
-    def __init__(self, base_url: str, timeout: float = 120.0):
+    def __init__(self, base_url: str, timeout: float = 120.0,
+                 transport: Optional[A2ATransport] = None, wire_format: str = "json",
+                 retry: Optional[RetryPolicy] = None):
         """
         Args:
-            base_url: 에이전트 서버 URL (예: "http://localhost:9201")
+            base_url: 에이전트 서버 URL (예: "http://localhost:9201", "unix:///tmp/a.sock", "inproc://agent_id")
             timeout: 요청 타임아웃 (초). Gemini API 호출을 고려하여 기본값 120초
+            transport: 직접 지정할 전송 계층 (None이면 URL 스킴으로 결정)
+            wire_format: 인코딩 ("json" 기본, 내부 대용량 호출에는 "msgpack")
+            retry: execute_skill 재시도 정책 (None이면 RetryPolicy 기본값)
         """
         self.base_url = base_url.rstrip('/')
-        self.client = httpx.Client(timeout=timeout)
+        self.retry = retry or RetryPolicy()
+        self.transport = transport or transport_for_url(
+            self.base_url, timeout=timeout, wire_format=wire_format
+        )
         self._agent_card: Optional[Dict[str, Any]] = None
+        self._agent_card_etag: Optional[str] = None
     
     def get_agent_card(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Agent Card 가져오기 (A2A 표준: /.well-known/agent.json)
         
         Args:
-            refresh: True면 캐시된 카드를 무시하고 새로 조회
+            refresh: True면 서버에 다시 확인 (ETag 조건부 요청, 변경 없으면 304)
         
         Returns:
             Agent Card 딕셔너리
@@ -47,9 +74,10 @@ class A2AClient:
         if self._agent_card and not refresh:
             return self._agent_card
         
-        response = self.client.get(f"{self.base_url}/.well-known/agent.json")
-        response.raise_for_status()
-        self._agent_card = response.json()
+        etag = self._agent_card_etag if self._agent_card else None
+        card, self._agent_card_etag = self.transport.get_agent_card(etag)
+        if card is not None:
+            self._agent_card = card
         return self._agent_card
     
     def list_skills(self) -> List[Dict[str, str]]:
@@ -79,6 +107,9 @@ class A2AClient:
         """
         스킬 실행 (JSON-RPC 2.0)
         
+        일시적인 전송 오류/5xx는 retry 정책에 따라 재시도합니다.
+        모든 시도에 같은 idempotency key를 보내므로 서버는 스킬을 한 번만 실행합니다.
+        
         Args:
             skill_name: 실행할 스킬 이름
             **kwargs: 스킬 파라미터
@@ -88,27 +119,63 @@ class A2AClient:
         
         Raises:
             Exception: RPC 에러 발생 시
+            httpx.HTTPError: 재시도 정책으로도 복구하지 못한 전송 오류
         """
-        response = self.client.post(
-            f"{self.base_url}/rpc",
-            json={
+        with tracing.start_span(f"call {skill_name}", "client",
+                                {"a2a.skill": skill_name, "a2a.url": self.base_url}) as span:
+            payload = {
                 "jsonrpc": "2.0",
                 "method": skill_name,
                 "params": kwargs,
                 "id": 1
             }
-        )
-        response.raise_for_status()
-        result = response.json()
+            if self.retry.max_attempts > 1 and self.transport.lossy:
+                key = uuid.uuid4().hex
+                result = self.retry.call(
+                    lambda: self.transport.rpc(payload, idempotency_key=key), f"call {skill_name}"
+                )
+            else:
+                result = self.transport.rpc(payload)
+            
+            if "error" in result:
+                error = result['error']
+                span.record_error(error.get('message'))
+                raise Exception(f"RPC Error [{error.get('code')}]: {error.get('message')}")
+            
+            return result.get("result")
+    
+    def stream_skill(self, skill_name: str, input_stream: Optional[Iterable[Any]] = None,
+                     **kwargs) -> SkillStream:
+        """
+        스트리밍 스킬 실행 (/rpc:stream)
         
-        if "error" in result:
-            error = result['error']
-            raise Exception(f"RPC Error [{error.get('code')}]: {error.get('message')}")
+        generator 스킬의 결과를 만들어지는 대로 받고, 스킬의 스트리밍 입력 파라미터(Iterable[str])에는
+        input_stream의 조각을 만들어지는 대로 보냅니다 (다른 호출의 SkillStream도 가능).
+        입력 스트림은 다시 보낼 수 없으므로 재시도하지 않습니다.
+        
+        Args:
+            skill_name: 실행할 스킬 이름
+            input_stream: 스트리밍 입력 파라미터로 보낼 조각 (None이면 kwargs만 전달)
+            **kwargs: 스킬 파라미터
         
-        return result.get("result")
+        Returns:
+            SkillStream (순회하면 조각, result()는 최종 결과). 요청은 처음 순회할 때 보냄
+        """
+        span = tracing.start_span(f"stream {skill_name}", "client",
+                                  {"a2a.skill": skill_name, "a2a.url": self.base_url})
+        payload = {
+            "jsonrpc": "2.0",
+            "method": skill_name,
+            "params": kwargs,
+            "id": 1
+        }
+        with tracing.use_context(span.context):
+            records = self.transport.rpc_stream(payload, input_stream)
+        return SkillStream(traced(records, span), skill_name)
     
     def create_task(self, input_text: str = None, input_data: Dict[str, Any] = None, 
-                    metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+                    metadata: Dict[str, Any] = None, push_url: str = None,
+                    push_token: str = None, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Task 생성 (A2A 표준 Task-based API)
         
@@ -116,10 +183,39 @@ class A2AClient:
             input_text: 입력 텍스트
             input_data: 입력 데이터
             metadata: 메타데이터
+            push_url: 완료 이벤트를 받을 webhook URL (예: PushReceiver.url)
+            push_token: webhook 요청에 함께 보낼 토큰
+            timeout: 이 시간(초) 안에 끝나지 않으면 서버가 Task를 취소 (None이면 제한 없음)
         
         Returns:
             Task 생성 결과 {"taskId": "...", "status": "..."}
         """
+        return self.transport.create_task(
+            self._task_payload(input_text, input_data, metadata, push_url, push_token),
+            timeout=timeout
+        )
+    
+    def create_tasks(self, tasks: List[Dict[str, Any]],
+                     timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Task 일괄 생성 (POST /tasks:batch, 요청 한 번)
+        
+        Args:
+            tasks: create_task 인자 딕셔너리 목록
+                   (예: [{"input_data": {...}, "metadata": {"skill": "research"}}, ...])
+            timeout: 모든 Task에 적용할 deadline (초)
+        
+        Returns:
+            Task 생성 결과 목록 (tasks와 같은 순서)
+        """
+        payload = {"tasks": [self._task_payload(**task) for task in tasks]}
+        return self.transport.create_tasks(payload, timeout=timeout)["tasks"]
+    
+    @staticmethod
+    def _task_payload(input_text: str = None, input_data: Dict[str, Any] = None,
+                      metadata: Dict[str, Any] = None, push_url: str = None,
+                      push_token: str = None) -> Dict[str, Any]:
+        """CreateTaskRequest 형식의 요청 본문 생성"""
         payload = {
             "input": {
                 "text": input_text,
@@ -128,24 +224,91 @@ class A2AClient:
         }
         if metadata:
             payload["metadata"] = metadata
-        
-        response = self.client.post(f"{self.base_url}/tasks", json=payload)
-        response.raise_for_status()
-        return response.json()
+        if push_url:
+            payload["pushNotification"] = {"url": push_url, "token": push_token}
+        return payload
     
-    def get_task_status(self, task_id: str) -> Dict[str, Any]:
+    def get_task_status(self, task_id: str, fields: Optional[str] = None) -> Dict[str, Any]:
         """
         Task 상태 조회
         
         Args:
             task_id: Task ID
+            fields: 필요한 필드만 조회 (예: "status"). None이면 입력/출력 포함 전체
         
         Returns:
             Task 정보
         """
-        response = self.client.get(f"{self.base_url}/tasks/{task_id}")
-        response.raise_for_status()
-        return response.json()
+        return self.transport.get_task(task_id, fields=fields)
+    
+    def get_tasks_status(self, task_ids: List[str], fields: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Task 일괄 상태 조회 (POST /tasks:status, 요청 한 번)
+        
+        Args:
+            task_ids: Task ID 목록
+            fields: 필요한 필드만 조회 (예: "status"). None이면 입력/출력 포함 전체
+        
+        Returns:
+            {"tasks": [Task 정보, ...], "missing": [서버에 없는 Task ID, ...]}
+        """
+        payload = {"taskIds": list(task_ids)}
+        if fields:
+            payload["fields"] = fields
+        return self.transport.get_tasks(payload)
+    
+    def cancel_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        Task 취소 (POST /tasks/{id}/cancel)
+        
+        실행 중인 스킬은 다음 취소 확인 지점(LLM 호출 전 등)에서 중단됩니다.
+        
+        Returns:
+            취소된 Task 정보 {"task": {"id": ..., "status": "canceled", ...}}
+        """
+        return self.transport.cancel_task(task_id)
+    
+    def wait_for_task(self, task_id: str, timeout: Optional[float] = None,
+                      poll_wait: float = 30.0, cancel_on_timeout: bool = False) -> Dict[str, Any]:
+        """
+        Task가 끝날(completed/failed/canceled) 때까지 롱폴링으로 대기
+        
+        대기 중에는 상태만 조회(?fields=status&wait=)하고, 끝나면 전체 Task를 한 번 조회합니다.
+        
+        Args:
+            task_id: Task ID
+            timeout: 최대 대기 시간 (초). None이면 무제한
+            poll_wait: 요청 한 번당 서버에서 대기할 시간 (초)
+            cancel_on_timeout: True면 timeout 시 Task를 취소하여 서버 자원(LLM 호출)을 아낌
+        
+        Returns:
+            최종 Task 정보
+        
+        Raises:
+            TimeoutError: timeout 안에 Task가 끝나지 않았을 때
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            wait = poll_wait
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if cancel_on_timeout:
+                        self._cancel_quietly(task_id)
+                    raise TimeoutError(f"Task {task_id} did not finish within {timeout}s")
+                wait = min(wait, remaining)
+            
+            status = self.transport.get_task(task_id, fields="status", wait=wait)
+            if status["task"]["status"] in TERMINAL_TASK_STATUSES:
+                return self.get_task_status(task_id)
+    
+    def _cancel_quietly(self, task_id: str):
+        """취소 시도 (이미 끝났거나 실패해도 무시)"""
+        try:
+            self.transport.cancel_task(task_id)
+        except Exception:
+            pass
     
     def health_check(self) -> Dict[str, Any]:
         """
@@ -154,13 +317,11 @@ class A2AClient:
         Returns:
             서버 상태 정보
         """
-        response = self.client.get(f"{self.base_url}/health")
-        response.raise_for_status()
-        return response.json()
+        return self.transport.health()
     
     def close(self):
         """클라이언트 종료"""
-        self.client.close()
+        self.transport.close()
     
     def __enter__(self):
         return self
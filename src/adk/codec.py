@@ -0,0 +1,276 @@
+"""
+A2A Agent Development Kit - Wire Codec
+서버 응답과 클라이언트 요청에 공통으로 쓰는 인코딩/디코딩
+
+JSON이 기본이며, 내부 에이전트 간 대용량 호출에는 MessagePack을 협상할 수 있습니다.
+    Accept / Content-Type: application/json | application/msgpack
+
+큰 본문은 압축합니다 (gzip은 항상, zstd는 zstandard 설치 시).
+    Accept-Encoding / Content-Encoding: zstd | gzip
+
+orjson / msgpack / zstandard가 설치되어 있으면 사용하고, 없으면 표준 라이브러리만으로 동작합니다.
+    pip install orjson msgpack zstandard
+"""
+import dataclasses
+import enum
+import io
+import json
+import uuid
+import zlib
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# 클라이언트 wire_format 옵션 → 미디어 타입
+WIRE_FORMATS = {
+    "json": JSON_MEDIA_TYPE,
+    "msgpack": MSGPACK_MEDIA_TYPE,
+}
+
+_MSGPACK_ALIASES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+
+# 이 크기 이상인 본문만 압축 (작은 본문은 압축 비용이 이득보다 큼)
+COMPRESSION_THRESHOLD = 1024
+# 압축 해제 결과 최대 크기 (압축 폭탄 방지)
+MAX_DECOMPRESSED_SIZE = 64 * 1024 * 1024
+
+# 선호 순서대로 나열한 지원 압축 방식
+SUPPORTED_ENCODINGS = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+# 인코딩할 수 없는 값일 때 dumps/encode가 발생시키는 예외 (orjson.JSONEncodeError는 TypeError)
+ENCODE_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+def _default(obj: Any) -> Any:
+    """기본 인코더가 처리하지 못하는 타입 변환 (FastAPI jsonable_encoder와 같은 규칙)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Decimal):
+        # 정수로 표현되는 값은 int, 아니면 float
+        return int(obj) if obj.is_finite() and obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (PurePath, uuid.UUID)):
+        return str(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, bytes):
+        return obj.decode()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    
+    def dumps(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 인코딩"""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    
+    def loads(data: bytes) -> Any:
+        """JSON 바이트/문자열 디코딩"""
+        return orjson.loads(data)
+
+else:
+    def dumps(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 인코딩"""
+        return json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+    
+    def loads(data: bytes) -> Any:
+        """JSON 바이트/문자열 디코딩"""
+        return json.loads(data)
+
+
+def is_supported(media_type: str) -> bool:
+    """이 프로세스에서 인코딩/디코딩 가능한 미디어 타입인지 확인"""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack is not None
+    return media_type == JSON_MEDIA_TYPE
+
+
+def media_type_of(content_type: Optional[str]) -> str:
+    """Content-Type 헤더를 지원하는 미디어 타입으로 정규화 (알 수 없으면 JSON)"""
+    if content_type:
+        base = content_type.split(";", 1)[0].strip().lower()
+        if base in _MSGPACK_ALIASES:
+            return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Accept 헤더로 응답 미디어 타입 결정
+    
+    q 값이 가장 높은 지원 타입을 고르며, 지원하지 않거나 헤더가 없으면 JSON.
+    """
+    if not accept or msgpack is None:
+        return JSON_MEDIA_TYPE
+    
+    best, best_q = JSON_MEDIA_TYPE, -1.0
+    for item in accept.split(","):
+        parts = item.split(";")
+        media_type = parts[0].strip().lower()
+        q = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q <= 0:
+            continue
+        if media_type in _MSGPACK_ALIASES:
+            candidate = MSGPACK_MEDIA_TYPE
+        elif media_type in (JSON_MEDIA_TYPE, "*/*", "application/*"):
+            candidate = JSON_MEDIA_TYPE
+        else:
+            continue
+        if q > best_q:
+            best, best_q = candidate, q
+    return best
+
+
+def encode(obj: Any, media_type: str = JSON_MEDIA_TYPE) -> bytes:
+    """미디어 타입에 맞게 인코딩"""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(obj, default=_default, use_bin_type=True)
+    return dumps(obj)
+
+
+def decode(data: bytes, media_type: str = JSON_MEDIA_TYPE) -> Any:
+    """
+    미디어 타입에 맞게 디코딩
+    
+    Raises:
+        ValueError: 본문을 해석할 수 없을 때
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        if msgpack is None:
+            raise ValueError("msgpack is not installed")
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except Exception as e:
+            raise ValueError(f"Invalid msgpack body: {e}") from e
+    return loads(data)
+
+
+# ============================================
+# 압축 (Content-Encoding)
+# ============================================
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    상대가 받을 수 있는 압축 방식 중 가장 선호하는 것 선택
+    
+    Args:
+        accept_encoding: 상대의 Accept-Encoding 헤더
+    
+    Returns:
+        "zstd", "gzip" 또는 None (압축 안 함)
+    """
+    if not accept_encoding:
+        return None
+    
+    offered = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        offered.add(name.strip().lower())
+    
+    for encoding in SUPPORTED_ENCODINGS:
+        if encoding in offered:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """본문 압축"""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if encoding == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    raise ValueError(f"Unsupported content encoding: '{encoding}'")
+
+
+def decompress(data: bytes, encoding: Optional[str]) -> bytes:
+    """
+    Content-Encoding에 맞게 본문 압축 해제
+    
+    Raises:
+        ValueError: 지원하지 않는 방식이거나, 손상되었거나, MAX_DECOMPRESSED_SIZE를 넘을 때
+    """
+    encoding = (encoding or "identity").strip().lower()
+    if encoding == "identity":
+        return data
+    
+    try:
+        if encoding == "gzip" or encoding == "x-gzip":
+            decompressor = zlib.decompressobj(47)  # gzip/zlib 헤더 자동 감지
+            result = decompressor.decompress(data, MAX_DECOMPRESSED_SIZE + 1)
+        elif encoding == "zstd" and zstandard is not None:
+            reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data))
+            result = reader.read(MAX_DECOMPRESSED_SIZE + 1)
+        else:
+            raise ValueError(f"Unsupported content encoding: '{encoding}'")
+    except (zlib.error, RuntimeError) as e:
+        raise ValueError(f"Invalid {encoding} body: {e}") from e
+    except Exception as e:
+        if zstandard is not None and isinstance(e, zstandard.ZstdError):
+            raise ValueError(f"Invalid {encoding} body: {e}") from e
+        raise
+    
+    if len(result) > MAX_DECOMPRESSED_SIZE:
+        raise ValueError("Decompressed body is too large")
+    return result
+
+
+__all__ = [
+    'dumps',
+    'loads',
+    'encode',
+    'decode',
+    'negotiate',
+    'media_type_of',
+    'is_supported',
+    'choose_encoding',
+    'compress',
+    'decompress',
+    'COMPRESSION_THRESHOLD',
+    'ENCODE_ERRORS',
+    'SUPPORTED_ENCODINGS',
+    'JSON_MEDIA_TYPE',
+    'MSGPACK_MEDIA_TYPE',
+    'WIRE_FORMATS',
+]
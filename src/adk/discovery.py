@@ -2,9 +2,66 @@
 A2A Agent Discovery Client
 여러 에이전트의 Agent Card를 조회하고, 쿼리에 적합한 에이전트를 선택
 """
+import contextvars
 import httpx
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Callable, Tuple
+from dataclasses import dataclass, field, replace
+
+from . import assignment, metrics, tracing
+from .cancellation import RPC_CANCEL_METHOD
+from .log import get_logger
+from .retry import NO_RETRY, RetryPolicy
+from .schema import stream_param
+from .streaming import SkillStream, traced
+from .transport import A2ATransport, transport_for_url
+
+
+# 여러 오케스트레이터 프로세스가 공유하는 디스커버리 캐시 파일
+DEFAULT_CACHE_PATH = os.getenv(
+    "A2A_DISCOVERY_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "a2a", "discovery.json")
+)
+CACHE_VERSION = 1
+
+# 파이프라인 배정 비용 모델 기본값 (ms)
+DEFAULT_SKILL_LATENCY_MS = 1000.0  # 어떤 에이전트에서도 관측된 적 없는 스킬의 예상 실행 시간
+DEFAULT_HOP_COST_MS = 50.0  # 중간 결과를 다른 에이전트로 넘기는 비용
+UNHEALTHY_PENALTY_MS = 60000.0  # 마지막 Agent Card 조회에 실패한 에이전트 (다른 후보가 없을 때만 선택)
+
+# 스킬별 입력이 되는 이전 단계 (run_dynamic_pipeline의 데이터 흐름)
+# 그룹마다 파이프라인에 먼저 나오는(앞쪽에 적힌) 스킬 하나의 결과를 받음. 없는 스킬은 바로 앞 단계
+SKILL_INPUTS: Dict[str, List[tuple]] = {
+    "write": [("deep_research",)],
+    "quality_review": [("write",)],
+    "revise": [("write",), ("quality_review",)],
+    "save_to_file": [("revise", "write", "quality_review", "deep_research")],
+    "send_email": [("revise", "write", "quality_review", "deep_research")],
+}
+
+# Hedged request (execute_skill): 응답이 늦으면 같은 스킬을 가진 다른 에이전트에 같은 요청을 보냄
+HEDGE_QUANTILE = 0.95  # 이 분위수의 지연이 지나도 응답이 없으면 hedge
+HEDGE_MIN_SAMPLES = 10  # 에이전트/스킬별 관측이 이보다 적으면 hedge 안 함 (느린지 판단할 수 없음)
+HEDGE_MAX_BURST = 10.0  # 적립해 둘 수 있는 hedge 예산 상한 (연속으로 보낼 수 있는 hedge 수)
+HEDGE_MAX_WORKERS = 64  # hedge 호출과 취소 요청을 실행하는 스레드 수
+REFRESH_MAX_WORKERS = 8  # 백그라운드 재확인에서 Agent Card를 동시에 조회하는 스레드 수
+# hedge해도 되는 스킬 (두 에이전트에서 한 번씩 실행되어도 부작용이 없음). save_to_file/send_email은 제외
+HEDGE_SKILLS = frozenset({"deep_research", "write", "revise", "quality_review"})
+LATENCY_WINDOW = 100  # 지연 분위수 계산에 쓰는 에이전트/스킬별 최근 관측 수
+
+logger = get_logger("a2a.discovery")
+
+_hedges = metrics.REGISTRY.counter(
+    "a2a_client_hedged_requests_total", "Duplicate skill calls sent to a second agent", ("skill",))
+_hedge_wins = metrics.REGISTRY.counter(
+    "a2a_client_hedge_wins_total", "Hedged skill calls answered first by the second agent", ("skill",))
 
 
 @dataclass
@@ -15,6 +72,13 @@ class AgentInfo:
     description: str
     skills: List[Dict[str, str]]
     agent_card: Dict[str, Any]
+    etag: Optional[str] = None  # Agent Card ETag (조건부 재조회용)
+    ttl: Optional[float] = None  # 에이전트별 갱신 주기 (None이면 클라이언트 기본값)
+    fetched_at: float = 0.0  # 마지막으로 카드를 확인한 시각 (time.monotonic)
+    next_refresh_at: float = 0.0  # 다음 백그라운드 갱신 예정 시각 (time.monotonic)
+    healthy: bool = True  # 마지막 카드 조회 성공 여부
+    verified: bool = True  # 이번 실행에서 카드를 확인했는지 (False면 디스커버리 캐시에서 읽기만 한 항목)
+    skill_latency_ms: Dict[str, float] = field(default_factory=dict)  # 스킬별 응답 시간 (EWMA, ms)
     
     def has_skill(self, skill_name: str) -> bool:
         """특정 스킬을 가지고 있는지 확인"""
@@ -23,6 +87,92 @@ class AgentInfo:
     def skill_names(self) -> List[str]:
         """스킬 이름 목록"""
         return [s['name'] for s in self.skills]
+    
+    def supports_streaming(self) -> bool:
+        """/rpc:stream 지원 여부 (Agent Card의 capabilities.streaming)"""
+        return bool((self.agent_card.get("capabilities") or {}).get("streaming"))
+    
+    def stream_input(self, skill_name: str) -> Optional[str]:
+        """스킬이 조각 스트림으로 받을 수 있는 입력 파라미터 (Agent Card의 inputSchema 기준, 없으면 None)"""
+        if not self.supports_streaming():
+            return None
+        for s in self.skills:
+            if s['name'] == skill_name:
+                return stream_param(s.get('inputSchema'))
+        return None
+
+
+@dataclass(frozen=True)
+class _Registry:
+    """
+    에이전트 레지스트리 스냅샷 (불변)
+    
+    갱신 시에는 새 스냅샷을 만들어 참조를 통째로 교체하므로,
+    조회하는 쪽은 락 없이 항상 일관된 agents/skill_index 쌍을 봅니다.
+    """
+    agents: Dict[str, AgentInfo] = field(default_factory=dict)  # url -> AgentInfo
+    skill_index: Dict[str, List[AgentInfo]] = field(default_factory=dict)  # skill -> [AgentInfo]
+    
+    @classmethod
+    def build(cls, agents: Dict[str, AgentInfo]) -> "_Registry":
+        skill_index: Dict[str, List[AgentInfo]] = {}
+        for agent in agents.values():
+            for skill_name in agent.skill_names():
+                skill_index.setdefault(skill_name, []).append(agent)
+        return cls(agents=agents, skill_index=skill_index)
+
+
+@dataclass
+class PipelineAssignment:
+    """파이프라인 에이전트 배정 결과"""
+    agents: Dict[str, AgentInfo]  # 스킬 -> 에이전트 (에이전트가 없는 스킬은 빠짐)
+    predicted_ms: float  # 예상 end-to-end 지연 (실행 시간 + 에이전트 간 전달 비용)
+    step_ms: Dict[str, float]  # 스킬별 예상 실행 시간 (부하 반영)
+    method: str  # "exact" 또는 "heuristic"
+
+
+class _HedgeBudget:
+    """
+    hedge 요청 수를 원래 호출 수의 ratio 이하로 제한 (토큰 버킷)
+    
+    호출마다 ratio만큼 적립하고 hedge 하나에 1을 씁니다.
+    적립은 burst까지만 하므로 한가할 때 모아 둔 예산으로 한꺼번에 부하를 늘리지 않습니다.
+    """
+    
+    def __init__(self, ratio: float, burst: float = HEDGE_MAX_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self._balance = 0.0
+        self._lock = threading.Lock()
+    
+    def deposit(self):
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.burst)
+    
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1.0:
+                return False
+            self._balance -= 1.0
+            return True
+
+
+def _step_inputs(skills: List[str]) -> List[List[int]]:
+    """단계별로 입력을 받는 이전 단계 인덱스 (SKILL_INPUTS 참고)"""
+    inputs = []
+    for step, skill in enumerate(skills):
+        groups = SKILL_INPUTS.get(skill)
+        if groups is None:
+            inputs.append([step - 1] if step else [])
+            continue
+        earlier = {s: i for i, s in enumerate(skills[:step])}
+        sources = []
+        for group in groups:
+            source = next((earlier[s] for s in group if s in earlier), None)
+            if source is not None and source not in sources:
+                sources.append(source)
+        inputs.append(sources)
+    return inputs
 
 
 class A2ADiscoveryClient:
@@ -43,49 +193,345 @@ class A2ADiscoveryClient:
         
         # 스킬 실행
         result = discovery.execute_skill(agent.url, "research", query="AI")
+        
+        # 백그라운드에서 Agent Card를 주기적으로 재확인 (ETag 조건부 요청)
+        discovery.start_background_refresh()
     """
     
-    def __init__(self, timeout: float = 120.0):
+    def __init__(self, timeout: float = 120.0, refresh_ttl: float = 60.0, refresh_jitter: float = 0.2,
+                 cache_path: Optional[str] = None, wire_format: str = "json",
+                 hop_cost_ms: float = DEFAULT_HOP_COST_MS, load_weight: float = 1.0,
+                 hedge_budget: Optional[float] = None, retry: Optional[RetryPolicy] = None,
+                 hedge_skills: Optional[Iterable[str]] = None):
         """
         Args:
             timeout: HTTP 요청 타임아웃 (초). Gemini API 호출을 고려하여 기본값 120초
+            refresh_ttl: Agent Card 기본 갱신 주기 (초)
+            refresh_jitter: 갱신 시각을 분산시키는 비율 (0.2면 TTL의 80~100% 사이에서 갱신)
+            cache_path: 디스커버리 캐시 파일 경로 (None이면 사용 안 함, 보통 DEFAULT_CACHE_PATH)
+            wire_format: HTTP 인코딩 ("json" 기본, 내부 대용량 호출에는 "msgpack")
+            hop_cost_ms: 파이프라인 배정 시 중간 결과를 다른 에이전트로 넘기는 비용 (ms)
+            load_weight: 진행 중인 호출 하나당 예상 실행 시간 증가 비율 (0이면 부하 무시)
+            hedge_budget: execute_skill hedged request로 늘어나는 호출 비율 상한
+                          (0.05면 최대 5%, 0이면 hedge 안 함, None이면 A2A_HEDGE_BUDGET, 기본 0)
+            retry: execute_skill 재시도 정책 (None이면 RetryPolicy 기본값, 모든 시도에 같은 idempotency key)
+            hedge_skills: hedge해도 되는 스킬 (중복 실행해도 부작용이 없는 스킬만, None이면 HEDGE_SKILLS)
         """
-        self.client = httpx.Client(timeout=timeout)
-        self.agents: Dict[str, AgentInfo] = {}  # url -> AgentInfo
+        self.timeout = timeout
+        self.wire_format = wire_format
+        self.refresh_ttl = refresh_ttl
+        self.refresh_jitter = refresh_jitter
+        self.hop_cost_ms = hop_cost_ms
+        self.load_weight = load_weight
+        self.retry = retry or RetryPolicy()
+        # 에이전트별 진행 중인 execute_skill 호출 수 (파이프라인 배정의 부하 신호)
+        self._in_flight: Dict[str, int] = {}
+        self._in_flight_lock = threading.Lock()
+        # (에이전트 URL, 스킬) → 최근 응답 시간 (ms, hedge 지연 계산용)
+        self._latency_samples: Dict[Tuple[str, str], deque] = {}
+        if hedge_budget is None:
+            hedge_budget = float(os.getenv("A2A_HEDGE_BUDGET", "0") or 0)
+        self._hedge_budget = _HedgeBudget(hedge_budget) if hedge_budget > 0 else None
+        self.hedge_skills = frozenset(HEDGE_SKILLS if hedge_skills is None else hedge_skills)
+        self._hedge_executor = (
+            ThreadPoolExecutor(HEDGE_MAX_WORKERS, thread_name_prefix="a2a-hedge") if self._hedge_budget else None
+        )
+        self.client = httpx.Client(timeout=timeout)  # HTTP 에이전트가 공유하는 커넥션 풀
+        self._registry = _Registry()
+        self._registry_lock = threading.Lock()  # 쓰기(교체)끼리만 직렬화, 조회는 락 없음
+        self._transports: Dict[str, A2ATransport] = {}  # url -> A2ATransport
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+        self._refresh_wake = threading.Event()  # 새로 등록된 미확인 에이전트를 바로 재확인하도록 깨움
+        
+        # 디스커버리 캐시: 파일에서 읽었지만 아직 register_agent로 등록하지 않은 에이전트
+        # (url → (AgentInfo, 스킬별 최근 응답 시간)). 등록할 때만 레지스트리로 옮김
+        self.cache_path = cache_path
+        self._cached: Dict[str, Tuple[AgentInfo, Dict[str, List[float]]]] = {}
+        if cache_path:
+            self.load_cache()
+    
+    @property
+    def agents(self) -> Dict[str, AgentInfo]:
+        """등록된 에이전트 (url -> AgentInfo, 읽기 전용 스냅샷)"""
+        return self._registry.agents
+    
+    def _update_registry(self, update: Callable[[Dict[str, AgentInfo]], None]):
+        """레지스트리 사본을 수정한 뒤 인덱스와 함께 원자적으로 교체"""
+        with self._registry_lock:
+            agents = dict(self._registry.agents)
+            update(agents)
+            self._registry = _Registry.build(agents)
+    
+    def _schedule(self, agent_info: AgentInfo, now: float) -> AgentInfo:
+        """다음 갱신 시각을 지터를 적용하여 계산"""
+        ttl = agent_info.ttl if agent_info.ttl is not None else self.refresh_ttl
+        delay = ttl * random.uniform(1.0 - self.refresh_jitter, 1.0)
+        return replace(agent_info, fetched_at=now, next_refresh_at=now + delay)
     
-    def register_agent(self, agent_url: str) -> Optional[AgentInfo]:
+    def _transport(self, agent_url: str) -> A2ATransport:
+        """에이전트 URL에 맞는 전송 계층 (URL별로 재사용)"""
+        transport = self._transports.get(agent_url)
+        if transport is None:
+            transport = transport_for_url(
+                agent_url, timeout=self.timeout, client=self.client, wire_format=self.wire_format
+            )
+            self._transports[agent_url] = transport
+        return transport
+    
+    def register_agent(self, agent_url: str, ttl: Optional[float] = None) -> Optional[AgentInfo]:
         """
         에이전트를 등록하고 Agent Card를 조회
         
+        이미 등록된 에이전트는 ETag 조건부 요청으로 재확인하며,
+        카드가 바뀌지 않았으면(304) 기존 AgentInfo를 유지합니다.
+        디스커버리 캐시에 있는 에이전트는 네트워크 요청 없이 캐시의 카드로 바로 등록하고
+        (verified=False), 백그라운드 갱신 스레드가 곧바로 조건부 요청으로 재확인합니다.
+        재확인에 실패한 캐시 항목은 레지스트리에서 제거됩니다.
+        
         Args:
-            agent_url: 에이전트 서버 URL (예: "http://localhost:9201")
+            agent_url: 에이전트 서버 URL (예: "http://localhost:9201", "unix:///tmp/a.sock", "inproc://agent_id")
+            ttl: 이 에이전트의 갱신 주기 (초). None이면 refresh_ttl 사용
         
         Returns:
             등록된 AgentInfo 또는 None (실패 시)
         """
         agent_url = agent_url.rstrip('/')
+        cached = self._cached.pop(agent_url, None)
+        if cached is not None and agent_url not in self._registry.agents:
+            return self._register_cached(agent_url, ttl, cached)
         
         try:
-            # Agent Card 조회 (A2A 표준)
-            response = self.client.get(f"{agent_url}/.well-known/agent.json")
-            response.raise_for_status()
-            agent_card = response.json()
-            
+            return self._fetch_agent(agent_url, ttl)
+        
+        except Exception as e:
+            logger.warning("discovery.register_failed", url=agent_url, error=str(e))
+            return None
+    
+    def _register_cached(self, agent_url: str, ttl: Optional[float],
+                         cached: Tuple[AgentInfo, Dict[str, List[float]]]) -> AgentInfo:
+        """디스커버리 캐시 항목을 미확인 상태로 바로 등록하고 백그라운드 재확인을 예약"""
+        info, samples = cached
+        agent_info = replace(info, ttl=ttl if ttl is not None else info.ttl, verified=False,
+                             fetched_at=0.0, next_refresh_at=time.monotonic())
+        for skill_name, window in samples.items():
+            self._latency_samples.setdefault((agent_url, skill_name), deque(window, maxlen=LATENCY_WINDOW))
+        self._update_registry(lambda agents: agents.__setitem__(agent_url, agent_info))
+        logger.debug("discovery.registered_from_cache", url=agent_url)
+        
+        self.start_background_refresh()
+        self._refresh_wake.set()
+        return agent_info
+    
+    def _fetch_agent(self, agent_url: str, ttl: Optional[float] = None) -> AgentInfo:
+        """Agent Card를 조건부로 조회하여 레지스트리에 반영"""
+        # Agent Card 조회 (A2A 표준)
+        existing = self._registry.agents.get(agent_url)
+        agent_card, etag = self._transport(agent_url).get_agent_card(
+            existing.etag if existing else None
+        )
+        
+        if agent_card is None:
+            # 304: 카드 변경 없음 - 갱신 시각만 다시 계산
+            agent_info = replace(existing, etag=etag, healthy=True, verified=True,
+                                 ttl=ttl if ttl is not None else existing.ttl)
+        else:
             # AgentInfo 생성
             agent_info = AgentInfo(
                 url=agent_url,
                 name=agent_card.get("name", "Unknown Agent"),
                 description=agent_card.get("description", ""),
                 skills=agent_card.get("skills", []),
-                agent_card=agent_card
+                agent_card=agent_card,
+                etag=etag,
+                ttl=ttl if ttl is not None else (existing.ttl if existing else None),
+                skill_latency_ms=existing.skill_latency_ms if existing else {}
             )
+        
+        agent_info = self._schedule(agent_info, time.monotonic())
+        self._update_registry(lambda agents: agents.__setitem__(agent_url, agent_info))
+        return agent_info
+    
+    def refresh_agents(self, force: bool = False) -> int:
+        """
+        갱신 시각이 지난 에이전트의 Agent Card를 조건부로 재조회
+        
+        확인된 적 있는 에이전트가 실패하면 unhealthy로 표시해 두고 다음 주기에 다시 시도하며,
+        디스커버리 캐시에서 읽기만 한 미확인 에이전트가 실패하면 레지스트리에서 제거합니다.
+        여러 에이전트는 동시에 조회하므로 응답하지 않는 에이전트가 다른 에이전트의 재확인을 막지 않습니다.
+        
+        Args:
+            force: True면 갱신 시각과 무관하게 모든 에이전트 재조회
+        
+        Returns:
+            재조회를 시도한 에이전트 수
+        """
+        now = time.monotonic()
+        due = [
+            agent for agent in self._registry.agents.values()
+            if force or agent.next_refresh_at <= now
+        ]
+        
+        def refresh(agent: AgentInfo):
+            try:
+                self._fetch_agent(agent.url)
+            except Exception as e:
+                if agent.verified:
+                    logger.warning("discovery.refresh_failed", url=agent.url, error=str(e))
+                    self._mark_unhealthy(agent.url, now)
+                else:
+                    logger.warning("discovery.cached_agent_dropped", url=agent.url, error=str(e))
+                    self._drop_agent(agent.url)
+        
+        if len(due) > 1:
+            with ThreadPoolExecutor(min(len(due), REFRESH_MAX_WORKERS), thread_name_prefix="a2a-refresh") as executor:
+                list(executor.map(refresh, due))
+        else:
+            for agent in due:
+                refresh(agent)
+        
+        if due and self.cache_path:
+            self.save_cache()
+        
+        return len(due)
+    
+    def _mark_unhealthy(self, agent_url: str, now: float):
+        """조회에 실패한 에이전트를 unhealthy로 표시하고 다음 갱신 시각만 다시 계산"""
+        def update(agents: Dict[str, AgentInfo]):
+            if agent_url in agents:
+                agents[agent_url] = self._schedule(replace(agents[agent_url], healthy=False), now)
+        
+        self._update_registry(update)
+    
+    def _drop_agent(self, agent_url: str):
+        """재확인에 실패한 미확인 에이전트를 레지스트리에서 제거 (그 사이 확인된 경우는 유지)"""
+        def update(agents: Dict[str, AgentInfo]):
+            agent = agents.get(agent_url)
+            if agent is not None and not agent.verified:
+                del agents[agent_url]
+        
+        self._update_registry(update)
+    
+    # ============================================
+    # 디스커버리 캐시 (디스크)
+    # ============================================
+    
+    def load_cache(self) -> int:
+        """
+        디스커버리 캐시 파일 읽기
+        
+        캐시 파일은 여러 오케스트레이터(예: 4/5 에이전트 러너)가 공유하므로, 읽은 에이전트를
+        바로 레지스트리에 넣지 않습니다. register_agent로 등록하는 URL만 캐시의 ETag와
+        응답 시간 통계를 이어받아 레지스트리에 들어갑니다.
+        
+        Returns:
+            캐시에서 읽은 에이전트 수
+        """
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        
+        if data.get("version") != CACHE_VERSION:
+            return 0
+        
+        loaded = {}
+        for entry in data.get("agents", []):
+            try:
+                info = AgentInfo(
+                    url=entry["url"],
+                    name=entry["name"],
+                    description=entry.get("description", ""),
+                    skills=entry.get("skills", []),
+                    agent_card=entry.get("agent_card", {}),
+                    etag=entry.get("etag"),
+                    ttl=entry.get("ttl"),
+                    healthy=entry.get("healthy", True),
+                    skill_latency_ms=entry.get("skill_latency_ms", {})
+                )
+            except KeyError:
+                continue
+            loaded[info.url] = (info, entry.get("skill_latency_samples", {}))
+        
+        self._cached.update(loaded)
+        return len(loaded)
+    
+    def save_cache(self):
+        """
+        레지스트리를 디스커버리 캐시 파일에 저장 (임시 파일 + 원자적 교체)
+        
+        이 클라이언트가 등록하지 않은 캐시 항목(다른 오케스트레이터의 에이전트)도 그대로 남깁니다.
+        """
+        # 최근 응답 시간도 저장하여 짧게 실행되는 오케스트레이터도 hedge 지연을 계산할 수 있도록
+        samples: Dict[str, Dict[str, List[float]]] = {}
+        for (agent_url, skill_name), window in list(self._latency_samples.items()):
+            samples.setdefault(agent_url, {})[skill_name] = [round(ms, 1) for ms in list(window)]
+        registered = self._registry.agents
+        entries = [(agent, samples.get(agent.url, {})) for agent in registered.values()]
+        entries += [entry for url, entry in list(self._cached.items()) if url not in registered]
+        data = {
+            "version": CACHE_VERSION,
+            "saved_at": time.time(),
+            "agents": [
+                {
+                    "url": agent.url,
+                    "name": agent.name,
+                    "description": agent.description,
+                    "skills": agent.skills,
+                    "agent_card": agent.agent_card,
+                    "etag": agent.etag,
+                    "ttl": agent.ttl,
+                    "healthy": agent.healthy,
+                    "skill_latency_ms": dict(agent.skill_latency_ms),
+                    "skill_latency_samples": agent_samples
+                }
+                for agent, agent_samples in entries
+            ]
+        }
+        
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("discovery.cache_save_failed", path=self.cache_path, error=str(e))
+    
+    def start_background_refresh(self):
+        """백그라운드 갱신 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="a2a-discovery-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+    
+    def stop_background_refresh(self):
+        """백그라운드 갱신 스레드 종료"""
+        self._refresh_stop.set()
+        self._refresh_wake.set()
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout=self.timeout)
+            self._refresh_thread = None
+    
+    def _refresh_loop(self):
+        """가장 이른 갱신 시각까지 (또는 미확인 에이전트가 등록될 때까지) 대기했다가 만료된 에이전트를 재조회"""
+        while not self._refresh_stop.is_set():
+            agents = self._registry.agents.values()
+            if agents:
+                wait = min(agent.next_refresh_at for agent in agents) - time.monotonic()
+            else:
+                wait = self.refresh_ttl
             
-            self.agents[agent_url] = agent_info
-            return agent_info
-            
-        except Exception as e:
-            print(f" Failed to register agent {agent_url}: {e}")
-            return None
+            self._refresh_wake.wait(max(wait, 0.0))
+            self._refresh_wake.clear()
+            if self._refresh_stop.is_set():
+                break
+            self.refresh_agents()
     
     def register_agents(self, agent_urls: List[str]) -> List[AgentInfo]:
         """
@@ -97,12 +543,14 @@ class A2ADiscoveryClient:
         Returns:
             성공적으로 등록된 AgentInfo 목록
         """
-        registered = []
-        for url in agent_urls:
-            agent_info = self.register_agent(url)
-            if agent_info:
-                registered.append(agent_info)
-        return registered
+        with tracing.start_span("discovery.register_agents", attributes={"agents": len(agent_urls)}) as span:
+            registered = []
+            for url in agent_urls:
+                agent_info = self.register_agent(url)
+                if agent_info:
+                    registered.append(agent_info)
+            span.set_attribute("registered", len(registered))
+            return registered
     
     def list_agents(self) -> List[AgentInfo]:
         """등록된 모든 에이전트 목록"""
@@ -124,7 +572,7 @@ class A2ADiscoveryClient:
         Returns:
             AgentInfo 또는 None
         """
-        candidates = [agent for agent in self.agents.values() if agent.has_skill(skill_name)]
+        candidates = self._registry.skill_index.get(skill_name, [])
         
         if not candidates:
             return None
@@ -177,7 +625,7 @@ class A2ADiscoveryClient:
         Returns:
             AgentInfo 목록
         """
-        return [agent for agent in self.agents.values() if agent.has_skill(skill_name)]
+        return list(self._registry.skill_index.get(skill_name, []))
     
     def find_agent_by_skills(self, skill_names: List[str], match_all: bool = False) -> Optional[AgentInfo]:
         """
@@ -221,11 +669,12 @@ class A2ADiscoveryClient:
         """
         파이프라인 전체에 필요한 스킬에 대해 최적의 에이전트 매핑 생성
         
-        각 스킬에 대해 전체 필요 스킬 목록을 고려하여 최적의 에이전트를 선택합니다.
-        이를 통해 가능한 경우 하나의 에이전트가 여러 스킬을 처리하도록 최적화합니다.
+        스킬마다 따로 고르지 않고, 예상 end-to-end 지연이 가장 작은 배정을 전체 단계에 대해 한 번에 구합니다.
+        (plan_pipeline 참고) 관측된 지연이 없으면 단계 간 전달이 적은 배정,
+        즉 여러 스킬을 함께 처리할 수 있는 에이전트가 선택됩니다.
         
         Args:
-            required_skills: 필요한 스킬 목록
+            required_skills: 필요한 스킬 목록 (파이프라인 실행 순서)
         
         Returns:
             스킬 → 에이전트 매핑 딕셔너리
@@ -236,14 +685,73 @@ class A2ADiscoveryClient:
             >>> # Attacker Agent가 모든 스킬을 가지고 있으면:
             >>> # {"deep_research": AttackerAgent, "write": AttackerAgent, "send_email": AttackerAgent}
         """
-        skill_agent_map = {}
+        return self.plan_pipeline(required_skills).agents
+    
+    def plan_pipeline(self, required_skills: List[str]) -> PipelineAssignment:
+        """
+        예상 end-to-end 지연을 최소화하는 파이프라인 에이전트 배정
+        
+        단계 실행 시간 = 관측된 스킬 지연(EWMA, 없으면 다른 에이전트의 관측값 중앙값 또는 기본값)
+                        x (1 + load_weight x 진행 중인 호출 수)
+        전달 비용     = 단계 입력을 만든 에이전트와 다른 에이전트에서 실행하면 hop_cost_ms
+        
+        후보 조합이 적으면 정확한 해를, 많으면 휴리스틱 해를 구합니다 (assignment.solve).
+        비용이 같으면 필요한 스킬을 더 많이 가진 에이전트, 그다음 스킬 수가 적은 전문 에이전트를 선호합니다.
+        
+        Args:
+            required_skills: 필요한 스킬 목록 (파이프라인 실행 순서)
+        
+        Returns:
+            PipelineAssignment (에이전트가 없는 스킬은 agents에서 빠짐)
+        """
+        with tracing.start_span("discovery.select_agents", attributes={"skills": ",".join(required_skills)}) as span:
+            registry = self._registry
+            skills = [s for s in dict.fromkeys(required_skills) if registry.skill_index.get(s)]
+            candidates = [self._rank_candidates(registry.skill_index[s], required_skills) for s in skills]
+            service = [
+                self._predicted_latencies_ms(skill, agents) for skill, agents in zip(skills, candidates)
+            ]
+            
+            result = assignment.solve(
+                [[agent.url for agent in agents] for agents in candidates],
+                service, _step_inputs(skills), self.hop_cost_ms
+            )
+            
+            span.set_attribute("method", result.method)
+            span.set_attribute("predicted_ms", round(result.cost, 1))
+            return PipelineAssignment(
+                agents={skill: candidates[i][index] for i, (skill, index) in enumerate(zip(skills, result.choice))},
+                predicted_ms=result.cost,
+                step_ms={skill: service[i][index] for i, (skill, index) in enumerate(zip(skills, result.choice))},
+                method=result.method,
+            )
+    
+    @staticmethod
+    def _rank_candidates(candidates: List[AgentInfo], required_skills: List[str]) -> List[AgentInfo]:
+        """비용이 같을 때의 선호 순서 (필요한 스킬 커버리지 높은 순, 스킬 수 적은 순, 등록 순)"""
+        def preference(agent: AgentInfo) -> tuple:
+            coverage = sum(1 for skill in required_skills if agent.has_skill(skill))
+            return (-coverage, len(agent.skills))
         
-        for skill in required_skills:
-            agent = self.find_agent_by_skill(skill, required_skills)
-            if agent:
-                skill_agent_map[skill] = agent
+        return sorted(candidates, key=preference)
+    
+    def _predicted_latencies_ms(self, skill_name: str, candidates: List[AgentInfo]) -> List[float]:
+        """후보 에이전트마다 스킬을 지금 실행했을 때의 예상 시간 (ms)"""
+        # 관측값이 없는 에이전트는 같은 스킬을 가진 다른 에이전트들의 중앙값 사용
+        observed = sorted(
+            a.skill_latency_ms[skill_name] for a in candidates if skill_name in a.skill_latency_ms
+        )
+        prior = observed[len(observed) // 2] if observed else DEFAULT_SKILL_LATENCY_MS
+        in_flight = self._in_flight
         
-        return skill_agent_map
+        latencies = []
+        for agent in candidates:
+            latency = agent.skill_latency_ms.get(skill_name, prior)
+            latency *= 1.0 + self.load_weight * in_flight.get(agent.url, 0)
+            if not agent.healthy:
+                latency += UNHEALTHY_PENALTY_MS
+            latencies.append(latency)
+        return latencies
     
     def print_agent_selection_analysis(self, skill_agent_map: Dict[str, AgentInfo]):
         """에이전트 선택 결과 분석 출력"""
@@ -272,6 +780,11 @@ class A2ADiscoveryClient:
         """
         특정 에이전트의 스킬 실행 (JSON-RPC)
         
+        일시적인 전송 오류/5xx는 retry 정책에 따라 같은 idempotency key로 재시도합니다.
+        hedge_budget을 설정하면, 응답이 이 에이전트의 p95 지연 안에 오지 않을 때
+        같은 스킬을 가진 다른 건강한 에이전트에도 요청을 보내고 먼저 성공한 응답을 사용합니다 (_hedged_call).
+        hedge는 hedge_skills에 있는 스킬만 합니다 (파일 저장, 이메일 전송처럼 부작용이 있는 스킬은 한 번만 실행).
+        
         Args:
             agent_url: 에이전트 URL
             skill_name: 스킬 이름
@@ -282,22 +795,217 @@ class A2ADiscoveryClient:
         """
         agent_url = agent_url.rstrip('/')
         
-        response = self.client.post(
-            f"{agent_url}/rpc",
-            json={
-                "jsonrpc": "2.0",
-                "method": skill_name,
-                "params": kwargs,
-                "id": 1
-            }
-        )
-        response.raise_for_status()
-        result = response.json()
+        with tracing.start_span(f"call {skill_name}", "client",
+                                {"a2a.skill": skill_name, "a2a.url": agent_url}) as span:
+            delay_ms = self._hedge_delay_ms(agent_url, skill_name) if self._hedge_budget else None
+            if delay_ms is None:
+                result, elapsed_ms = self._call(agent_url, skill_name, kwargs, 1)
+                self._record_latency(agent_url, skill_name, elapsed_ms)
+            else:
+                result = self._hedged_call(agent_url, skill_name, kwargs, delay_ms, span)
+            
+            if "error" in result:
+                span.record_error(result['error'])
+                raise Exception(f"RPC Error: {result['error']}")
+            
+            return result.get("result")
+    
+    def stream_skill(self, agent_url: str, skill_name: str,
+                     input_stream: Optional[Iterable[Any]] = None, **kwargs) -> SkillStream:
+        """
+        특정 에이전트의 스킬을 스트리밍으로 실행 (/rpc:stream)
+        
+        generator 스킬의 결과를 만들어지는 대로 받고, 스킬의 스트리밍 입력 파라미터
+        (AgentInfo.stream_input)에는 input_stream의 조각을 만들어지는 대로 보냅니다.
+        앞 단계의 SkillStream을 input_stream으로 넘기면 두 에이전트가 겹쳐서 실행됩니다.
+        입력 스트림은 다시 보낼 수 없으므로 재시도/hedge하지 않습니다.
+        
+        Args:
+            agent_url: 에이전트 URL
+            skill_name: 스킬 이름
+            input_stream: 스트리밍 입력 파라미터로 보낼 조각 (None이면 kwargs만 전달)
+            **kwargs: 스킬 파라미터
+        
+        Returns:
+            SkillStream (순회하면 조각, result()는 최종 결과). 요청은 처음 순회할 때 보냄
+        """
+        agent_url = agent_url.rstrip('/')
+        span = tracing.start_span(f"stream {skill_name}", "client",
+                                  {"a2a.skill": skill_name, "a2a.url": agent_url})
+        payload = {"jsonrpc": "2.0", "method": skill_name, "params": kwargs, "id": 1}
+        with tracing.use_context(span.context):
+            records = self._transport(agent_url).rpc_stream(payload, input_stream)
+        # 입력을 기다린 시간은 이 에이전트의 실행 시간이 아니므로 입력 스트림이 없을 때만 응답 시간 기록
+        watched = self._watch_stream(agent_url, skill_name, traced(records, span), input_stream is None)
+        return SkillStream(watched, skill_name)
+    
+    def _watch_stream(self, agent_url: str, skill_name: str, records: Iterator[Dict[str, Any]],
+                      record_latency: bool) -> Iterator[Dict[str, Any]]:
+        """스트리밍 호출의 진행 중 호출 수와 응답 시간 기록 (스트림이 끝나거나 닫힐 때)"""
+        self._track_in_flight(agent_url, 1)
+        started = time.perf_counter()
+        try:
+            yield from records
+            if record_latency:
+                self._record_latency(agent_url, skill_name, (time.perf_counter() - started) * 1000)
+        finally:
+            records.close()
+            self._track_in_flight(agent_url, -1)
+    
+    def _call(self, agent_url: str, skill_name: str, params: Dict[str, Any],
+              request_id: Any, key: Optional[str] = None) -> Tuple[Dict[str, Any], float]:
+        """
+        JSON-RPC 호출 하나 (진행 중인 호출 수 반영, 재시도 포함), (응답, 응답 시간 ms) 반환
+        
+        응답 시간은 마지막 시도만 측정합니다 (재시도 대기는 에이전트의 실행 시간이 아니므로).
+        
+        Args:
+            key: Idempotency-Key (None이면 재시도할 때만 새로 만듦, RPC_CANCEL_METHOD로 취소하려면 필요)
+        """
+        transport = self._transport(agent_url)
+        payload = {"jsonrpc": "2.0", "method": skill_name, "params": params, "id": request_id}
+        retry = self.retry if transport.lossy else NO_RETRY
+        if key is None and retry.max_attempts > 1:
+            key = uuid.uuid4().hex
+        started = 0.0
+        
+        def attempt() -> Dict[str, Any]:
+            nonlocal started
+            started = time.perf_counter()
+            return transport.rpc(payload, idempotency_key=key)
+        
+        self._track_in_flight(agent_url, 1)
+        try:
+            result = retry.call(attempt, f"call {skill_name}")
+            return result, (time.perf_counter() - started) * 1000
+        finally:
+            self._track_in_flight(agent_url, -1)
+    
+    # ============================================
+    # Hedged request
+    # ============================================
+    
+    def _hedge_delay_ms(self, agent_url: str, skill_name: str) -> Optional[float]:
+        """
+        hedge를 보내기 전에 기다릴 시간 (이 에이전트/스킬의 HEDGE_QUANTILE 지연, ms)
+        
+        hedge_skills에 없는 스킬, 관측이 부족하거나 같은 스킬을 가진 다른 에이전트가 없으면 None (hedge 안 함)
+        """
+        if skill_name not in self.hedge_skills:
+            return None
+        samples = self._latency_samples.get((agent_url, skill_name))
+        if samples is None or len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        if len(self._registry.skill_index.get(skill_name, ())) < 2:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * HEDGE_QUANTILE), len(ordered) - 1)]
+    
+    def _hedge_target(self, agent_url: str, skill_name: str) -> Optional[AgentInfo]:
+        """hedge를 보낼 에이전트 (같은 스킬을 가진 다른 건강한 에이전트 중 지금 예상 실행 시간이 가장 짧은 것)"""
+        candidates = [
+            agent for agent in self._registry.skill_index.get(skill_name, ())
+            if agent.url != agent_url and agent.healthy
+        ]
+        if not candidates:
+            return None
+        latencies = self._predicted_latencies_ms(skill_name, candidates)
+        return candidates[min(range(len(candidates)), key=latencies.__getitem__)]
+    
+    def _submit(self, fn: Callable, *args) -> Future:
+        """hedge 스레드에서 실행 (현재 trace context를 이어받음)"""
+        return self._hedge_executor.submit(contextvars.copy_context().run, fn, *args)
+    
+    def _hedged_call(self, agent_url: str, skill_name: str, params: Dict[str, Any],
+                     delay_ms: float, span) -> Dict[str, Any]:
+        """
+        hedged request
+        
+        delay_ms 안에 응답이 없으면 예산(hedge_budget)이 남아 있을 때만 다른 에이전트에 같은 요청을 보냅니다.
+        먼저 성공한 응답을 사용하고, 진 쪽은 RPC_CANCEL_METHOD로 취소합니다
+        (서버의 스킬은 다음 check_cancelled()에서 중단). 모두 실패하면 원래 에이전트의 결과/예외를 그대로 전달합니다.
+        호출마다 고유한 id와 Idempotency-Key를 보내고, 취소 요청에도 같은 키를 붙입니다.
+        
+        Returns:
+            JSON-RPC 응답 객체
+        """
+        self._hedge_budget.deposit()
+        # 취소할 수 있도록 호출마다 고유한 문자열 id와 키 사용 (에이전트 URL, id, 키)
+        attempts: Dict[Future, Tuple[str, str, str]] = {}
+        request_id, key = uuid.uuid4().hex, uuid.uuid4().hex
+        primary = self._submit(self._call, agent_url, skill_name, params, request_id, key)
+        attempts[primary] = (agent_url, request_id, key)
         
-        if "error" in result:
-            raise Exception(f"RPC Error: {result['error']}")
+        pending = {primary}
+        if not wait(pending, timeout=delay_ms / 1000)[0]:
+            backup = self._hedge_target(agent_url, skill_name)
+            if backup is not None and self._hedge_budget.withdraw():
+                request_id, key = uuid.uuid4().hex, uuid.uuid4().hex
+                hedge = self._submit(self._call, backup.url, skill_name, params, request_id, key)
+                attempts[hedge] = (backup.url, request_id, key)
+                pending.add(hedge)
+                _hedges.labels(skill_name).inc()
+                span.set_attribute("a2a.hedge_url", backup.url)
+                logger.debug("discovery.hedge_sent", skill=skill_name, primary=agent_url,
+                             backup=backup.url, delay_ms=round(delay_ms, 1))
         
-        return result.get("result")
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = attempts[future][0]
+                try:
+                    result, elapsed_ms = future.result()
+                except Exception:
+                    continue
+                self._record_latency(url, skill_name, elapsed_ms)
+                if "error" in result:
+                    continue
+                
+                # 진 쪽 취소 (응답을 기다리지 않음)
+                for loser in pending:
+                    if not loser.cancel():
+                        self._submit(self._cancel_call, *attempts[loser])
+                if future is not primary:
+                    _hedge_wins.labels(skill_name).inc()
+                    span.set_attribute("a2a.hedge_won", True)
+                return result
+        
+        # 모두 실패: 원래 에이전트의 오류 응답 또는 예외
+        return primary.result()[0]
+    
+    def _cancel_call(self, agent_url: str, request_id: str, key: str):
+        """hedged request에서 진 호출 취소 (실패해도 무시, 취소를 모르는 에이전트는 끝까지 실행)"""
+        try:
+            self._transport(agent_url).rpc({
+                "jsonrpc": "2.0",
+                "method": RPC_CANCEL_METHOD,
+                "params": {"id": request_id},
+                "id": None
+            }, idempotency_key=key)
+        except Exception as e:
+            logger.debug("discovery.hedge_cancel_failed", url=agent_url, error=str(e))
+    
+    def _track_in_flight(self, agent_url: str, delta: int):
+        with self._in_flight_lock:
+            count = self._in_flight.get(agent_url, 0) + delta
+            if count > 0:
+                self._in_flight[agent_url] = count
+            else:
+                self._in_flight.pop(agent_url, None)
+    
+    def _record_latency(self, agent_url: str, skill_name: str, elapsed_ms: float, alpha: float = 0.2):
+        """스킬 응답 시간을 EWMA와 최근 관측 창에 기록 (레지스트리 교체 없이 제자리 갱신)"""
+        agent = self._registry.agents.get(agent_url)
+        if agent is None:
+            return
+        samples = self._latency_samples.get((agent_url, skill_name))
+        if samples is None:
+            samples = self._latency_samples.setdefault((agent_url, skill_name), deque(maxlen=LATENCY_WINDOW))
+        samples.append(elapsed_ms)
+        previous = agent.skill_latency_ms.get(skill_name)
+        agent.skill_latency_ms[skill_name] = (
+            elapsed_ms if previous is None else previous + alpha * (elapsed_ms - previous)
+        )
     
     def smart_execute(self, skill_name: str, **kwargs) -> Any:
         """
@@ -339,6 +1047,15 @@ class A2ADiscoveryClient:
     
     def close(self):
         """클라이언트 종료"""
+        self.stop_background_refresh()
+        if self._hedge_executor is not None:
+            # 진 hedge 호출은 기다리지 않음 (취소 요청을 보냈거나 응답을 버림)
+            self._hedge_executor.shutdown(wait=False)
+        if self.cache_path:
+            self.save_cache()
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
         self.client.close()
     
     def __enter__(self):
@@ -348,5 +1065,5 @@ class A2ADiscoveryClient:
         self.close()
 
 
-__all__ = ['A2ADiscoveryClient', 'AgentInfo']
+__all__ = ['A2ADiscoveryClient', 'AgentInfo', 'PipelineAssignment', 'DEFAULT_CACHE_PATH']
 
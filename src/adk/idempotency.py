@@ -0,0 +1,136 @@
+"""
+A2A Agent Development Kit - Idempotency Keys
+재시도한 JSON-RPC 호출이 스킬을 두 번 실행하지 않도록 결과를 키별로 보관
+
+클라이언트는 논리적 호출 하나마다 키를 만들고, 재시도할 때도 같은 키를 IDEMPOTENCY_HEADER로 보냅니다.
+서버는 (스킬, 키)별로
+    - 처음 보는 키      스킬을 실행하고 성공한 응답을 ttl 동안 보관
+    - 실행 중인 키      먼저 온 실행이 끝나기를 기다려 같은 응답을 반환 (동시에 도착한 재시도)
+    - 보관 중인 키      스킬을 실행하지 않고 보관한 응답을 반환
+합니다. 오류 응답은 보관하지 않으므로 같은 키로 재시도하면 다시 실행됩니다.
+같은 키를 다른 파라미터로 보내면 거절합니다.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# 보관할 최대 키 수 / 보관 시간 (초)
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 600.0
+
+
+class IdempotencyConflictError(ValueError):
+    """같은 idempotency key를 다른 파라미터로 다시 사용함"""
+    pass
+
+
+def fingerprint(params: Any) -> str:
+    """파라미터 지문 (키 재사용 검사용, 키 순서와 무관)"""
+    encoded = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("future", "fingerprint", "expires_at")
+    
+    def __init__(self, future: Future, fingerprint: str):
+        self.future = future
+        self.fingerprint = fingerprint
+        self.expires_at: Optional[float] = None  # 실행 중이면 None
+
+
+class IdempotencyCache:
+    """
+    idempotency key → JSON-RPC 응답 (LRU, 크기/시간 제한)
+    
+    실행 중인 항목은 concurrent.futures.Future로 공유하므로
+    스레드(in-process 전송)와 이벤트 루프(asyncio.wrap_future) 모두에서 기다릴 수 있습니다.
+    
+    Usage:
+        future, owner = cache.begin("write", key, params)
+        if not owner:
+            return future.result()          # 먼저 온 실행의 응답
+        response = run()
+        cache.finish("write", key, future, response)
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            max_entries: 보관할 최대 키 수 (넘으면 오래 쓰지 않은 키부터 제거)
+            ttl: 성공한 응답을 보관할 시간 (초)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def begin(self, method: str, key: str, params: Any) -> Tuple[Future, bool]:
+        """
+        키 사용 시작
+        
+        Returns:
+            (응답 Future, 이 호출이 실행해야 하는지 여부)
+            실행하지 않아도 되면 Future는 이미 끝났거나 먼저 온 실행이 끝날 때 완료됩니다.
+        
+        Raises:
+            IdempotencyConflictError: 같은 키가 다른 파라미터로 사용 중이거나 보관 중일 때
+        """
+        digest = fingerprint(params)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((method, key))
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+                del self._entries[(method, key)]
+                entry = None
+            if entry is not None:
+                if entry.fingerprint != digest:
+                    raise IdempotencyConflictError(f"Idempotency key '{key}' was used with different params")
+                self._entries.move_to_end((method, key))
+                return entry.future, False
+            
+            entry = _Entry(Future(), digest)
+            self._entries[(method, key)] = entry
+            # 실행 중인 항목이 밀려나도 기다리는 쪽은 Future를 들고 있으므로 응답을 받음
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return entry.future, True
+    
+    def finish(self, method: str, key: str, future: Future, response: Dict[str, Any]):
+        """실행 결과 기록 (성공한 응답만 보관, 기다리던 호출은 응답을 받음)"""
+        with self._lock:
+            entry = self._entries.get((method, key))
+            if entry is not None and entry.future is future:
+                if "error" in response:
+                    del self._entries[(method, key)]
+                else:
+                    entry.expires_at = time.monotonic() + self.ttl
+        future.set_result(response)
+
+
+def replay(response: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
+    """보관한 응답을 이번 요청의 id로 반환"""
+    if response.get("id") == request_id:
+        return response
+    return {**response, "id": request_id}
+
+
+__all__ = [
+    'IdempotencyCache',
+    'IdempotencyConflictError',
+    'IDEMPOTENCY_HEADER',
+    'DEFAULT_MAX_ENTRIES',
+    'DEFAULT_TTL',
+    'fingerprint',
+    'replay',
+]
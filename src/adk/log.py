@@ -0,0 +1,318 @@
+"""
+A2A Agent Development Kit - Logging
+structlog 기반 구조화 로깅 (레벨, JSON 출력, 큐 기반 비동기 출력)
+
+로그 호출은 이벤트를 큐에 넣기만 하고, 포맷과 출력은 전용 리스너 스레드가 처리합니다.
+스킬이나 RPC 핸들러가 콘솔/파일 I/O를 기다리지 않습니다.
+
+    from src.adk.log import get_logger
+    
+    logger = get_logger("a2a.discovery")
+    logger.warning("agent.register_failed", url=agent_url, error=str(e))
+    
+    → 2026-10-19T09:12:03.512Z [warning  ] agent.register_failed  [a2a.discovery] url=http://... error=...
+    → {"event": "agent.register_failed", "url": "...", "level": "warning", "logger": "a2a.discovery", ...}
+
+trace 안에서 기록한 로그에는 trace_id / span_id가 함께 남습니다.
+
+get_logger()는 지연 로거를 반환하므로 import만으로는 아무것도 설정하지 않습니다.
+처음 로그를 기록할 때(또는 configure_logging()을 호출할 때) 설정하고 리스너 스레드를 시작합니다.
+structlog 전역 설정(structlog.configure)은 건드리지 않으므로 호스트 애플리케이션의 structlog 설정과 충돌하지 않습니다.
+
+환경 변수 (configure_logging()에서 인자가 없으면 읽음, 기본은 처음 로그를 기록할 때):
+    A2A_LOG_LEVEL     DEBUG / INFO (기본) / WARNING / ERROR
+    A2A_LOG_FORMAT    console (기본) / json
+    A2A_VERBOSE       1이면 파이프라인/서버 배너 출력 (기본: 꺼짐)
+"""
+import atexit
+import datetime
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+import structlog
+
+from . import tracing
+
+
+_LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "WARN": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+# 모든 ADK 로거 이름의 접두사
+ROOT_LOGGER = "a2a"
+
+_lock = threading.Lock()
+_init_lock = threading.Lock()
+_writer: Optional["_QueueWriter"] = None
+_verbose: Optional[bool] = None
+
+# 현재 설정 (configure_logging이 교체, _generation이 바뀌면 지연 로거가 다시 만듦)
+_processors: Tuple[Any, ...] = ()
+_wrapper_class: Any = None
+_generation = 0
+
+
+class _QueueWriter:
+    """
+    이벤트를 렌더링하여 스트림에 쓰는 리스너 스레드
+    
+    호출한 스레드는 SimpleQueue.put()만 하므로 출력이 느려도(파이프, 원격 터미널) 기다리지 않습니다.
+    """
+    
+    def __init__(self, renderer: Any, stream: Optional[TextIO]):
+        self.renderer = renderer
+        self.stream = stream
+        self.queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._loop, name="a2a-log-writer", daemon=True)
+        self._thread.start()
+    
+    def _write(self, item: Tuple[float, str, Dict[str, Any]]):
+        created, method_name, event_dict = item
+        event_dict["timestamp"] = datetime.datetime.fromtimestamp(
+            created, datetime.timezone.utc
+        ).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        stream = self.stream or sys.stderr
+        try:
+            stream.write(self.renderer(None, method_name, event_dict) + "\n")
+        except Exception:
+            pass  # 로그 출력 실패가 서버를 멈추지 않도록
+    
+    def _loop(self):
+        while True:
+            item = self.queue.get()
+            if isinstance(item, threading.Event):
+                (self.stream or sys.stderr).flush()
+                item.set()
+                continue
+            if item is None:
+                return
+            self._write(item)
+            if self.queue.empty():
+                (self.stream or sys.stderr).flush()
+    
+    def flush(self, timeout: float = 5.0):
+        """지금까지 넣은 이벤트가 모두 출력될 때까지 대기"""
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+    
+    def close(self, timeout: float = 5.0):
+        self.flush(timeout)
+        self.queue.put(None)
+        self._thread.join(timeout)
+
+
+class _QueueLogger:
+    """structlog이 최종 이벤트를 넘기는 로거 (리스너 큐에 넣기만 함)"""
+    
+    __slots__ = ("name",)
+    
+    def __init__(self, name: str = ROOT_LOGGER):
+        self.name = name
+    
+    def _enqueue(self, method_name: str, event_dict: Dict[str, Any]):
+        writer = _writer
+        if writer is not None:
+            writer.queue.put((event_dict.pop("_created"), method_name, event_dict))
+    
+    def debug(self, event_dict: Dict[str, Any]):
+        self._enqueue("debug", event_dict)
+    
+    def info(self, event_dict: Dict[str, Any]):
+        self._enqueue("info", event_dict)
+    
+    def warning(self, event_dict: Dict[str, Any]):
+        self._enqueue("warning", event_dict)
+    
+    def error(self, event_dict: Dict[str, Any]):
+        self._enqueue("error", event_dict)
+    
+    def critical(self, event_dict: Dict[str, Any]):
+        self._enqueue("critical", event_dict)
+    
+    msg = info
+    warn = warning
+    exception = error
+    fatal = critical
+
+
+def _add_context(logger: _QueueLogger, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """로거 이름, 기록 시각, 현재 trace context (호출한 스레드에서 실행해야 함)"""
+    event_dict["logger"] = logger.name
+    event_dict["_created"] = time.time()
+    ctx = tracing.current_context()
+    if ctx is not None:
+        event_dict["trace_id"] = ctx.trace_id
+        event_dict["span_id"] = ctx.span_id
+    return event_dict
+
+
+def _to_queue(logger: _QueueLogger, method_name: str, event_dict: Dict[str, Any]) -> Tuple[tuple, dict]:
+    return (event_dict,), {}
+
+
+class _LazyLogger:
+    """
+    get_logger()가 반환하는 지연 로거
+    
+    모듈 전역(logger = get_logger(...))으로 만들어 두어도 처음 기록할 때 로깅을 설정하고,
+    configure_logging()으로 레벨/형식이 바뀌면 다음 기록부터 새 설정을 사용합니다.
+    """
+    
+    __slots__ = ("name", "_context", "_bound", "_generation")
+    
+    def __init__(self, name: str, context: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self._context = context or {}
+        self._bound: Any = None
+        self._generation = -1
+    
+    def _resolve(self) -> Any:
+        _ensure_configured()
+        generation = _generation
+        bound = self._bound
+        if bound is None or self._generation != generation:
+            # 호출 스레드에서는 레벨 확인(비활성 레벨은 no-op), context 수집, 큐 전달만 수행
+            bound = structlog.wrap_logger(
+                _QueueLogger(self.name), processors=list(_processors), wrapper_class=_wrapper_class,
+                **self._context
+            )
+            self._bound, self._generation = bound, generation
+        return bound
+    
+    def bind(self, **new_values: Any) -> "_LazyLogger":
+        """context를 추가한 새 지연 로거"""
+        return _LazyLogger(self.name, {**self._context, **new_values})
+    
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+    
+    def __repr__(self) -> str:
+        return f"<_LazyLogger {self.name!r}>"
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None,
+                      stream: Optional[TextIO] = None, verbose: Optional[bool] = None):
+    """
+    ADK 로깅 설정 (다시 호출하면 기존 설정 교체, 이미 만든 로거도 새 설정을 따름)
+    
+    ADK 로거에만 적용되며 structlog 전역 설정은 바꾸지 않습니다.
+    
+    Args:
+        level: 로그 레벨 (None이면 A2A_LOG_LEVEL, 기본 INFO)
+        fmt: "console" 또는 "json" (None이면 A2A_LOG_FORMAT, 기본 console)
+        stream: 출력 스트림 (기본 sys.stderr)
+        verbose: 배너 출력 여부 (None이면 A2A_VERBOSE)
+    
+    Raises:
+        ValueError: 알 수 없는 레벨 또는 형식
+    """
+    global _writer, _verbose, _processors, _wrapper_class, _generation
+    
+    level_name = (level or os.getenv("A2A_LOG_LEVEL") or "INFO").upper()
+    if level_name not in _LEVELS:
+        raise ValueError(f"Unknown log level: '{level_name}'")
+    fmt = (fmt or os.getenv("A2A_LOG_FORMAT") or "console").lower()
+    if fmt not in ("console", "json"):
+        raise ValueError(f"Unknown log format: '{fmt}'")
+    
+    renderer = (
+        structlog.processors.JSONRenderer(ensure_ascii=False) if fmt == "json"
+        else structlog.dev.ConsoleRenderer(colors=False)
+    )
+    
+    with _lock:
+        previous, _writer = _writer, _QueueWriter(renderer, stream)
+        _processors = (
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            _add_context,
+            structlog.processors.format_exc_info,
+            _to_queue,
+        )
+        _wrapper_class = structlog.make_filtering_bound_logger(_LEVELS[level_name])
+        _generation += 1
+        _verbose = verbose if verbose is not None else os.getenv("A2A_VERBOSE", "").lower() in ("1", "true", "yes")
+    
+    if previous is not None:
+        previous.close()
+
+
+def _ensure_configured():
+    if _writer is None:
+        with _init_lock:
+            if _writer is None:
+                configure_logging()
+
+
+def get_logger(name: str = ROOT_LOGGER) -> Any:
+    """
+    구조화 로거 (지연 로거: 처음 기록할 때 환경 변수로 로깅 설정)
+    
+    Args:
+        name: 로거 이름 ("a2a." 접두사가 없으면 붙임)
+    """
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return _LazyLogger(name)
+
+
+def flush_logging(timeout: float = 5.0):
+    """큐에 남은 로그가 모두 출력될 때까지 대기"""
+    writer = _writer
+    if writer is not None:
+        writer.flush(timeout)
+
+
+def is_verbose() -> bool:
+    """배너 출력 여부 (A2A_VERBOSE 또는 configure_logging(verbose=True))"""
+    _ensure_configured()
+    return bool(_verbose)
+
+
+def banner(*lines: str, char: str = "=", width: int = 80):
+    """
+    구분선 배너 출력 (verbose일 때만)
+        
+        banner(" Step 1: 쿼리 분석", char="─")
+    """
+    if not is_verbose():
+        return
+    print(char * width)
+    for line in lines:
+        print(line)
+    print(char * width)
+    print()
+
+
+def echo(*args: Any, **kwargs: Any):
+    """print()와 같지만 verbose일 때만 출력 (진행 상황 안내용)"""
+    if is_verbose():
+        print(*args, **kwargs)
+
+
+@atexit.register
+def _shutdown():
+    writer = _writer
+    if writer is not None:
+        writer.flush()
+
+
+__all__ = [
+    'configure_logging',
+    'get_logger',
+    'flush_logging',
+    'is_verbose',
+    'banner',
+    'echo',
+    'ROOT_LOGGER',
+]
@@ -0,0 +1,346 @@
+"""
+A2A Agent Development Kit - Metrics
+Prometheus 텍스트 형식으로 내보내는 가벼운 카운터/게이지/히스토그램
+
+값은 스레드별 샤드(threading.local)에 기록합니다.
+각 스레드는 자기 샤드만 쓰므로 기록 경로에 락이 없고, /metrics 조회 시에만 샤드를 합산합니다.
+스레드가 끝나면 그 샤드는 기본 샤드에 합쳐지므로, 스레드를 계속 만들어도 샤드 수는 늘어나지 않습니다.
+
+    from src.adk import metrics
+
+    calls = metrics.REGISTRY.counter("my_calls_total", "호출 수", ("skill",))
+    calls.labels("write").inc()
+
+    latency = metrics.REGISTRY.histogram("my_latency_seconds", "지연", ("skill",))
+    latency.labels("write").observe(0.42)
+
+    print(metrics.REGISTRY.render())
+"""
+import bisect
+import collections
+import itertools
+import math
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 스킬 실행 지연 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# LLM API 호출 지연 (초)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value)
+
+
+class _Child:
+    """레이블 값이 정해진 메트릭 (기록 경로)"""
+
+    __slots__ = ("_registry", "_key")
+
+    def __init__(self, registry: "MetricsRegistry", key: Tuple):
+        self._registry = registry
+        self._key = key
+
+
+class CounterChild(_Child):
+    __slots__ = ()
+
+    def inc(self, amount: float = 1):
+        values = self._registry._shard()
+        values[self._key] = values.get(self._key, 0) + amount
+
+
+class GaugeChild(_Child):
+    __slots__ = ()
+
+    def inc(self, amount: float = 1):
+        values = self._registry._shard()
+        values[self._key] = values.get(self._key, 0) + amount
+
+    def dec(self, amount: float = 1):
+        values = self._registry._shard()
+        values[self._key] = values.get(self._key, 0) - amount
+
+
+class HistogramChild(_Child):
+    __slots__ = ("_bounds",)
+
+    def __init__(self, registry: "MetricsRegistry", key: Tuple, bounds: Tuple[float, ...]):
+        super().__init__(registry, key)
+        self._bounds = bounds
+
+    def observe(self, value: float):
+        values = self._registry._shard()
+        data = values.get(self._key)
+        if data is None:
+            # [버킷별 개수..., +Inf 버킷, 합계, 개수]
+            data = values[self._key] = [0] * (len(self._bounds) + 1) + [0.0, 0]
+        data[bisect.bisect_left(self._bounds, value)] += 1
+        data[-2] += value
+        data[-1] += 1
+
+
+class _Metric:
+    kind = ""
+    child_class = _Child
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help: str, labelnames: Sequence[str]):
+        self._registry = registry
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple, _Child] = {}
+
+    def labels(self, *values: Any) -> Any:
+        """
+        레이블 값이 정해진 하위 메트릭 (캐시됨 - 핫 패스에서는 미리 받아 두고 재사용)
+
+        Raises:
+            ValueError: 레이블 개수가 맞지 않을 때
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        values = tuple(str(v) for v in values)
+        child = self._children.get(values)
+        if child is None:
+            child = self._children.setdefault(values, self._make_child((self.name,) + values))
+        return child
+
+    def _make_child(self, key: Tuple) -> _Child:
+        return self.child_class(self._registry, key)
+
+    def _samples(self, totals: Dict[Tuple, Any]) -> List[str]:
+        lines = []
+        for labels in list(self._children):
+            value = totals.get((self.name,) + labels, 0)
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+    child_class = CounterChild
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+    child_class = GaugeChild
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+    child_class = HistogramChild
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help: str, labelnames: Sequence[str],
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(registry, name, help, labelnames)
+        self.bounds = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+
+    def _make_child(self, key: Tuple) -> _Child:
+        return HistogramChild(self._registry, key, self.bounds)
+
+    def _samples(self, totals: Dict[Tuple, Any]) -> List[str]:
+        lines = []
+        empty = [0] * (len(self.bounds) + 1) + [0.0, 0]
+        for labels in list(self._children):
+            data = totals.get((self.name,) + labels, empty)
+            cumulative = 0
+            for bound, count in zip(self.bounds + (math.inf,), data):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(float(data[-2]))}")
+            lines.append(f"{self.name}_count{label_text} {data[-1]}")
+        return lines
+
+
+class _CallbackGauge:
+    """조회 시점에 값을 계산하는 게이지 (큐 길이 등)"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._callbacks: List[Callable[[], Optional[Callable]]] = []
+
+    def add(self, fn: Callable[[], Iterable[Tuple[Sequence[Any], float]]]):
+        # 바운드 메서드는 약한 참조로 보관 (서버가 사라지면 자동 제거)
+        ref = weakref.WeakMethod(fn) if hasattr(fn, "__self__") else (lambda: fn)
+        self._callbacks.append(ref)
+
+    def _samples(self, totals: Dict[Tuple, Any]) -> List[str]:
+        lines = []
+        alive = []
+        for ref in self._callbacks:
+            fn = ref()
+            if fn is None:
+                continue
+            alive.append(ref)
+            for labels, value in fn():
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        self._callbacks = alive
+        return lines
+
+
+def _merge(totals: Dict[Tuple, Any], shard: Dict[Tuple, Any]):
+    """샤드 값을 totals에 더하기 (히스토그램은 버킷별로)"""
+    for key, value in shard.copy().items():
+        if isinstance(value, list):
+            current = totals.get(key)
+            if current is None:
+                totals[key] = list(value)
+            else:
+                for i, v in enumerate(value):
+                    current[i] += v
+        else:
+            totals[key] = totals.get(key, 0) + value
+
+
+class _ShardOwner:
+    """스레드가 끝나면 threading.local과 함께 사라지는 객체 (샤드 회수 시점 감지용)"""
+
+    __slots__ = ("__weakref__",)
+
+
+class MetricsRegistry:
+    """
+    메트릭 모음
+
+    같은 이름으로 다시 등록하면 기존 메트릭을 반환하므로,
+    한 프로세스의 여러 A2AServer가 하나의 레지스트리를 공유할 수 있습니다 (agent 레이블로 구분).
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: Dict[int, Dict[Tuple, Any]] = {}  # 살아 있는 스레드의 샤드
+        self._base: Dict[Tuple, Any] = {}  # 끝난 스레드의 샤드를 합친 값
+        self._shard_ids = itertools.count()
+        # 끝난 스레드의 샤드 ID (finalizer는 어느 스레드에서나 실행될 수 있으므로 락 없이 추가만 함)
+        self._retired: collections.deque = collections.deque()
+
+    def _shard(self) -> Dict[Tuple, Any]:
+        """현재 스레드의 샤드 (처음 기록할 때 한 번만 락 사용)"""
+        try:
+            return self._local.values
+        except AttributeError:
+            values: Dict[Tuple, Any] = {}
+            owner = _ShardOwner()
+            with self._lock:
+                self._collect_retired()
+                shard_id = next(self._shard_ids)
+                self._shards[shard_id] = values
+            weakref.finalize(owner, self._retired.append, shard_id)
+            self._local.values = values
+            self._local.owner = owner
+            return values
+
+    def _collect_retired(self):
+        """끝난 스레드의 샤드를 기본 샤드에 합치고 제거 (self._lock을 잡은 상태에서 호출)"""
+        while self._retired:
+            shard = self._shards.pop(self._retired.popleft(), None)
+            if shard is not None:
+                _merge(self._base, shard)
+
+    def _register(self, name: str, factory: Callable[[], Any], kind: str) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            elif metric.kind != kind:
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """단조 증가 카운터"""
+        return self._register(name, lambda: Counter(self, name, help, labelnames), "counter")
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """증감 게이지"""
+        return self._register(name, lambda: Gauge(self, name, help, labelnames), "gauge")
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """히스토그램 (버킷 상한 기준 누적 개수 + 합계 + 개수)"""
+        return self._register(name, lambda: Histogram(self, name, help, labelnames, buckets), "histogram")
+
+    def gauge_callback(self, name: str, help: str, labelnames: Sequence[str],
+                       fn: Callable[[], Iterable[Tuple[Sequence[Any], float]]]):
+        """
+        조회 시점에 계산하는 게이지 등록
+
+        Args:
+            fn: [(레이블 값 튜플, 값), ...]을 반환하는 함수 (바운드 메서드는 약한 참조로 보관)
+        """
+        metric = self._register(name, lambda: _CallbackGauge(name, help, labelnames), "gauge")
+        if not isinstance(metric, _CallbackGauge):
+            raise ValueError(f"Metric '{name}' is not a callback gauge")
+        metric.add(fn)
+
+    def _totals(self) -> Dict[Tuple, Any]:
+        """기본 샤드와 살아 있는 모든 스레드 샤드 합산"""
+        totals: Dict[Tuple, Any] = {}
+        with self._lock:
+            self._collect_retired()
+            _merge(totals, self._base)
+            shards = list(self._shards.values())
+        for shard in shards:
+            _merge(totals, shard)
+        return totals
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        totals = self._totals()
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            samples = metric._samples(totals)
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 기본 레지스트리 (A2AServer, llm_gemini가 공유)
+REGISTRY = MetricsRegistry()
+
+
+__all__ = [
+    'MetricsRegistry',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'REGISTRY',
+    'CONTENT_TYPE',
+    'DEFAULT_BUCKETS',
+    'LLM_BUCKETS',
+]
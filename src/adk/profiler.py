@@ -0,0 +1,229 @@
+"""
+A2A Agent Development Kit - Sampling Profiler
+실행 중인 프로세스를 재시작하지 않고 잠깐 프로파일링하여 flamegraph용 collapsed stack 생성
+
+    cpu      일정 간격으로 모든 스레드의 Python 스택을 샘플링 (sys._current_frames)
+             → 값은 샘플 수 (스택이 관찰된 횟수)
+    memory   tracemalloc으로 구간 동안 할당되어 끝날 때까지 남아 있는 메모리 추적
+             → 값은 바이트 수
+
+출력은 Brendan Gregg의 collapsed 형식입니다 (한 줄에 스택 하나, 루트부터 ';'로 구분):
+
+    a2a-worker;threading:Thread._bootstrap;...;src.llm_gemini:generate_text 412
+
+flamegraph.pl, speedscope, inferno 등에 그대로 넣을 수 있습니다.
+A2AServer(enable_profiler=True)이면 GET /admin/profile로 노출됩니다 (localhost에서만).
+
+    curl -o writer.folded "http://127.0.0.1:8003/admin/profile?seconds=15"
+    flamegraph.pl writer.folded > writer.svg
+"""
+import collections
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, Mapping, Optional
+
+
+MODES = ("cpu", "memory")
+
+# 한 번에 프로파일링할 수 있는 최대 시간 (초)
+MAX_DURATION = 60.0
+# cpu 샘플링 간격 (초, 기본 100Hz)
+DEFAULT_INTERVAL = 0.01
+MIN_INTERVAL = 0.001
+# memory 모드에서 할당 위치마다 보관할 프레임 수
+DEFAULT_DEPTH = 32
+
+# 대기 중인 스레드의 맨 위 프레임 (파일 이름, 함수 이름)
+# 락/큐/소켓/셀렉터에서 잠든 스레드는 CPU를 쓰지 않으므로 기본적으로 샘플에서 제외
+_IDLE_FRAMES = frozenset({
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("socket.py", "accept"),
+    ("thread.py", "_worker"),
+})
+
+
+class ProfilerBusyError(RuntimeError):
+    """다른 프로파일이 이미 실행 중"""
+
+
+# 프로세스당 동시에 하나의 프로파일만 (샘플링 자체도 부하이므로)
+_busy = threading.Lock()
+
+
+def _check_duration(duration: float):
+    if not 0 < duration <= MAX_DURATION:
+        raise ValueError(f"duration must be in (0, {MAX_DURATION:g}] seconds, got {duration}")
+
+
+def _sanitize(name: str) -> str:
+    """collapsed 형식의 구분자(';', 줄바꿈)가 이름에 들어가지 않도록 치환"""
+    return name.replace(";", ":").replace("\n", " ")
+
+
+def _frame_label(frame, lines: bool) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or os.path.basename(code.co_filename)
+    label = f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+    if lines:
+        label = f"{label}:{frame.f_lineno}"
+    return _sanitize(label)
+
+
+def _is_idle(frame) -> bool:
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES
+
+
+def sample_stacks(duration: float, interval: float = DEFAULT_INTERVAL,
+                  include_idle: bool = False, lines: bool = False) -> Dict[str, int]:
+    """
+    모든 스레드의 스택을 duration초 동안 interval 간격으로 샘플링 (호출한 스레드에서 실행)
+    
+    Args:
+        duration: 샘플링 시간 (초, 최대 MAX_DURATION)
+        interval: 샘플 간격 (초)
+        include_idle: 락/큐/소켓에서 대기 중인 스레드도 포함
+        lines: 프레임에 줄 번호 포함 (같은 함수라도 줄마다 나뉨)
+    
+    Returns:
+        {collapsed 스택: 샘플 수} (스택은 스레드 이름부터 시작)
+    
+    Raises:
+        ValueError: duration 또는 interval이 범위를 벗어남
+    """
+    _check_duration(duration)
+    if not MIN_INTERVAL <= interval <= duration:
+        raise ValueError(f"interval must be in [{MIN_INTERVAL}, duration], got {interval}")
+    
+    own = threading.get_ident()
+    counts: Dict[str, int] = collections.Counter()
+    thread_names: Dict[int, str] = {}
+    
+    deadline = time.monotonic() + duration
+    next_tick = time.monotonic()
+    while next_tick < deadline:
+        frames = sys._current_frames()
+        if not thread_names.keys() >= frames.keys():
+            thread_names = {t.ident: _sanitize(t.name) for t in threading.enumerate()}
+        
+        for ident, frame in frames.items():
+            if ident == own or (not include_idle and _is_idle(frame)):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame, lines))
+                frame = frame.f_back
+            stack.append(thread_names.get(ident, f"thread-{ident}"))
+            stack.reverse()
+            counts[";".join(stack)] += 1
+        del frames
+        
+        next_tick += interval
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # 샘플링이 간격보다 오래 걸리면 밀린 틱은 건너뜀
+            next_tick = time.monotonic()
+    
+    return dict(counts)
+
+
+def sample_allocations(duration: float, depth: int = DEFAULT_DEPTH) -> Dict[str, int]:
+    """
+    duration초 동안 할당되어 끝날 때까지 해제되지 않은 메모리를 할당 위치별로 집계
+    
+    tracemalloc이 꺼져 있으면 이 구간 동안만 켭니다 (켜져 있는 동안 할당이 느려짐).
+    
+    Args:
+        duration: 추적 시간 (초, 최대 MAX_DURATION)
+        depth: 할당 위치마다 보관할 프레임 수 (tracemalloc이 이미 켜져 있으면 기존 설정 사용)
+    
+    Returns:
+        {collapsed 스택: 증가한 바이트 수} (프레임은 "파일:줄")
+    
+    Raises:
+        ValueError: duration이 범위를 벗어남
+    """
+    _check_duration(duration)
+    
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(depth)
+    try:
+        before = tracemalloc.take_snapshot()
+        time.sleep(duration)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+    
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    before = before.filter_traces(exclude)
+    after = after.filter_traces(exclude)
+    
+    counts: Dict[str, int] = collections.Counter()
+    for stat in after.compare_to(before, "traceback"):
+        if stat.size_diff <= 0:
+            continue
+        # tracemalloc의 Traceback은 오래된 프레임(루트)부터 정렬됨
+        stack = ";".join(
+            _sanitize(f"{os.path.basename(f.filename)}:{f.lineno}") for f in stat.traceback
+        )
+        counts[stack] += stat.size_diff
+    return dict(counts)
+
+
+def collapse(stacks: Mapping[str, int]) -> str:
+    """{스택: 값} → collapsed 형식 텍스트 (값이 큰 스택부터)"""
+    lines = [f"{stack} {value}" for stack, value in sorted(stacks.items(), key=lambda kv: -kv[1])]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def profile(mode: str = "cpu", duration: float = 10.0, interval: float = DEFAULT_INTERVAL,
+            include_idle: bool = False, lines: bool = False, depth: Optional[int] = None) -> str:
+    """
+    프로파일을 실행하고 collapsed stack 텍스트 반환 (프로세스당 동시에 하나만)
+    
+    Args:
+        mode: "cpu" (스택 샘플링) 또는 "memory" (tracemalloc)
+        duration: 프로파일링 시간 (초)
+        interval: cpu 샘플 간격 (초)
+        include_idle: cpu - 대기 중인 스레드 포함
+        lines: cpu - 프레임에 줄 번호 포함
+        depth: memory - 할당 위치마다 보관할 프레임 수
+    
+    Raises:
+        ValueError: 알 수 없는 mode 또는 범위를 벗어난 인자
+        ProfilerBusyError: 다른 프로파일이 실행 중
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown profile mode: '{mode}' (expected one of {', '.join(MODES)})")
+    if not _busy.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running in this process")
+    try:
+        if mode == "cpu":
+            stacks = sample_stacks(duration, interval, include_idle, lines)
+        else:
+            stacks = sample_allocations(duration, depth or DEFAULT_DEPTH)
+    finally:
+        _busy.release()
+    return collapse(stacks)
+
+
+__all__ = [
+    'profile',
+    'sample_stacks',
+    'sample_allocations',
+    'collapse',
+    'ProfilerBusyError',
+    'MODES',
+    'MAX_DURATION',
+    'DEFAULT_INTERVAL',
+]
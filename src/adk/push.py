@@ -0,0 +1,359 @@
+"""
+A2A Agent Development Kit - Push Notifications
+Task 완료 이벤트를 webhook으로 전달 (AgentCapabilities.push)
+
+서버 쪽: PushNotifier가 제한된 크기의 큐에서 이벤트를 꺼내 재시도와 함께 POST
+클라이언트 쪽: PushReceiver가 작은 HTTP 서버로 이벤트를 받아 Task별로 보관
+
+서버가 클라이언트가 준 URL로 요청을 보내므로(SSRF), webhook은 http/https이고 공인 주소로
+해석되는 URL만 허용합니다. loopback/사설/link-local(클라우드 메타데이터) 주소의 수신기를 쓰려면
+allowlist(A2AServer(push_allowlist=...) 또는 A2A_PUSH_ALLOWLIST)에 호스트나 네트워크를 추가합니다.
+    A2A_PUSH_ALLOWLIST=127.0.0.1,10.0.0.0/8,receiver.internal
+
+Usage:
+    with PushReceiver(port=9300) as receiver:
+        task = client.create_task(input_data={...}, metadata={"skill": "write"},
+                                  push_url=receiver.url)
+        event = receiver.wait(task["taskId"], timeout=300)
+        print(event["data"]["task"]["output"])
+"""
+import ipaddress
+import os
+import queue
+import random
+import socket
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Iterable, Optional, Callable, Tuple, Union
+from urllib.parse import urlsplit
+
+import httpx
+
+from . import codec
+from .log import get_logger
+
+logger = get_logger("a2a.push")
+
+
+PUSH_TOKEN_HEADER = "X-A2A-Notification-Token"
+
+_Address = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+
+# ============================================
+# Webhook URL 검증 (SSRF 방지)
+# ============================================
+
+class PushURLError(ValueError):
+    """허용하지 않는 webhook URL"""
+    pass
+
+
+class PushAllowlist:
+    """
+    공인 주소가 아니어도 webhook으로 허용할 호스트 이름 / IP 네트워크
+    
+    PushAllowlist(["127.0.0.1", "10.0.0.0/8", "receiver.internal"])
+    """
+    
+    def __init__(self, entries: Iterable[str] = ()):
+        self.hosts = set()
+        self.networks = []
+        for entry in entries:
+            entry = entry.strip().lower()
+            if not entry:
+                continue
+            try:
+                self.networks.append(ipaddress.ip_network(entry, strict=False))
+            except ValueError:
+                self.hosts.add(entry.rstrip("."))
+    
+    @classmethod
+    def from_env(cls) -> "PushAllowlist":
+        """A2A_PUSH_ALLOWLIST (쉼표로 구분)"""
+        return cls(os.getenv("A2A_PUSH_ALLOWLIST", "").split(","))
+    
+    def allows_host(self, host: str) -> bool:
+        return host.lower().rstrip(".") in self.hosts
+    
+    def allows_address(self, address: _Address) -> bool:
+        return any(address in network for network in self.networks)
+
+
+def _is_public(address: _Address) -> bool:
+    """공인 unicast 주소인지 (loopback, 사설, link-local, 예약, multicast가 아님)"""
+    return address.is_global and not address.is_multicast
+
+
+def check_push_url(url: str, allowlist: Optional[PushAllowlist] = None, resolve: bool = True) -> Tuple[str, int]:
+    """
+    webhook URL 검증
+    
+    Args:
+        url: 검사할 URL
+        allowlist: 공인 주소가 아니어도 허용할 호스트/네트워크
+        resolve: True면 호스트 이름을 DNS로 해석하여 모든 주소를 검사
+                 (False면 IP 리터럴만 검사, 이벤트 루프에서 빠르게 거절할 때)
+    
+    Returns:
+        (호스트, 포트)
+    
+    Raises:
+        PushURLError: http/https가 아니거나 허용하지 않는 주소일 때
+    """
+    allowlist = allowlist or PushAllowlist()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError as e:
+        raise PushURLError(f"Invalid push URL: {e}")
+    if parts.scheme not in ("http", "https"):
+        raise PushURLError(f"Push URL must use http or https: {url}")
+    host = parts.hostname
+    if not host:
+        raise PushURLError(f"Push URL has no host: {url}")
+    port = port or (443 if parts.scheme == "https" else 80)
+    if allowlist.allows_host(host):
+        return host, port
+    
+    try:
+        addresses = [ipaddress.ip_address(host)]
+    except ValueError:
+        if not resolve:
+            return host, port
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            raise PushURLError(f"Cannot resolve push URL host {host}: {e}")
+        addresses = [ipaddress.ip_address(info[4][0].split("%", 1)[0]) for info in infos]
+    
+    for address in addresses:
+        # ::ffff:a.b.c.d 는 IPv4 주소로 검사 (allowlist의 IPv4 네트워크와 비교)
+        address = getattr(address, "ipv4_mapped", None) or address
+        if not _is_public(address) and not allowlist.allows_address(address):
+            raise PushURLError(
+                f"Push URL host {host} resolves to non-public address {address} (add it to the push allowlist)"
+            )
+    return host, port
+
+
+class PushNotifier:
+    """
+    Task 완료 이벤트 전송기 (서버 쪽)
+    
+    이벤트는 크기가 제한된 큐에 쌓이고 워커 스레드가 전송합니다.
+    큐가 가득 차면 새 이벤트는 버려지며, 수신 측은 /tasks/{id} 조회로 복구할 수 있습니다.
+    전송 직전에 URL을 다시 검사하고(DNS 재해석) 리다이렉트는 따라가지 않습니다.
+    """
+    
+    def __init__(self, queue_size: int = 1000, workers: int = 2, max_attempts: int = 4,
+                 backoff: float = 0.5, timeout: float = 10.0,
+                 allowlist: Optional[PushAllowlist] = None):
+        """
+        Args:
+            queue_size: 대기 중인 이벤트 최대 개수
+            workers: 전송 워커 스레드 수
+            max_attempts: 이벤트당 최대 전송 시도 횟수
+            backoff: 첫 재시도 대기 시간 (초, 시도마다 2배 + 지터)
+            timeout: 전송 요청 타임아웃 (초)
+            allowlist: 공인 주소가 아니어도 전송할 호스트/네트워크 (check_push_url 참고)
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.allowlist = allowlist or PushAllowlist()
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=queue_size)
+        self._client = httpx.Client(timeout=timeout, follow_redirects=False)
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"a2a-push-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+    
+    def notify(self, url: str, event: Dict[str, Any], token: Optional[str] = None) -> bool:
+        """
+        이벤트 전송 예약 (블로킹 없음)
+        
+        Returns:
+            큐에 들어갔으면 True, 큐가 가득 차서 버렸으면 False
+        """
+        try:
+            self._queue.put_nowait({"url": url, "event": event, "token": token})
+            return True
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+                dropped = self.dropped
+            logger.warning("push.dropped", url=url, reason="queue full", dropped=dropped)
+            return False
+    
+    @property
+    def pending(self) -> int:
+        """전송 대기 중인 이벤트 수"""
+        return self._queue.qsize()
+    
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._deliver(item)
+            finally:
+                self._queue.task_done()
+    
+    def _deliver(self, item: Dict[str, Any]):
+        """재시도(지수 백오프 + 지터)와 함께 이벤트 POST"""
+        try:
+            check_push_url(item["url"], self.allowlist)
+        except PushURLError as e:
+            logger.error("push.rejected", url=item["url"], error=str(e))
+            return
+        
+        headers = {"Content-Type": codec.JSON_MEDIA_TYPE}
+        if item["token"]:
+            headers[PUSH_TOKEN_HEADER] = item["token"]
+        body = codec.dumps(item["event"])
+        
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                response = self._client.post(item["url"], content=body, headers=headers)
+                if response.status_code < 500:
+                    return
+                error = f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                error = str(e)
+            
+            if attempt < self.max_attempts:
+                delay = self.backoff * (2 ** (attempt - 1))
+                time.sleep(delay + random.uniform(0, delay))
+        
+        logger.error("push.delivery_failed", url=item['url'], attempts=self.max_attempts, error=error)
+    
+    def close(self, timeout: float = 5.0):
+        """워커 종료 (남은 이벤트는 timeout 동안만 전송 시도)"""
+        for _ in self._workers:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._client.close()
+
+
+class PushReceiver:
+    """
+    Task 완료 이벤트 수신기 (클라이언트 쪽)
+    
+    표준 라이브러리 HTTP 서버를 백그라운드 스레드로 실행합니다.
+    수천 개의 Task를 폴링 없이 기다릴 때 사용합니다.
+    """
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, token: Optional[str] = None,
+                 on_event: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Args:
+            host: 바인딩 주소 (에이전트 서버가 접근할 수 있어야 함)
+            port: 포트 (0이면 임의 포트)
+            token: 지정하면 같은 토큰을 보낸 이벤트만 수락
+            on_event: 이벤트를 받을 때마다 호출할 콜백 (수신 스레드에서 실행)
+        """
+        self.token = token
+        self.on_event = on_event
+        self.events: Dict[str, Dict[str, Any]] = {}  # task_id → 마지막 이벤트
+        self._arrived = threading.Condition()
+        
+        receiver = self
+        
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if receiver.token and self.headers.get(PUSH_TOKEN_HEADER) != receiver.token:
+                    self.send_response(401)
+                    self.end_headers()
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    event = codec.loads(self.rfile.read(length))
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                receiver._receive(event)
+                self.send_response(204)
+                self.end_headers()
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="a2a-push-receiver", daemon=True
+        )
+        self._thread.start()
+    
+    @property
+    def url(self) -> str:
+        """에이전트에 넘길 콜백 URL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+    
+    def _receive(self, event: Dict[str, Any]):
+        task = (event.get("data") or {}).get("task") or {}
+        task_id = task.get("id")
+        if task_id:
+            with self._arrived:
+                self.events[task_id] = event
+                self._arrived.notify_all()
+        if self.on_event:
+            self.on_event(event)
+    
+    def wait(self, task_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Task 완료 이벤트가 올 때까지 대기
+        
+        Returns:
+            이벤트 {"type": "status", "data": {"task": {...}}, "timestamp": ...}
+        
+        Raises:
+            TimeoutError: timeout 안에 이벤트가 오지 않았을 때
+        """
+        with self._arrived:
+            if not self._arrived.wait_for(lambda: task_id in self.events, timeout):
+                raise TimeoutError(f"No push notification for task {task_id} within {timeout}s")
+            return self.events[task_id]
+    
+    def close(self):
+        """수신 서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+
+
+def completion_event(task_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Task 완료 이벤트 (StreamEvent 형식)"""
+    return {
+        "type": "status",
+        "data": {"task": task_dict},
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+__all__ = [
+    'PushNotifier',
+    'PushReceiver',
+    'PushAllowlist',
+    'PushURLError',
+    'check_push_url',
+    'completion_event',
+    'PUSH_TOKEN_HEADER',
+]
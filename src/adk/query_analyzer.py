@@ -5,6 +5,11 @@ A2A Query Analyzer
 from typing import List, Dict, Any
 from dataclasses import dataclass
 
+from . import tracing
+from .log import get_logger
+
+logger = get_logger("a2a.query_analyzer")
+
 
 @dataclass
 class TaskPlan:
@@ -39,10 +44,14 @@ class QueryAnalyzer:
         Returns:
             TaskPlan: 실행 계획
         """
-        if self.use_llm:
-            return self._analyze_with_llm(query)
-        else:
-            return self._analyze_with_keywords(query)
+        with tracing.start_span("analyze_query", attributes={"use_llm": self.use_llm}) as span:
+            if self.use_llm:
+                plan = self._analyze_with_llm(query)
+            else:
+                plan = self._analyze_with_keywords(query)
+            span.set_attribute("task_type", plan.task_type)
+            span.set_attribute("required_skills", ",".join(plan.required_skills))
+            return plan
     
     def _analyze_with_llm(self, query: str) -> TaskPlan:
         """LLM을 사용한 고급 쿼리 분석"""
@@ -103,7 +112,7 @@ Examples:
             )
         
         except Exception as e:
-            print(f"⚠️  LLM 분석 실패, 키워드 기반으로 전환: {e}")
+            logger.warning("query_analyzer.llm_failed", fallback="keywords", error=str(e))
             return self._analyze_with_keywords(query)
     
     def _analyze_with_keywords(self, query: str) -> TaskPlan:
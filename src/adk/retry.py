@@ -0,0 +1,119 @@
+"""
+A2A Agent Development Kit - Retry Policy
+일시적인 전송 오류와 5xx/429 응답에 대한 지수 백오프 + 지터 재시도
+
+A2AClient / A2ADiscoveryClient는 스킬 호출마다 idempotency key를 하나 만들고
+모든 시도에 같은 키를 보내므로, 서버에 도달한 뒤 응답만 잃어버린 호출을 재시도해도
+스킬(파일 저장, 이메일 발송 등)이 두 번 실행되지 않습니다 (idempotency 참고).
+
+    policy = RetryPolicy(max_attempts=4, base_delay=0.5)
+    client = A2AClient("http://localhost:9204", retry=policy)
+
+재시도하지 않는 오류:
+    - 응답 읽기/쓰기 타임아웃  서버에 이미 deadline을 알렸으므로 같은 시간을 다시 기다리지 않음
+    - JSON-RPC 오류 응답       스킬 자체의 실패 (재시도해도 같은 결과일 가능성이 높음)
+"""
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+import httpx
+
+from .cancellation import TaskCancelledError, current_token
+from .log import get_logger
+
+
+logger = get_logger("a2a.retry")
+
+# 서버에 요청이 도달하지 않았거나 응답 도중 연결이 끊긴 경우
+RETRYABLE_ERRORS = (httpx.NetworkError, httpx.RemoteProtocolError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    재시도 정책
+    
+    n번째 재시도 전 대기 = uniform(0, min(max_delay, base_delay x multiplier^(n-1)))  (full jitter)
+    jitter=False면 구간의 상한만큼 대기합니다. 서버가 Retry-After를 보내면 max_delay 안에서 그 값을 따릅니다.
+    """
+    max_attempts: int = 3  # 첫 시도 포함 (1이면 재시도 안 함)
+    base_delay: float = 0.2  # 초
+    max_delay: float = 5.0  # 초
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    
+    def is_retryable(self, error: BaseException) -> bool:
+        """재시도할 오류인지 여부"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(error, RETRYABLE_ERRORS)
+    
+    def backoff(self, retry: int, error: Optional[BaseException] = None) -> float:
+        """
+        retry번째 재시도 전 대기 시간 (초, retry는 1부터)
+        
+        Args:
+            retry: 재시도 순번
+            error: 직전 오류 (Retry-After 헤더 확인용)
+        """
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        delay = random.uniform(0.0, ceiling) if self.jitter else ceiling
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+    
+    def call(self, fn: Callable[[], Any], operation: str = "rpc") -> Any:
+        """
+        fn을 정책에 따라 실행
+        
+        스킬 안에서 호출되면(취소 토큰이 있으면) 대기 중에도 취소/deadline을 확인합니다.
+        
+        Args:
+            fn: 실행할 함수 (시도마다 다시 호출)
+            operation: 로그에 남길 작업 이름
+        
+        Returns:
+            fn의 반환값
+        
+        Raises:
+            fn이 마지막으로 발생시킨 예외 (재시도할 수 없는 오류는 바로 전달)
+            TaskCancelledError: 재시도 대기 중 현재 스킬이 취소됨
+        """
+        retry = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                retry += 1
+                if retry >= self.max_attempts or not self.is_retryable(e):
+                    raise
+                delay = self.backoff(retry, e)
+                logger.warning("retry.scheduled", operation=operation, attempt=retry, delay=round(delay, 3),
+                               error=f"{type(e).__name__}: {e}")
+                token = current_token()
+                if token is None:
+                    time.sleep(delay)
+                elif token.sleep(delay):
+                    raise TaskCancelledError(token.reason)
+
+
+# 재시도하지 않는 정책
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _retry_after(error: Optional[BaseException]) -> Optional[float]:
+    """Retry-After 헤더 (초 단위만 지원, 없거나 해석할 수 없으면 None)"""
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    value = error.response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+__all__ = ['RetryPolicy', 'NO_RETRY', 'RETRYABLE_ERRORS']
@@ -0,0 +1,311 @@
+"""
+A2A Agent Development Kit - Skill Parameter Schemas
+스킬 함수 시그니처에서 JSON Schema를 만들고, 요청 파라미터 검증기를 미리 컴파일
+
+    def write(self, bullets: str, tone: str = "formal") -> str
+        → inputSchema  {"type": "object", "properties": {"bullets": {"type": "string"}, ...},
+                        "required": ["bullets"]}
+        → outputSchema {"type": "string"}
+
+A2AServer는 시작할 때 스킬마다 ParamValidator를 한 번 만들어 두고,
+/rpc와 /tasks 요청을 스킬 실행 전에 검증합니다 (LLM 호출 전에 잘못된 요청 거절).
+
+Iterable[str] / Iterator[str]는 조각으로 주고받을 수 있는 문자열입니다 (STREAM_KEY 표시).
+    def save_to_file(self, content: Iterable[str]) -> dict
+        → "content": {"type": "string", "x-a2a-stream": true}
+/rpc로는 문자열 하나로, /rpc:stream으로는 도착하는 조각 그대로 전달됩니다 (streaming 참고).
+
+@agent_skill은 mark_skill로 함수에 스킬 이름(SKILL_ATTR)을 기록하고 스키마를 미리 계산해 둡니다.
+"""
+import collections.abc
+import inspect
+import types
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Python 타입 → JSON Schema 타입
+_JSON_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    set: "array",
+    dict: "object",
+}
+
+# JSON Schema 타입 → 허용하는 Python 값 타입 (JSON/MessagePack 디코딩 결과 기준)
+_PY_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+}
+
+# 조각 스트림으로 주고받을 수 있는 문자열 파라미터/결과 표시 (JSON Schema 확장 키워드)
+STREAM_KEY = "x-a2a-stream"
+
+# @agent_skill이 스킬 함수에 남기는 속성: 스킬 이름, 미리 계산한 (inputSchema, outputSchema)
+SKILL_ATTR = "__a2a_skill__"
+SCHEMA_ATTR = "__a2a_schema__"
+
+# Optional[str] / Union[str, None]과 str | None (PEP 604)
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+_STREAM_TYPES = (
+    collections.abc.Iterable, collections.abc.Iterator, collections.abc.Generator,
+    collections.abc.AsyncIterable, collections.abc.AsyncIterator, collections.abc.AsyncGenerator,
+)
+
+
+def _nullable(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """null도 허용하는 스키마 (타입/enum 제약이 없으면 그대로)"""
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        if "null" not in types:
+            schema = dict(schema, type=types + ["null"])
+    if "enum" in schema and None not in schema["enum"]:
+        schema = dict(schema, enum=schema["enum"] + [None])
+    return schema
+
+
+def _type_schema(annotation: Any) -> Dict[str, Any]:
+    """타입 힌트 하나를 JSON Schema로 변환 (모르는 타입은 제약 없음)"""
+    if annotation is inspect.Parameter.empty or annotation is Any:
+        return {}
+    
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    
+    if origin in _UNION_TYPES:
+        members = [a for a in args if a is not type(None)]
+        schema = _type_schema(members[0]) if len(members) == 1 else {}
+        return _nullable(schema) if type(None) in args else schema
+    
+    if origin is typing.Literal:
+        return {"enum": list(args)}
+    
+    if origin in _STREAM_TYPES:
+        return {"type": "string", STREAM_KEY: True} if args and args[0] is str else {}
+    
+    base = origin or annotation
+    json_type = _JSON_TYPES.get(base)
+    if json_type is None:
+        return {}
+    
+    schema: Dict[str, Any] = {"type": json_type}
+    if json_type == "array" and args and args[0] is not Ellipsis:
+        item_schema = _type_schema(args[0])
+        if item_schema:
+            schema["items"] = item_schema
+    return schema
+
+
+def _type_hints(fn: Callable) -> Dict[str, Any]:
+    try:
+        return typing.get_type_hints(fn)
+    except Exception:
+        return dict(getattr(fn, "__annotations__", {}))
+
+
+def signature_schemas(fn: Callable, unbound: bool = False) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    함수 시그니처에서 입력/출력 JSON Schema 생성
+    
+    Args:
+        fn: 스킬 함수 (바운드 메서드면 self 제외)
+        unbound: True면 첫 번째 파라미터(self)를 제외 (클래스 본문의 함수에 데코레이터로 적용할 때)
+    
+    Returns:
+        (inputSchema, outputSchema 또는 None)
+    """
+    signature = inspect.signature(fn)
+    hints = _type_hints(fn)
+    
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    additional = False
+    
+    parameters = list(signature.parameters.items())
+    for name, param in parameters[1:] if unbound else parameters:
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            additional = True
+            continue
+        if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.POSITIONAL_ONLY):
+            continue
+        
+        prop = _type_schema(hints.get(name, param.annotation))
+        if param.default is inspect.Parameter.empty:
+            required.append(name)
+        elif param.default is None:
+            # attachment_path: str = None → 명시적인 null도 기본값과 같으므로 허용
+            prop = dict(_nullable(prop), default=None)
+        elif isinstance(param.default, (str, int, float, bool)):
+            prop["default"] = param.default
+        properties[name] = prop
+    
+    input_schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": properties,
+        "required": required,
+        "additionalProperties": additional,
+    }
+    
+    output = hints.get("return", signature.return_annotation)
+    output_schema = _type_schema(output) or None
+    return input_schema, output_schema
+
+
+def mark_skill(fn: Callable, skill_name: str) -> Callable:
+    """
+    함수를 스킬로 표시하고 스키마를 미리 계산 (@agent_skill이 호출)
+    
+    아직 정의되지 않은 타입을 참조하는 힌트(전방 참조)가 있으면 스키마는 저장하지 않고,
+    A2AServer가 시작할 때 바운드 메서드에서 다시 계산합니다.
+    
+    Args:
+        fn: 클래스 본문의 스킬 함수 (첫 번째 파라미터는 self)
+        skill_name: 스킬 이름
+    
+    Returns:
+        fn (속성만 추가)
+    """
+    setattr(fn, SKILL_ATTR, skill_name)
+    try:
+        typing.get_type_hints(fn)
+        setattr(fn, SCHEMA_ATTR, signature_schemas(fn, unbound=True))
+    except Exception:
+        pass
+    return fn
+
+
+def skill_schemas(fn: Callable) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """mark_skill이 미리 계산한 스키마 (없으면 시그니처에서 생성)"""
+    schemas = getattr(fn, SCHEMA_ATTR, None)
+    return schemas if schemas is not None else signature_schemas(fn)
+
+
+class ParamValidator:
+    """
+    inputSchema로 미리 컴파일한 파라미터 검증기
+    
+    필수/허용 이름 집합과 파라미터별 허용 타입 튜플을 만들어 두므로,
+    검증은 딕셔너리 순회와 isinstance 검사뿐입니다.
+    """
+    
+    __slots__ = ("required", "allowed", "additional", "types", "enums")
+    
+    def __init__(self, input_schema: Dict[str, Any]):
+        properties = input_schema.get("properties") or {}
+        self.required = frozenset(input_schema.get("required") or ())
+        self.allowed = frozenset(properties)
+        self.additional = input_schema.get("additionalProperties", True) is not False
+        self.types: Dict[str, Tuple[Tuple[type, ...], bool, str]] = {}
+        self.enums: Dict[str, tuple] = {}
+        
+        for name, prop in properties.items():
+            if "enum" in prop:
+                self.enums[name] = tuple(prop["enum"])
+            json_type = prop.get("type")
+            if json_type is None:
+                continue
+            names = json_type if isinstance(json_type, list) else [json_type]
+            nullable = "null" in names
+            py_types = tuple(t for n in names if n != "null" for t in _PY_TYPES.get(n, ()))
+            if py_types:
+                label = "/".join(n for n in names if n != "null")
+                self.types[name] = (py_types, nullable, label)
+    
+    def validate(self, params: Any) -> Optional[str]:
+        """
+        파라미터 검증
+        
+        Returns:
+            오류 메시지 (유효하면 None)
+        """
+        if not isinstance(params, dict):
+            return "params must be an object"
+        
+        missing = self.required.difference(params)
+        if missing:
+            return f"missing required parameter(s): {', '.join(sorted(missing))}"
+        
+        for name, value in params.items():
+            if name not in self.allowed:
+                if not self.additional:
+                    return f"unexpected parameter: '{name}'"
+                continue
+            
+            expected = self.types.get(name)
+            if expected is not None:
+                py_types, nullable, label = expected
+                if value is None:
+                    if not nullable:
+                        return f"parameter '{name}' must not be null"
+                # bool은 int의 하위 타입이므로 integer/number에 bool이 들어오지 않도록 따로 확인
+                elif not isinstance(value, py_types) or (isinstance(value, bool) and bool not in py_types):
+                    return f"parameter '{name}' must be of type {label}"
+            
+            enum = self.enums.get(name)
+            if enum is not None and value not in enum:
+                return f"parameter '{name}' must be one of {list(enum)}"
+        
+        return None
+
+
+def stream_param(input_schema: Optional[Dict[str, Any]]) -> Optional[str]:
+    """입력 스키마에서 조각 스트림으로 받을 수 있는 파라미터 이름 (없으면 None, 여럿이면 첫 번째)"""
+    properties = (input_schema or {}).get("properties") or {}
+    return next((name for name, prop in properties.items() if prop.get(STREAM_KEY)), None)
+
+
+def find_skill_function(agent: Any, skill_name: str) -> Optional[Callable]:
+    """
+    에이전트에서 스킬 이름에 해당하는 메서드 찾기
+    
+    @agent_skill("deep_research", ...)처럼 메서드 이름과 스킬 이름이 다를 수 있으므로,
+    메서드 이름이 같거나 @agent_skill이 SKILL_ATTR에 스킬 이름을 기록한 메서드를 찾습니다.
+    
+    Returns:
+        바운드 메서드 (찾지 못하면 None)
+    """
+    candidates = []
+    for attr in dir(type(agent)):
+        if attr.startswith("__"):
+            continue
+        fn = inspect.getattr_static(type(agent), attr, None)
+        if isinstance(fn, (staticmethod, classmethod)):
+            fn = fn.__func__
+        if not inspect.isfunction(fn):
+            continue
+        if _marks_skill(fn, skill_name):
+            return getattr(agent, attr)
+        if attr == skill_name:
+            candidates.append(attr)
+    return getattr(agent, candidates[0]) if candidates else None
+
+
+def _marks_skill(fn: Callable, skill_name: str) -> bool:
+    """@agent_skill이 SKILL_ATTR에 스킬 이름을 기록했는지 확인 (데코레이터가 겹쳐 있으면 __wrapped__를 따라감)"""
+    while fn is not None:
+        if getattr(fn, SKILL_ATTR, None) == skill_name:
+            return True
+        fn = getattr(fn, "__wrapped__", None)
+    return False
+
+
+__all__ = [
+    'signature_schemas',
+    'skill_schemas',
+    'mark_skill',
+    'ParamValidator',
+    'find_skill_function',
+    'stream_param',
+    'STREAM_KEY',
+    'SKILL_ATTR',
+    'SCHEMA_ATTR',
+]
@@ -2,16 +2,385 @@
 A2A Agent Development Kit - Auto Server Generator
 에이전트를 FastAPI 서버로 자동 변환
 """
-from fastapi import FastAPI, HTTPException
-from typing import Dict
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+from pydantic import ValidationError
+from typing import Dict, Any, Optional, Tuple, Mapping, Callable, Iterable, Iterator, AsyncIterator, get_args
+from dataclasses import dataclass
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import asyncio
+import contextvars
+import functools
+import inspect
+import ipaddress
+import os
+import re
+import time
+import hashlib
+import threading
 from datetime import datetime
 
 from ..a2a_protocol import (
-    AgentCard, CreateTaskRequest, CreateTaskResponse,
-    GetTaskStatusResponse, Task, TaskInput, TaskOutput
+    AgentCard, CreateTaskRequest, CreateTaskResponse, CreateTasksRequest, CreateTasksResponse,
+    GetTaskStatusResponse, GetTasksStatusRequest, GetTasksStatusResponse, PushNotificationConfig, Task, TaskInput, TaskOutput, TaskStatus,
+    TERMINAL_TASK_STATUSES
 )
 from .agent import A2AAgent
+from . import codec, metrics, profiler, streaming, tracing
+from .cancellation import (
+    CancelToken, TaskCancelledError, DEADLINE_HEADER, RPC_CANCEL_METHOD, deadline_from_header, use_token
+)
+from .idempotency import DEFAULT_MAX_ENTRIES, IDEMPOTENCY_HEADER, IdempotencyCache, IdempotencyConflictError, replay
+from .log import get_logger
+from .push import PushAllowlist, PushNotifier, check_push_url, completion_event
+from .schema import ParamValidator, find_skill_function, skill_schemas, stream_param
+from .transport import INPROC_SCHEME, UNIX_SCHEME, register_local_server, unregister_local_server
+
+logger = get_logger("a2a.server")
+
+
+async def _decode_body(request: Request) -> Any:
+    """Content-Encoding/Content-Type에 맞게 요청 본문 디코딩 (ValueError: 해석 불가)"""
+    body = codec.decompress(await request.body(), request.headers.get("content-encoding"))
+    media_type = codec.media_type_of(request.headers.get("content-type"))
+    return codec.decode(body, media_type)
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """마감 시각(time.monotonic() 기준)까지 남은 시간 (초, 없으면 None)"""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+# entity-tag = [ "W/" ] DQUOTE *etagc DQUOTE  (RFC 9110 8.8.3)
+_ENTITY_TAG = re.compile(r'(?:W/)?"[^"]*"')
+
+
+def _if_none_match(header: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match가 현재 ETag와 일치하는지 (일치하면 304)
+    
+    RFC 9110 13.1.2: "*" 또는 쉼표로 구분한 entity-tag 목록을 weak comparison으로 비교
+    (W/ 접두사를 무시하고 따옴표 안의 값이 같으면 일치)
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return any(
+        (tag[2:] if tag.startswith("W/") else tag) == opaque
+        for tag in _ENTITY_TAG.findall(header)
+    )
+
+
+def _rpc_error(code: int, message: str, request_id: Any) -> Dict[str, Any]:
+    """JSON-RPC 2.0 오류 응답"""
+    return {
+        "jsonrpc": "2.0",
+        "error": {"code": code, "message": message},
+        "id": request_id
+    }
+
+
+def _unserializable(error: Exception, request_id: Any) -> Dict[str, Any]:
+    """인코딩할 수 없는 스킬 결과에 대한 JSON-RPC 오류 응답"""
+    logger.error("rpc.result_not_serializable", error=str(error))
+    return _rpc_error(-32603, f"Internal error: result is not serializable ({error})", request_id)
+
+
+def _cancel_key(request_id: Any, idempotency_key: Optional[str]) -> Optional[Tuple[str, str]]:
+    """RPC_CANCEL_METHOD로 취소할 수 있는 호출의 _rpc_tokens 키 (문자열 id와 Idempotency-Key가 모두 있을 때만)"""
+    if isinstance(request_id, str) and idempotency_key is not None:
+        return request_id, idempotency_key
+    return None
+
+
+def _collect(chunks) -> Any:
+    """스트리밍 스킬 결과를 한 번에 반환할 값으로 합치기 (문자열 청크면 이어붙임)"""
+    items = list(chunks)
+    return "".join(items) if all(isinstance(c, str) for c in items) else items
+
+
+async def _acollect(chunks) -> Any:
+    """_collect의 async generator 버전"""
+    return _collect([chunk async for chunk in chunks])
+
+
+_background_lock = threading.Lock()
+_background: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """
+    이벤트 루프 밖에서 제출한 Task와 코루틴을 실행하는 공유 이벤트 루프 (처음 사용할 때 데몬 스레드로 시작)
+    
+    in-process Task마다 스레드와 이벤트 루프를 새로 만들지 않습니다.
+    run_coroutine_threadsafe는 제출한 스레드의 context를 복사하므로 trace context가 그대로 전달됩니다.
+    """
+    global _background
+    if _background is None:
+        with _background_lock:
+            if _background is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="a2a-loop", daemon=True).start()
+                _background = loop
+    return _background
+
+
+def _run_coroutine(coro) -> Any:
+    """
+    동기 코드에서 코루틴을 끝까지 실행
+    
+    이미 이벤트 루프가 도는 스레드(async 테스트, 노트북 등)에서는 asyncio.run을 쓸 수 없으므로
+    공유 이벤트 루프에서 실행합니다 (취소 토큰/trace context는 그대로 전달).
+    공유 루프 자신에서 호출되면 기다리는 동안 루프가 멈추므로 그때만 워커 스레드의 새 루프에서 실행합니다.
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    if running is not _background:
+        return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+    with ThreadPoolExecutor(1, thread_name_prefix="a2a-skill") as executor:
+        return executor.submit(contextvars.copy_context().run, asyncio.run, coro).result()
+
+
+async def _gather_chunks(records: AsyncIterator[Any]) -> Tuple[Any, ...]:
+    """스트리밍 입력 레코드를 모두 받아 조각 튜플로 (async 스킬용)"""
+    return tuple([chunk async for chunk in streaming.achunks(records)])
+
+
+async def _drain(records: AsyncIterator[Any]):
+    async for _ in records:
+        pass
+
+
+# 스트림 끝 표시
+_END = object()
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    요청 본문을 읽는 동안 보내는 StreamingResponse (/rpc:stream)
+    
+    StreamingResponse는 연결 종료를 감지하려고 처음부터 receive를 읽으므로 아직 도착 중인
+    요청 본문(스트리밍 입력)을 가로챕니다. 여기서는 본문을 다 읽은 뒤(body_read)부터 감지하고,
+    연결이 끊기면 응답 생성을 취소합니다 (스킬은 취소 토큰으로 중단).
+    """
+    
+    def __init__(self, content: AsyncIterator[bytes], body_read: asyncio.Event, **kwargs):
+        super().__init__(content, **kwargs)
+        self.body_read = body_read
+    
+    async def __call__(self, scope, receive, send):
+        streamer = asyncio.ensure_future(self.stream_response(send))
+        watcher = asyncio.ensure_future(self._wait_disconnect(receive))
+        try:
+            await asyncio.wait((streamer, watcher), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            watcher.cancel()
+            if not streamer.done():
+                streamer.cancel()
+        try:
+            await streamer
+        except asyncio.CancelledError:
+            pass  # 연결이 끊겨 응답 생성을 취소함
+        except OSError:
+            raise ClientDisconnect()
+    
+    async def _wait_disconnect(self, receive):
+        await self.body_read.wait()
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+
+def _is_local_request(request: Request) -> bool:
+    """
+    루프백 주소(또는 Unix socket)에서 직접 들어온 요청인지 확인
+    
+    프록시를 거친 요청은 프록시가 같은 호스트에 있어도 원래 클라이언트를 알 수 없으므로 거절합니다.
+    """
+    if "forwarded" in request.headers or "x-forwarded-for" in request.headers:
+        return False
+    client = request.client
+    if client is None or not client.host:
+        return True  # Unix domain socket
+    try:
+        return ipaddress.ip_address(client.host).is_loopback
+    except ValueError:
+        return False
+
+
+class SkillMetrics:
+    """
+    스킬 하나의 메트릭 (레이블이 정해진 하위 메트릭을 미리 받아 두어 기록 시 조회 없음)
+    
+    a2a_skill_calls_total / a2a_skill_errors_total / a2a_skill_canceled_total
+    a2a_skill_in_flight / a2a_skill_latency_seconds
+    """
+    
+    __slots__ = ("calls", "errors", "canceled", "in_flight", "latency")
+    
+    def __init__(self, registry: metrics.MetricsRegistry, agent_id: str, skill_name: str):
+        labels = ("agent", "skill")
+        self.calls = registry.counter(
+            "a2a_skill_calls_total", "Skill executions", labels).labels(agent_id, skill_name)
+        self.errors = registry.counter(
+            "a2a_skill_errors_total", "Skill executions that raised an error", labels).labels(agent_id, skill_name)
+        self.canceled = registry.counter(
+            "a2a_skill_canceled_total", "Skill executions stopped by cancellation or deadline", labels
+        ).labels(agent_id, skill_name)
+        self.in_flight = registry.gauge(
+            "a2a_skill_in_flight", "Skill executions currently running", labels).labels(agent_id, skill_name)
+        self.latency = registry.histogram(
+            "a2a_skill_latency_seconds", "Skill execution latency", labels).labels(agent_id, skill_name)
+    
+    def begin(self) -> float:
+        self.in_flight.inc()
+        return time.perf_counter()
+    
+    def end(self, start: float, error: Optional[BaseException] = None):
+        self.latency.observe(time.perf_counter() - start)
+        self.calls.inc()
+        self.in_flight.dec()
+        if error is not None:
+            if isinstance(error, TaskCancelledError):
+                self.canceled.inc()
+            else:
+                self.errors.inc()
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    """
+    디스패치 테이블 항목
+    
+    Attributes:
+        name: 스킬 이름
+        call: 호출 대상 (스킬의 바운드 메서드, 또는 agent.execute_skill 위임)
+        is_async: async 함수/async generator 여부
+        is_streaming: generator로 결과를 조각조각 반환하는지 여부
+        stream_input: 조각 스트림으로 받을 수 있는 파라미터 이름 (Iterable[str], 없으면 None)
+        validator: 파라미터 검증기 (스키마가 없으면 None)
+        input_schema: 입력 JSON Schema
+        output_schema: 출력 JSON Schema
+        metrics: 실행 메트릭 (None이면 기록 안 함)
+    """
+    name: str
+    call: Callable[..., Any]
+    is_async: bool = False
+    is_streaming: bool = False
+    stream_input: Optional[str] = None
+    validator: Optional[ParamValidator] = None
+    input_schema: Optional[Dict[str, Any]] = None
+    output_schema: Optional[Dict[str, Any]] = None
+    metrics: Optional[SkillMetrics] = None
+    
+    @classmethod
+    def build(cls, name: str, call: Callable[..., Any],
+              input_schema: Optional[Dict[str, Any]] = None,
+              output_schema: Optional[Dict[str, Any]] = None,
+              skill_metrics: Optional[SkillMetrics] = None,
+              target: Optional[Callable[..., Any]] = None) -> "SkillEntry":
+        """
+        호출 대상의 종류(sync/async, streaming)를 미리 판별하여 항목 생성
+        
+        Args:
+            target: 종류를 판별할 함수 (call이 execute_skill 위임이면 스킬 메서드, 없으면 call)
+        """
+        # 데코레이터(functools.wraps)로 감싼 generator도 스트리밍 스킬로 판별
+        target = inspect.unwrap(target or call)
+        return cls(
+            name=name,
+            call=call,
+            is_async=inspect.iscoroutinefunction(target) or inspect.isasyncgenfunction(target),
+            is_streaming=inspect.isgeneratorfunction(target) or inspect.isasyncgenfunction(target),
+            stream_input=stream_param(input_schema),
+            validator=ParamValidator(input_schema) if input_schema else None,
+            input_schema=input_schema,
+            output_schema=output_schema,
+            metrics=skill_metrics
+        )
+    
+    def invoke(self, params: Dict[str, Any]) -> Any:
+        """현재 스레드에서 실행 (async 스킬은 새 이벤트 루프에서, 루프가 이미 돌고 있으면 워커 스레드에서)"""
+        if self.is_async:
+            return _run_coroutine(self.ainvoke(params))
+        if self.metrics is None:
+            return self._call(params)
+        
+        start = self.metrics.begin()
+        try:
+            result = self._call(params)
+        except BaseException as e:
+            self.metrics.end(start, e)
+            raise
+        self.metrics.end(start)
+        return result
+    
+    def _call(self, params: Dict[str, Any]) -> Any:
+        if self.stream_input is not None:
+            params = self._wrap_stream_input(params)
+        result = self.call(**params)
+        return _collect(result) if self.is_streaming else result
+    
+    def _wrap_stream_input(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """한 번에 받은 스트리밍 입력(문자열)을 조각 하나짜리 스트림으로 (글자 단위로 순회하지 않도록)"""
+        value = params.get(self.stream_input)
+        if isinstance(value, str):
+            return {**params, self.stream_input: (value,)}
+        return params
+    
+    def stream(self, params: Dict[str, Any]) -> Iterator[Any]:
+        """
+        현재 스레드에서 실행하며 결과를 조각으로 반환 (/rpc:stream)
+        
+        generator 스킬은 yield한 조각을 만들어지는 대로, 그 밖의 스킬은 결과 하나를 반환합니다.
+        async 스킬은 새 이벤트 루프에서 끝까지 실행한 결과를 한 번에 반환합니다.
+        """
+        start = self.metrics.begin() if self.metrics is not None else None
+        error = None
+        try:
+            if self.is_async:
+                yield _run_coroutine(self._acall(params))
+            elif self.is_streaming:
+                if self.stream_input is not None:
+                    params = self._wrap_stream_input(params)
+                yield from self.call(**params)
+            else:
+                yield self._call(params)
+        except GeneratorExit:
+            # 받는 쪽이 스트림을 닫음
+            error = TaskCancelledError("Stream closed")
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if start is not None:
+                self.metrics.end(start, error)
+    
+    async def ainvoke(self, params: Dict[str, Any]) -> Any:
+        """async 스킬 실행 (이벤트 루프에서)"""
+        if self.metrics is None:
+            return await self._acall(params)
+        
+        start = self.metrics.begin()
+        try:
+            result = await self._acall(params)
+        except BaseException as e:
+            self.metrics.end(start, e)
+            raise
+        self.metrics.end(start)
+        return result
+    
+    async def _acall(self, params: Dict[str, Any]) -> Any:
+        if self.stream_input is not None:
+            params = self._wrap_stream_input(params)
+        result = self.call(**params)
+        return await _acollect(result) if self.is_streaming else await result
 
 
 class A2AServer:
@@ -22,12 +391,57 @@ class A2AServer:
         agent = MyAgent()
         server = A2AServer(agent, port=8001)
         server.run()
+        
+        # 같은 호스트 전용: Unix domain socket으로 실행
+        server = A2AServer(agent, uds="/tmp/my_agent.sock")
+        
+        # 같은 프로세스: HTTP 없이 직접 호출
+        # (agent_id가 같은 서버를 다시 만들면 inproc URL은 새 서버를 가리킴, 이미 만든 클라이언트는 원래 서버 유지)
+        client = A2AClient(server.local_url)
     """
     
-    def __init__(self, agent: A2AAgent, port: int = 8000, host: str = "0.0.0.0"):
+    def __init__(self, agent: A2AAgent, port: int = 8000, host: str = "0.0.0.0",
+                 uds: Optional[str] = None, card_max_age: int = 60,
+                 compression_threshold: Optional[int] = codec.COMPRESSION_THRESHOLD,
+                 max_task_wait: float = 60.0, push_queue_size: int = 1000,
+                 max_batch_size: int = 1000,
+                 metrics_registry: Optional[metrics.MetricsRegistry] = None,
+                 enable_profiler: Optional[bool] = None,
+                 idempotency_cache_size: int = DEFAULT_MAX_ENTRIES,
+                 push_allowlist: Optional[Iterable[str]] = None):
+        """
+        Args:
+            agent: 서버로 노출할 에이전트
+            port: HTTP 포트
+            host: 바인딩 주소
+            uds: Unix domain socket 경로 (지정 시 TCP 대신 소켓으로 서비스)
+            card_max_age: Agent Card의 Cache-Control max-age (초)
+            compression_threshold: 이 크기(바이트) 이상인 응답을 압축 (None이면 압축 안 함)
+            max_task_wait: GET /tasks/{id}?wait= 롱폴링 최대 대기 시간 (초)
+            push_queue_size: 전송 대기 중인 push 알림 최대 개수
+            max_batch_size: /tasks:batch, /tasks:status 요청 하나에 담을 수 있는 최대 Task 수
+            metrics_registry: /metrics로 내보낼 레지스트리 (None이면 프로세스 기본 레지스트리)
+            enable_profiler: GET /admin/profile 활성화 (None이면 A2A_ENABLE_PROFILER, 기본 꺼짐)
+            idempotency_cache_size: Idempotency-Key별로 보관할 /rpc 성공 응답 최대 개수
+            push_allowlist: 공인 주소가 아니어도 push webhook으로 허용할 호스트/네트워크
+                            (예: ["127.0.0.1", "10.0.0.0/8"]. None이면 A2A_PUSH_ALLOWLIST)
+        """
         self.agent = agent
         self.port = port
         self.host = host
+        self.uds = uds
+        self.card_max_age = card_max_age
+        self.compression_threshold = compression_threshold
+        self.max_task_wait = max_task_wait
+        self.max_batch_size = max_batch_size
+        if enable_profiler is None:
+            enable_profiler = os.getenv("A2A_ENABLE_PROFILER", "").lower() in ("1", "true", "yes")
+        self.enable_profiler = enable_profiler
+        
+        # Agent Card 캐시: (카드 딕셔너리, 직렬화된 JSON 바이트, ETag)
+        self._card_cache: Optional[Tuple[Dict[str, Any], bytes, str]] = None
+        # JSON 외 표현 캐시: 미디어 타입 → (바이트, ETag, 만들 때의 JSON ETag)
+        self._card_bodies: Dict[str, Tuple[bytes, str, str]] = {}
         self.app = FastAPI(
             title=agent.name,
             description=agent.description,
@@ -37,163 +451,1113 @@ class A2AServer:
         # Task 저장소
         self.tasks_db: Dict[str, Task] = {}
         
+        # Task 상태 변경 알림
+        # - 롱폴링 HTTP 요청: task_id → (이벤트 루프, asyncio.Event)
+        # - in-process 대기: threading.Condition
+        self._task_events: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+        self._task_changed = threading.Condition()
+        
+        # 실행 중/대기 중인 Task의 취소 토큰 (취소 요청, deadline)
+        self._task_tokens: Dict[str, CancelToken] = {}
+        # 실행 중인 JSON-RPC 호출의 취소 토큰 ((문자열 id, Idempotency-Key) → 토큰, RPC_CANCEL_METHOD로 취소)
+        # id는 호출자끼리 겹칠 수 있으므로 호출자만 아는 키까지 같아야 취소할 수 있음
+        self._rpc_tokens: Dict[Tuple[str, str], CancelToken] = {}
+        # 재시도한 /rpc 호출의 중복 실행 방지 (Idempotency-Key → 응답)
+        self.idempotency_cache = IdempotencyCache(idempotency_cache_size)
+        
+        # Push 알림 (Task 완료 webhook)
+        self._push_configs: Dict[str, PushNotificationConfig] = {}
+        self.push_queue_size = push_queue_size
+        self.push_allowlist = PushAllowlist(push_allowlist) if push_allowlist is not None else PushAllowlist.from_env()
+        self._notifier: Optional[PushNotifier] = None
+        self._notifier_lock = threading.Lock()
+        
+        # 메트릭 (/metrics)
+        self.metrics_registry = metrics_registry or metrics.REGISTRY
+        self._task_gauge = self.metrics_registry.gauge(
+            "a2a_tasks", "Tasks by status (submitted + working = queue depth)", ("agent", "status")
+        )
+        self._task_status_gauges = {
+            status: self._task_gauge.labels(agent.agent_id, status) for status in get_args(TaskStatus)
+        }
+        self._idempotent_replays = self.metrics_registry.counter(
+            "a2a_rpc_idempotent_replays_total", "RPC calls answered from the idempotency cache", ("agent",)
+        ).labels(agent.agent_id)
+        self.metrics_registry.gauge_callback(
+            "a2a_push_queue_depth", "Push notifications waiting to be delivered", ("agent",),
+            self._push_queue_depth
+        )
+        
+        # 스킬 디스패치 테이블 (스키마/검증기/메트릭 포함, 시작 시 한 번 생성)
+        self._build_dispatch_table()
+        
         # 라우트 자동 등록
         self._register_routes()
+        
+        # in-process 전송 등록 (inproc://agent_id)
+        self.local_url = f"{INPROC_SCHEME}{agent.agent_id}"
+        register_local_server(self.local_url, self)
+    
+    # ============================================
+    # 요청 처리 (HTTP 라우트와 in-process 전송이 공유)
+    # ============================================
+    
+    def _agent_card_entry(self) -> Tuple[Dict[str, Any], bytes, str]:
+        """Agent Card를 한 번만 생성/직렬화하여 캐시"""
+        if self._card_cache is None:
+            card_dict = self.agent.get_agent_card()
+            # URL 추가
+            card_dict["url"] = self.url
+            capabilities = card_dict.setdefault("capabilities", {})
+            capabilities["push"] = True
+            capabilities["streaming"] = True  # /rpc:stream
+            # 스킬 시그니처에서 만든 스키마 공개 (에이전트가 직접 지정한 스키마는 유지)
+            for skill in card_dict.get("skills", []):
+                entry = self._dispatch.get(skill.get("name"))
+                if entry is not None:
+                    if not skill.get("inputSchema") and entry.input_schema:
+                        skill["inputSchema"] = entry.input_schema
+                    if not skill.get("outputSchema") and entry.output_schema:
+                        skill["outputSchema"] = entry.output_schema
+            body = codec.dumps(card_dict)
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            self._card_cache = (card_dict, body, etag)
+        return self._card_cache
+    
+    def _agent_card_body(self, media_type: str) -> Tuple[bytes, str]:
+        """미디어 타입별로 인코딩된 Agent Card와 ETag (표현마다 ETag가 다름)"""
+        card_dict, body, etag = self._agent_card_entry()
+        if media_type == codec.JSON_MEDIA_TYPE:
+            return body, etag
+        
+        cached = self._card_bodies.get(media_type)
+        # 스킬이 바뀌어 카드를 다시 만들었으면 이전 카드로 인코딩한 표현은 버림
+        if cached is None or cached[2] != etag:
+            suffix = media_type.rsplit("/", 1)[-1]
+            cached = (codec.encode(card_dict, media_type), f'{etag[:-1]}-{suffix}"', etag)
+            self._card_bodies[media_type] = cached
+        return cached[:2]
+    
+    @property
+    def url(self) -> str:
+        """
+        Agent Card에 공개하는 서버 URL (바인딩한 주소와 전송 방식 기준)
+        
+        uds면 unix://경로, 모든 인터페이스(0.0.0.0, ::)에 바인딩했으면 localhost, 그 밖에는 host를 그대로 씁니다.
+        """
+        if self.uds:
+            return f"{UNIX_SCHEME}{self.uds}"
+        host = self.host
+        if not host or host in ("0.0.0.0", "::"):
+            host = "localhost"
+        elif ":" in host and not host.startswith("["):
+            host = f"[{host}]"  # IPv6 리터럴
+        return f"http://{host}:{self.port}"
+    
+    def build_agent_card(self) -> Dict[str, Any]:
+        """Agent Card (캐시됨, 읽기 전용으로 사용)"""
+        return self._agent_card_entry()[0]
+    
+    @property
+    def agent_card_etag(self) -> str:
+        """현재 Agent Card의 strong ETag"""
+        return self._agent_card_entry()[2]
+    
+    def _build_dispatch_table(self):
+        """
+        스킬 이름 → SkillEntry 디스패치 테이블 생성 (시작 시, reload_skills() 때, 테이블은 읽기 전용)
+        
+        스킬 메서드를 찾으면 바운드 메서드를 직접 호출하고, 찾지 못하면 agent.execute_skill로 위임합니다.
+        에이전트가 execute_skill을 재정의했으면 (인증, 감사 로그 등) 모든 스킬을 execute_skill로 호출합니다.
+        이때도 스키마는 스킬 메서드 시그니처에서 만듭니다.
+        입력 스키마는 에이전트가 AgentSkill.inputSchema를 지정했으면 그것을, 없으면 시그니처를 사용합니다.
+        """
+        table = {}
+        delegate = type(self.agent).execute_skill is not A2AAgent.execute_skill
+        for skill in self.agent.get_skills():
+            input_schema = getattr(skill, "inputSchema", None)
+            output_schema = getattr(skill, "outputSchema", None)
+            fn = find_skill_function(self.agent, skill.name)
+            if fn is not None:
+                try:
+                    derived_input, derived_output = skill_schemas(fn)
+                except (TypeError, ValueError):
+                    derived_input, derived_output = None, None
+                input_schema = input_schema or derived_input
+                output_schema = output_schema or derived_output
+            table[skill.name] = SkillEntry.build(
+                skill.name,
+                functools.partial(self.agent.execute_skill, skill.name) if delegate or fn is None else fn,
+                input_schema,
+                output_schema,
+                SkillMetrics(self.metrics_registry, self.agent.agent_id, skill.name),
+                target=fn
+            )
+        
+        self._dispatch: Mapping[str, SkillEntry] = MappingProxyType(table)
+        self._default_skill = next(iter(table), None)
+        self._root_body: Optional[bytes] = None
+        # 스킬 목록/스키마가 바뀌었을 수 있으므로 Agent Card와 ETag를 다시 만듦
+        self._card_cache = None
+    
+    def reload_skills(self):
+        """에이전트의 스킬이 바뀌었을 때 디스패치 테이블과 Agent Card(ETag)를 다시 만들기"""
+        self._build_dispatch_table()
+    
+    @property
+    def skills(self) -> Mapping[str, "SkillEntry"]:
+        """디스패치 테이블 (읽기 전용)"""
+        return self._dispatch
+    
+    def validate_params(self, skill_name: str, params: Any) -> Optional[str]:
+        """
+        스킬 파라미터 검증 (스킬 실행 전에 호출)
+        
+        Returns:
+            오류 메시지 (유효하거나 스키마가 없으면 None)
+        """
+        entry = self._dispatch.get(skill_name)
+        if entry is None or entry.validator is None:
+            return None if isinstance(params, dict) else "params must be an object"
+        return entry.validator.validate(params)
+    
+    def _prepare_rpc(self, request: Dict[str, Any],
+                     idempotency_key: Optional[str] = None) -> Tuple[Optional["SkillEntry"], Any, Any, Optional[Dict[str, Any]]]:
+        """
+        JSON-RPC 요청 검증과 스킬 조회 (딕셔너리 조회 한 번)
+        
+        Args:
+            request: JSON-RPC 요청 객체
+            idempotency_key: 요청의 Idempotency-Key (RPC_CANCEL_METHOD면 취소할 호출의 키)
+        
+        Returns:
+            (SkillEntry, params, id, 스킬을 실행하지 않고 바로 반환할 응답(오류, rpc.cancel 결과) 또는 None)
+        """
+        request_id = request.get("id")
+        
+        # JSON-RPC 2.0 요청 검증
+        if request.get("jsonrpc") != "2.0":
+            return None, None, request_id, _rpc_error(-32600, "Invalid Request: jsonrpc must be '2.0'", request_id)
+        
+        method = request.get("method")
+        if not method:
+            return None, None, request_id, _rpc_error(-32600, "Invalid Request: method is required", request_id)
+        if method == RPC_CANCEL_METHOD:
+            return None, None, request_id, self._cancel_rpc(request.get("params"), request_id, idempotency_key)
+        
+        # 스킬 존재 여부 확인
+        entry = self._dispatch.get(method) if isinstance(method, str) else None
+        if entry is None:
+            return None, None, request_id, _rpc_error(-32601, f"Method not found: '{method}'", request_id)
+        
+        # 파라미터 검증 (스킬/LLM 실행 전에 거절)
+        params = request.get("params") or {}
+        if entry.validator is not None:
+            error = entry.validator.validate(params)
+        else:
+            error = None if isinstance(params, dict) else "params must be an object"
+        if error:
+            return None, None, request_id, _rpc_error(-32602, f"Invalid params: {error}", request_id)
+        
+        return entry, params, request_id, None
+    
+    def handle_rpc(self, request: Dict[str, Any], deadline: Optional[float] = None,
+                   idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        JSON-RPC 2.0 요청 처리 (동기, 호출한 스레드에서 스킬 실행)
+        
+        Args:
+            request: JSON-RPC 요청 객체
+            deadline: 호출자가 기다리는 마감 시각 (time.monotonic() 기준). 지나면 실행하지 않음
+            idempotency_key: 같은 스킬/키로 이미 성공한(또는 실행 중인) 호출이 있으면 실행하지 않고 그 응답 반환
+        
+        Returns:
+            JSON-RPC 응답 객체
+        """
+        entry, params, request_id, response = self._prepare_rpc(request, idempotency_key)
+        if response is not None:
+            return response
+        if idempotency_key is None:
+            return self._invoke_rpc(entry, params, request_id, deadline)
+        
+        try:
+            future, owner = self.idempotency_cache.begin(entry.name, idempotency_key, params)
+        except IdempotencyConflictError as e:
+            return _rpc_error(-32600, f"Invalid Request: {e}", request_id)
+        if not owner:
+            # 먼저 온 같은 호출의 응답 (실행 중이면 끝날 때까지 대기)
+            try:
+                response = future.result(_remaining(deadline))
+            except FutureTimeoutError:
+                return _rpc_error(-32000, "Request canceled: Deadline exceeded", request_id)
+            self._idempotent_replays.inc()
+            return replay(response, request_id)
+        
+        response = _rpc_error(-32000, "Request canceled: Interrupted", request_id)
+        try:
+            response = self._invoke_rpc(entry, params, request_id, deadline, _cancel_key(request_id, idempotency_key))
+            return response
+        finally:
+            self.idempotency_cache.finish(entry.name, idempotency_key, future, response)
+    
+    def _invoke_rpc(self, entry: "SkillEntry", params: Dict[str, Any], request_id: Any,
+                    deadline: Optional[float], cancel_key: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
+        """검증된 JSON-RPC 호출의 스킬 실행 (호출한 스레드에서, cancel_key가 있으면 RPC_CANCEL_METHOD로 취소 가능)"""
+        # 스킬 실행 (호출자가 이미 포기했으면 실행하지 않음, deadline도 cancel_key도 없으면 토큰 생략)
+        cancellable = cancel_key is not None
+        with self._skill_span("rpc", entry) as span:
+            try:
+                if deadline is None and not cancellable:
+                    result = entry.invoke(params)
+                else:
+                    token = CancelToken(deadline)
+                    if cancellable:
+                        self._rpc_tokens[cancel_key] = token
+                    token.raise_if_cancelled()
+                    with use_token(token):
+                        result = entry.invoke(params)
+                return {"jsonrpc": "2.0", "result": result, "id": request_id}
+            except TaskCancelledError as e:
+                span.record_error(e)
+                return _rpc_error(-32000, f"Request canceled: {e}", request_id)
+            except Exception as e:
+                span.record_error(e)
+                return _rpc_error(-32603, f"Internal error: {str(e)}", request_id)
+            finally:
+                if cancellable:
+                    self._rpc_tokens.pop(cancel_key, None)
+    
+    async def handle_rpc_async(self, request: Dict[str, Any], deadline: Optional[float] = None,
+                               idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        JSON-RPC 2.0 요청 처리 (이벤트 루프용)
+        
+        동기 스킬은 워커 스레드에서, async 스킬은 이벤트 루프에서 실행합니다.
+        deadline이 지나면 기다리지 않고 취소 응답을 반환합니다.
+        idempotency_key는 handle_rpc와 같습니다.
+        """
+        entry, params, request_id, response = self._prepare_rpc(request, idempotency_key)
+        if response is not None:
+            return response
+        if idempotency_key is None:
+            return await self._invoke_rpc_async(entry, params, request_id, deadline)
+        
+        try:
+            future, owner = self.idempotency_cache.begin(entry.name, idempotency_key, params)
+        except IdempotencyConflictError as e:
+            return _rpc_error(-32600, f"Invalid Request: {e}", request_id)
+        if not owner:
+            try:
+                # shield: 대기를 포기해도 먼저 온 실행의 Future는 취소하지 않음
+                response = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), _remaining(deadline))
+            except asyncio.TimeoutError:
+                return _rpc_error(-32000, "Request canceled: Deadline exceeded", request_id)
+            self._idempotent_replays.inc()
+            return replay(response, request_id)
+        
+        response = _rpc_error(-32000, "Request canceled: Interrupted", request_id)
+        try:
+            response = await self._invoke_rpc_async(
+                entry, params, request_id, deadline, _cancel_key(request_id, idempotency_key)
+            )
+            return response
+        finally:
+            self.idempotency_cache.finish(entry.name, idempotency_key, future, response)
+    
+    async def _invoke_rpc_async(self, entry: "SkillEntry", params: Dict[str, Any], request_id: Any,
+                                deadline: Optional[float], cancel_key: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
+        """검증된 JSON-RPC 호출의 스킬 실행 (이벤트 루프용, cancel_key는 _invoke_rpc와 같음)"""
+        token = CancelToken(deadline)
+        cancellable = cancel_key is not None
+        if cancellable:
+            self._rpc_tokens[cancel_key] = token
+        with self._skill_span("rpc", entry) as span:
+            try:
+                result = await self._run_skill(entry, params, token)
+                return {"jsonrpc": "2.0", "result": result, "id": request_id}
+            except TaskCancelledError as e:
+                span.record_error(e)
+                return _rpc_error(-32000, f"Request canceled: {e}", request_id)
+            except Exception as e:
+                span.record_error(e)
+                return _rpc_error(-32603, f"Internal error: {str(e)}", request_id)
+            finally:
+                if cancellable:
+                    self._rpc_tokens.pop(cancel_key, None)
+    
+    def _cancel_rpc(self, params: Any, request_id: Any, idempotency_key: Optional[str]) -> Dict[str, Any]:
+        """
+        실행 중인 JSON-RPC 호출 취소 (RPC_CANCEL_METHOD)
+        
+        취소 요청은 원래 호출과 같은 Idempotency-Key를 보내야 합니다 (다른 호출자의 같은 id는 취소하지 않음).
+        스킬은 다음 check_cancelled() 지점에서 중단되고, 원래 호출은 취소 오류 응답을 받습니다.
+        이미 끝났거나 모르는 id/키면 canceled=false (hedged request의 취소는 응답과 경합할 수 있음)
+        """
+        target = params.get("id") if isinstance(params, dict) else None
+        if not isinstance(target, str):
+            return _rpc_error(-32602, "Invalid params: id must be a string", request_id)
+        if idempotency_key is None:
+            return _rpc_error(-32600, f"Invalid Request: {RPC_CANCEL_METHOD} requires the {IDEMPOTENCY_HEADER} "
+                                      "of the call to cancel", request_id)
+        token = self._rpc_tokens.get((target, idempotency_key))
+        if token is not None:
+            token.cancel("Canceled by client")
+        return {"jsonrpc": "2.0", "result": {"canceled": token is not None}, "id": request_id}
+    
+    # ============================================
+    # 스트리밍 RPC (/rpc:stream, streaming 참고)
+    # ============================================
+    
+    def _prepare_stream_rpc(self, request: Dict[str, Any]) -> Tuple[Optional["SkillEntry"], Any, Any, Optional[Dict[str, Any]], bool]:
+        """
+        _prepare_rpc + 스트리밍 입력 처리
+        
+        스킬에 스트리밍 입력 파라미터가 있는데 params에 없으면 이어지는 조각으로 받으므로,
+        검증할 때는 빈 문자열로 채워 둡니다 (호출자가 조각 스트림으로 바꿔 넣음).
+        
+        Returns:
+            (SkillEntry, params, id, 바로 반환할 응답 또는 None, 스트리밍 입력을 조각으로 받는지 여부)
+        """
+        method = request.get("method")
+        entry = self._dispatch.get(method) if isinstance(method, str) else None
+        params = request.get("params") or {}
+        streamed = (entry is not None and entry.stream_input is not None
+                    and isinstance(params, dict) and entry.stream_input not in params)
+        if streamed:
+            request = {**request, "params": {**params, entry.stream_input: ""}}
+        entry, params, request_id, response = self._prepare_rpc(request)
+        return entry, params, request_id, response, streamed and response is None
+    
+    def handle_rpc_stream(self, request: Dict[str, Any], input_chunks: Optional[Iterable[Any]] = None,
+                          deadline: Optional[float] = None,
+                          trace_context: Optional[tracing.SpanContext] = None) -> Iterator[Dict[str, Any]]:
+        """
+        스트리밍 JSON-RPC 요청 처리 (동기, 순회하는 스레드에서 스킬 실행)
+        
+        generator 스킬이 조각을 만들 때마다 반환하고, input_chunks는 순회하는 대로 스킬에 전달합니다.
+        순회를 멈추고 닫으면 스킬도 닫힙니다.
+        
+        Args:
+            request: JSON-RPC 요청 객체
+            input_chunks: 스트리밍 입력 파라미터로 전달할 조각 (params에 그 파라미터가 없을 때)
+            deadline: 마감 시각 (time.monotonic() 기준)
+            trace_context: 부모 trace context (None이면 처음 순회할 때의 context)
+        
+        Returns:
+            {"chunk": ...} 레코드와 마지막 JSON-RPC 응답을 차례로 반환하는 이터레이터
+        """
+        entry, params, request_id, response, streamed = self._prepare_stream_rpc(request)
+        if response is not None:
+            yield response
+            return
+        if streamed:
+            params[entry.stream_input] = input_chunks if input_chunks is not None else ()
+        
+        token = CancelToken(deadline)
+        # 제너레이터는 소비하는 쪽 context에서 재개되므로 span을 현재 context로 두지 않고 직접 종료
+        with tracing.use_context(trace_context):
+            span = self._skill_span("rpc.stream", entry)
+        chunks = entry.stream(params)
+        try:
+            result = None
+            while True:
+                with tracing.use_context(span.context), use_token(token):
+                    token.raise_if_cancelled()
+                    item = next(chunks, _END)
+                if item is _END:
+                    break
+                if entry.is_streaming:
+                    yield {"chunk": item}
+                else:
+                    result = item
+            response = {"jsonrpc": "2.0", "result": result, "id": request_id}
+        except TaskCancelledError as e:
+            span.record_error(e)
+            response = _rpc_error(-32000, f"Request canceled: {e}", request_id)
+        except Exception as e:
+            span.record_error(e)
+            response = _rpc_error(-32603, f"Internal error: {str(e)}", request_id)
+        finally:
+            chunks.close()
+            span.end()
+        yield response
+    
+    async def handle_rpc_stream_async(self, request: Dict[str, Any],
+                                      input_records: Optional[AsyncIterator[Any]] = None,
+                                      deadline: Optional[float] = None,
+                                      trace_context: Optional[tracing.SpanContext] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        스트리밍 JSON-RPC 요청 처리 (이벤트 루프용)
+        
+        동기 스킬은 워커 스레드에서 실행하며, 입력 조각은 도착하는 대로(InputPipe) 스킬에 전달하고
+        결과 조각은 만들어지는 대로 반환합니다. async 스킬은 입력을 모두 받은 뒤 실행합니다.
+        deadline이 지나거나 응답 스트림이 닫히면 스킬을 취소합니다.
+        
+        Args:
+            request: JSON-RPC 요청 객체
+            input_records: 요청 본문의 나머지 레코드 ({"chunk": ...})
+            deadline: 마감 시각 (time.monotonic() 기준)
+            trace_context: 부모 trace context (HTTP 헤더에서 추출)
+        """
+        entry, params, request_id, response, streamed = self._prepare_stream_rpc(request)
+        if response is not None:
+            yield response
+            return
+        
+        token = CancelToken(deadline)
+        with tracing.use_context(trace_context):
+            span = self._skill_span("rpc.stream", entry)
+        
+        loop = asyncio.get_running_loop()
+        output: asyncio.Queue = asyncio.Queue()
+        pipe: Optional[streaming.InputPipe] = None
+        feeder: Optional[asyncio.Task] = None
+        worker: Optional[asyncio.Future] = None
+        finished = False
+        
+        def emit(item: Any, error: Optional[BaseException] = None):
+            loop.call_soon_threadsafe(output.put_nowait, (item, error))
+        
+        def run():
+            # 워커 스레드: 조각을 만들 때마다 이벤트 루프로 전달
+            try:
+                with tracing.use_context(span.context), use_token(token):
+                    for item in entry.stream(params):
+                        emit(item)
+                emit(_END)
+            except BaseException as e:
+                emit(_END, e)
+        
+        async def arun():
+            try:
+                with tracing.use_context(span.context), use_token(token):
+                    output.put_nowait((await entry.ainvoke(params), None))
+                output.put_nowait((_END, None))
+            except Exception as e:
+                output.put_nowait((_END, e))
+        
+        try:
+            if not streamed:
+                if input_records is not None:
+                    # 받을 입력이 없으면 본문의 나머지는 읽어서 버림 (HTTP 연결 종료 감지는 본문을 다 읽은 뒤부터)
+                    feeder = asyncio.ensure_future(_drain(input_records))
+            else:
+                if input_records is None:
+                    params[entry.stream_input] = ()
+                elif entry.is_async:
+                    collect = asyncio.ensure_future(_gather_chunks(input_records))
+                    try:
+                        params[entry.stream_input] = await asyncio.wait_for(collect, token.remaining())
+                    except asyncio.TimeoutError:
+                        token.cancel("Deadline exceeded")
+                else:
+                    pipe = streaming.InputPipe()
+                    params[entry.stream_input] = pipe
+                    feeder = asyncio.ensure_future(streaming.feed(input_records, pipe))
+            token.raise_if_cancelled()
+            
+            worker = asyncio.ensure_future(arun() if entry.is_async else asyncio.to_thread(run))
+            result = None
+            while True:
+                try:
+                    item, error = await asyncio.wait_for(output.get(), token.remaining())
+                except asyncio.TimeoutError:
+                    # 스레드의 스킬은 다음 check_cancelled()에서 중단
+                    token.cancel("Deadline exceeded")
+                    raise TaskCancelledError(token.reason)
+                if item is _END:
+                    finished = True
+                    if error is not None:
+                        raise error
+                    break
+                if entry.is_streaming:
+                    yield {"chunk": item}
+                else:
+                    result = item
+            response = {"jsonrpc": "2.0", "result": result, "id": request_id}
+        except TaskCancelledError as e:
+            span.record_error(e)
+            response = _rpc_error(-32000, f"Request canceled: {e}", request_id)
+        except Exception as e:
+            span.record_error(e)
+            response = _rpc_error(-32603, f"Internal error: {str(e)}", request_id)
+        finally:
+            if not finished:
+                # 응답 스트림이 닫힘 (클라이언트 연결 종료) 또는 deadline
+                token.cancel("Stream closed")
+                if worker is not None and entry.is_async:
+                    worker.cancel()
+            if feeder is not None:
+                feeder.cancel()
+            if pipe is not None:
+                pipe.close(TaskCancelledError(token.reason or "Stream closed"))
+            span.end()
+        yield response
+    
+    def _skill_span(self, operation: str, entry: "SkillEntry", attributes: Optional[Dict[str, Any]] = None):
+        """
+        스킬 실행 server span (현재 trace context의 자식, tracing이 꺼져 있으면 no-op)
+        
+        워커 스레드(asyncio.to_thread)에도 context가 복사되므로 스킬 안의 LLM 호출이 이 span의 자식이 됩니다.
+        """
+        return tracing.start_span(
+            f"{operation} {entry.name}", "server",
+            {"a2a.agent": self.agent.agent_id, "a2a.skill": entry.name, **(attributes or {})}
+        )
+    
+    async def _run_skill(self, entry: "SkillEntry", params: Dict[str, Any], token: CancelToken) -> Any:
+        """
+        취소 토큰을 노출한 채로 스킬 실행
+        
+        Raises:
+            TaskCancelledError: 실행 전에 이미 취소되었거나 deadline이 지났을 때
+        """
+        token.raise_if_cancelled()
+        with use_token(token):
+            if entry.is_async:
+                run = entry.ainvoke(params)
+            else:
+                # 워커 스레드에서 실행하여 다른 요청/롱폴링이 막히지 않도록
+                run = asyncio.to_thread(entry.invoke, params)
+            try:
+                return await asyncio.wait_for(run, token.remaining())
+            except asyncio.TimeoutError:
+                # 스레드의 스킬은 다음 check_cancelled()에서 중단
+                token.cancel("Deadline exceeded")
+                raise TaskCancelledError(token.reason)
+    
+    def submit_task(self, request: CreateTaskRequest,
+                    deadline: Optional[float] = None) -> CreateTaskResponse:
+        """
+        Task 생성 및 비동기 처리 예약
+        
+        Args:
+            request: Task 생성 요청
+            deadline: 이 시각(time.monotonic() 기준)까지 끝나지 않으면 Task 취소
+        
+        Raises:
+            ValueError: 입력이 스킬 파라미터 스키마에 맞지 않을 때 (Task를 만들지 않음)
+        """
+        self.check_task_request(request)
+        task = Task(
+            status="submitted",
+            input=request.input,
+            metadata=request.metadata or {}
+        )
+        self.tasks_db[task.id] = task
+        self._task_status_gauges[task.status].inc()
+        self._task_tokens[task.id] = CancelToken(deadline)
+        if request.pushNotification:
+            self._push_configs[task.id] = request.pushNotification
+        
+        # 비동기로 작업 처리 (이벤트 루프 밖에서 호출되면 공유 이벤트 루프에서 실행)
+        # 두 경우 모두 현재 context(trace)를 이어받음
+        try:
+            asyncio.get_running_loop().create_task(self._process_task(task.id))
+        except RuntimeError:
+            asyncio.run_coroutine_threadsafe(self._process_task(task.id), _background_loop())
+        
+        return CreateTaskResponse(taskId=task.id, status=task.status)
+    
+    def submit_tasks(self, request: CreateTasksRequest,
+                     deadline: Optional[float] = None) -> CreateTasksResponse:
+        """
+        Task 일괄 생성 (deadline은 모든 Task에 적용)
+        
+        Raises:
+            ValueError: max_batch_size보다 많은 Task를 요청했거나 입력이 잘못된 Task가 있을 때
+        """
+        self._check_batch_size(len(request.tasks))
+        # 일부만 생성되지 않도록 모두 검증한 뒤 생성
+        for task_request in request.tasks:
+            self.check_task_request(task_request)
+        return CreateTasksResponse(tasks=[self.submit_task(t, deadline) for t in request.tasks])
+    
+    def check_task_request(self, request: CreateTaskRequest):
+        """
+        Task 입력을 실행할 스킬의 파라미터 스키마로 검증
+        
+        push webhook URL도 검사합니다 (http/https, 허용하지 않는 IP 리터럴은 여기서 거절하고
+        호스트 이름은 전송 직전에 해석하여 검사).
+        
+        Raises:
+            ValueError: 입력이 스키마에 맞지 않을 때
+            PushURLError: 허용하지 않는 webhook URL (ValueError)
+        """
+        if request.pushNotification:
+            check_push_url(request.pushNotification.url, self.push_allowlist, resolve=False)
+        skill_name = self._task_skill_name(request.metadata)
+        if skill_name:
+            error = self.validate_params(skill_name, request.input.data or {})
+            if error:
+                raise ValueError(f"Invalid input for skill '{skill_name}': {error}")
+    
+    def _task_skill_name(self, metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Task를 실행할 스킬 이름 (metadata의 skill, 없으면 첫 번째 스킬)"""
+        return (metadata or {}).get("skill") or self._default_skill
+    
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Task 조회"""
+        return self.tasks_db.get(task_id)
+    
+    def cancel_task(self, task_id: str, reason: str = "Canceled by client") -> Optional[Task]:
+        """
+        Task 취소
+        
+        대기 중인 Task는 실행되지 않고, 실행 중인 스킬은 다음 check_cancelled() 지점에서 중단됩니다.
+        이미 끝난 Task는 그대로 둡니다.
+        
+        Returns:
+            Task (없으면 None)
+        """
+        task = self.tasks_db.get(task_id)
+        if task is None or task.status in TERMINAL_TASK_STATUSES:
+            return task
+        
+        token = self._task_tokens.pop(task_id, None)
+        if token is not None:
+            token.cancel(reason)
+        task.metadata["error"] = reason
+        self._set_task_status(task, "canceled")
+        return task
+    
+    def get_tasks(self, request: GetTasksStatusRequest) -> Dict[str, Any]:
+        """
+        Task 일괄 조회
+        
+        Returns:
+            {"tasks": [요청 순서대로 찾은 Task], "missing": [없는 Task ID]}
+        
+        Raises:
+            ValueError: max_batch_size보다 많은 Task를 요청했을 때
+        """
+        self._check_batch_size(len(request.taskIds))
+        tasks, missing = [], []
+        for task_id in request.taskIds:
+            task = self.tasks_db.get(task_id)
+            if task is None:
+                missing.append(task_id)
+            else:
+                tasks.append(self.project_task(task, request.fields))
+        return {"tasks": tasks, "missing": missing}
+    
+    def _check_batch_size(self, size: int):
+        if size > self.max_batch_size:
+            raise ValueError(f"Batch too large: {size} tasks (max {self.max_batch_size})")
+    
+    def _set_task_status(self, task: Task, status: TaskStatus):
+        """Task 상태 변경 후 대기 중인 롱폴링 요청에 알림"""
+        self._task_status_gauges[task.status].dec()
+        self._task_status_gauges[status].inc()
+        task.status = status
+        task.updatedAt = datetime.utcnow()
+        
+        entry = self._task_events.pop(task.id, None)
+        if entry is not None:
+            loop, event = entry
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                event.set()
+            else:
+                loop.call_soon_threadsafe(event.set)
+        
+        with self._task_changed:
+            self._task_changed.notify_all()
+        
+        if status in TERMINAL_TASK_STATUSES:
+            self._push_completion(task)
+    
+    def _push_completion(self, task: Task):
+        """등록된 webhook이 있으면 완료 이벤트 전송 예약"""
+        config = self._push_configs.pop(task.id, None)
+        if config is None:
+            return
+        with self._notifier_lock:
+            if self._notifier is None:
+                self._notifier = PushNotifier(queue_size=self.push_queue_size, allowlist=self.push_allowlist)
+        self._notifier.notify(config.url, completion_event(task.model_dump()), config.token)
+    
+    def _push_queue_depth(self):
+        """a2a_push_queue_depth 값 (조회 시점에 계산)"""
+        pending = self._notifier.pending if self._notifier is not None else 0
+        return [((self.agent.agent_id,), pending)]
+    
+    async def wait_for_task_change(self, task_id: str, status: TaskStatus, timeout: float):
+        """
+        Task 상태가 status에서 바뀌거나 timeout이 지날 때까지 대기 (이벤트 루프용)
+        
+        Args:
+            task_id: Task ID
+            status: 요청 시점의 상태
+            timeout: 최대 대기 시간 (초)
+        """
+        task = self.tasks_db.get(task_id)
+        if task is None or task.status != status or status in TERMINAL_TASK_STATUSES:
+            return
+        
+        entry = self._task_events.get(task_id)
+        if entry is None:
+            entry = (asyncio.get_running_loop(), asyncio.Event())
+            self._task_events[task_id] = entry
+        
+        try:
+            await asyncio.wait_for(entry[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    def wait_for_task_change_sync(self, task_id: str, status: TaskStatus, timeout: float):
+        """wait_for_task_change의 동기 버전 (in-process 전송용)"""
+        deadline = time.monotonic() + timeout
+        with self._task_changed:
+            while True:
+                task = self.tasks_db.get(task_id)
+                if task is None or task.status != status or status in TERMINAL_TASK_STATUSES:
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._task_changed.wait(remaining)
+    
+    @staticmethod
+    def project_task(task: Task, fields: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Task를 응답용 딕셔너리로 변환
+        
+        Args:
+            task: Task
+            fields: 쉼표로 구분한 필드 목록 (예: "status"). None이면 전체. id는 항상 포함
+        
+        Returns:
+            Task 딕셔너리
+        """
+        if not fields:
+            return task.model_dump()
+        
+        projected = {"id": task.id}
+        for name in fields.split(","):
+            name = name.strip()
+            if name in Task.model_fields:
+                projected[name] = getattr(task, name)
+        return projected
+    
+    def health(self) -> Dict[str, Any]:
+        """서버 상태"""
+        return {
+            "status": "ok",
+            "agent": self.agent.agent_id,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    def _respond(self, request: Request, content: Any, status_code: int = 200) -> Response:
+        """
+        codec으로 인코딩한 바이트를 그대로 반환 (jsonable_encoder 생략)
+        
+        Accept로 인코딩을, Accept-Encoding으로 압축 방식을 협상합니다.
+        응답의 Accept-Encoding 헤더로 서버가 받을 수 있는 요청 압축 방식을 알립니다.
+        """
+        media_type = codec.negotiate(request.headers.get("accept"))
+        body = codec.encode(content, media_type)
+        headers = {
+            "Vary": "Accept, Accept-Encoding",
+            "Accept-Encoding": ", ".join(codec.SUPPORTED_ENCODINGS)
+        }
+        
+        if self.compression_threshold is not None and len(body) >= self.compression_threshold:
+            encoding = codec.choose_encoding(request.headers.get("accept-encoding"))
+            if encoding:
+                body = codec.compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+        
+        return Response(content=body, status_code=status_code, media_type=media_type, headers=headers)
     
     def _register_routes(self):
         """A2A 표준 엔드포인트 자동 등록"""
         
         @self.app.get("/.well-known/agent.json")
-        async def get_agent_card():
-            """Agent Card 반환 (A2A 표준)"""
-            card_dict = self.agent.get_agent_card()
-            # URL 추가
-            card_dict["url"] = f"http://localhost:{self.port}"
-            return card_dict
+        async def get_agent_card(request: Request):
+            """Agent Card 반환 (A2A 표준, If-None-Match 지원)"""
+            media_type = codec.negotiate(request.headers.get("accept"))
+            body, etag = self._agent_card_body(media_type)
+            headers = {
+                "ETag": etag,
+                "Cache-Control": f"public, max-age={self.card_max_age}",
+                "Vary": "Accept",
+                "Accept-Encoding": ", ".join(codec.SUPPORTED_ENCODINGS)
+            }
+            if _if_none_match(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type=media_type, headers=headers)
         
         @self.app.post("/rpc")
-        async def json_rpc_endpoint(request: dict):
+        async def json_rpc_endpoint(request: Request):
             """
             JSON-RPC 2.0 엔드포인트 (A2A 표준)
             
             클라이언트가 스킬을 직접 호출할 수 있는 엔드포인트
+            요청/응답은 codec으로 직접 처리 (JSON 기본, Accept/Content-Type으로 MessagePack 협상)
             """
-            # JSON-RPC 2.0 요청 검증
-            if request.get("jsonrpc") != "2.0":
-                return {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32600,
-                        "message": "Invalid Request: jsonrpc must be '2.0'"
-                    },
-                    "id": request.get("id")
-                }
-            
-            method = request.get("method")
-            params = request.get("params", {})
-            request_id = request.get("id")
-            
-            if not method:
-                return {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32600,
-                        "message": "Invalid Request: method is required"
-                    },
-                    "id": request_id
-                }
-            
-            # 스킬 존재 여부 확인
-            skill = self.agent.get_skill(method)
-            if not skill:
-                return {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: '{method}'"
-                    },
-                    "id": request_id
-                }
-            
-            # 스킬 실행
             try:
-                result = self.agent.execute_skill(method, **params)
-                return {
+                rpc_request = await _decode_body(request)
+            except ValueError:
+                return self._respond(request, {
                     "jsonrpc": "2.0",
-                    "result": result,
-                    "id": request_id
-                }
-            except Exception as e:
-                return {
+                    "error": {"code": -32700, "message": "Parse error"},
+                    "id": None
+                })
+            if not isinstance(rpc_request, dict):
+                return self._respond(request, {
                     "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32603,
-                        "message": f"Internal error: {str(e)}"
-                    },
-                    "id": request_id
-                }
-        
-        @self.app.post("/tasks")
-        async def create_task(request: CreateTaskRequest) -> CreateTaskResponse:
-            """Task 생성 (A2A 표준 - Task-based API)"""
-            task = Task(
-                status="submitted",
-                input=request.input,
-                metadata=request.metadata or {}
+                    "error": {"code": -32600, "message": "Invalid Request: object expected"},
+                    "id": None
+                })
+            
+            deadline = deadline_from_header(request.headers.get(DEADLINE_HEADER))
+            with tracing.use_context(tracing.extract(request.headers)):
+                response = await self.handle_rpc_async(
+                    rpc_request, deadline, request.headers.get(IDEMPOTENCY_HEADER)
+                )
+            try:
+                return self._respond(request, response)
+            except codec.ENCODE_ERRORS as e:
+                # 스킬 결과를 인코딩할 수 없음: HTTP 500이면 클라이언트가 재시도하므로 JSON-RPC 오류로 응답
+                return self._respond(request, _unserializable(e, rpc_request.get("id")))
+        
+        @self.app.post("/rpc:stream")
+        async def json_rpc_stream_endpoint(request: Request):
+            """
+            스트리밍 JSON-RPC 엔드포인트 (NDJSON, streaming 참고)
+            
+            본문의 첫 줄은 JSON-RPC 요청, 이어지는 {"chunk": ...} 줄은 스킬의 스트리밍 입력입니다.
+            응답은 generator 스킬이 만든 {"chunk": ...} 줄들과 마지막 JSON-RPC 응답입니다.
+            """
+            records = streaming.aiter_records(request.stream())
+            body_read = asyncio.Event()
+            
+            async def input_records():
+                try:
+                    async for record in records:
+                        yield record
+                finally:
+                    body_read.set()
+            
+            try:
+                rpc_request = await records.__anext__()
+            except (StopAsyncIteration, ValueError):
+                error = {"code": -32700, "message": "Parse error"}
+                return Response(content=streaming.encode_record({"jsonrpc": "2.0", "error": error, "id": None}),
+                                media_type=streaming.NDJSON_MEDIA_TYPE)
+            if not isinstance(rpc_request, dict):
+                error = {"code": -32600, "message": "Invalid Request: object expected"}
+                return Response(content=streaming.encode_record({"jsonrpc": "2.0", "error": error, "id": None}),
+                                media_type=streaming.NDJSON_MEDIA_TYPE)
+            
+            responses = self.handle_rpc_stream_async(
+                rpc_request, input_records(), deadline_from_header(request.headers.get(DEADLINE_HEADER)),
+                tracing.extract(request.headers)
             )
-            self.tasks_db[task.id] = task
             
-            # 비동기로 작업 처리
-            asyncio.create_task(self._process_task(task.id))
+            async def body():
+                try:
+                    async for record in responses:
+                        try:
+                            line = streaming.encode_record(record)
+                        except codec.ENCODE_ERRORS as e:
+                            # 남은 실행은 취소하고 JSON-RPC 오류로 끝냄
+                            yield streaming.encode_record(_unserializable(e, rpc_request.get("id")))
+                            return
+                        yield line
+                finally:
+                    await responses.aclose()
+            
+            return _DuplexStreamingResponse(body(), body_read, media_type=streaming.NDJSON_MEDIA_TYPE)
+        
+        @self.app.post("/tasks", response_model=CreateTaskResponse)
+        async def create_task(request: Request):
+            """Task 생성 (A2A 표준 - Task-based API)"""
+            try:
+                task_request = CreateTaskRequest.model_validate(await _decode_body(request))
+                deadline = deadline_from_header(request.headers.get(DEADLINE_HEADER))
+                # Task 처리 코루틴이 요청의 trace context를 이어받도록
+                with tracing.use_context(tracing.extract(request.headers)):
+                    response = self.submit_task(task_request, deadline)
+            except (ValueError, ValidationError) as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            
+            return self._respond(request, response.model_dump())
+        
+        @self.app.post("/tasks:batch", response_model=CreateTasksResponse)
+        async def create_tasks(request: Request):
+            """Task 일괄 생성 - 응답의 tasks는 요청 순서와 같음"""
+            try:
+                batch = CreateTasksRequest.model_validate(await _decode_body(request))
+                deadline = deadline_from_header(request.headers.get(DEADLINE_HEADER))
+                with tracing.use_context(tracing.extract(request.headers)):
+                    response = self.submit_tasks(batch, deadline)
+            except (ValueError, ValidationError) as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            
+            return self._respond(request, response.model_dump())
+        
+        @self.app.post("/tasks:status", response_model=GetTasksStatusResponse)
+        async def get_tasks_status(request: Request):
+            """
+            Task 일괄 상태 조회
+            
+            {"taskIds": [...], "fields": "status"} → {"tasks": [...], "missing": [...]}
+            """
+            try:
+                query = GetTasksStatusRequest.model_validate(await _decode_body(request))
+                response = self.get_tasks(query)
+            except (ValueError, ValidationError) as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            
+            return self._respond(request, response)
+        
+        @self.app.get("/tasks/{task_id}", response_model=GetTaskStatusResponse)
+        async def get_task_status(task_id: str, request: Request,
+                                  fields: Optional[str] = None, wait: Optional[float] = None):
+            """
+            Task 상태 조회 (A2A 표준)
+            
+            ?fields=status     → 입력/출력 없이 {id, status}만 반환
+            ?wait=<seconds>    → 상태가 바뀔 때까지 최대 wait초 대기 (롱폴링)
+            """
+            task = self.get_task(task_id)
+            if task is None:
+                raise HTTPException(status_code=404, detail="Task not found")
+            
+            if wait:
+                timeout = min(max(wait, 0.0), self.max_task_wait)
+                await self.wait_for_task_change(task_id, task.status, timeout)
             
-            return CreateTaskResponse(taskId=task.id, status=task.status)
+            return self._respond(request, {"task": self.project_task(task, fields)})
         
-        @self.app.get("/tasks/{task_id}")
-        async def get_task_status(task_id: str) -> GetTaskStatusResponse:
-            """Task 상태 조회 (A2A 표준)"""
-            if task_id not in self.tasks_db:
+        @self.app.post("/tasks/{task_id}/cancel", response_model=GetTaskStatusResponse)
+        async def cancel_task(task_id: str, request: Request):
+            """Task 취소 (이미 완료/실패한 Task면 409)"""
+            task = self.cancel_task(task_id)
+            if task is None:
                 raise HTTPException(status_code=404, detail="Task not found")
+            if task.status != "canceled":
+                raise HTTPException(status_code=409, detail=f"Task already {task.status}")
             
-            return GetTaskStatusResponse(task=self.tasks_db[task_id])
+            return self._respond(request, {"task": self.project_task(task, "status,metadata")})
+        
+        @self.app.get("/metrics")
+        async def metrics_endpoint():
+            """Prometheus 메트릭 (text format 0.0.4)"""
+            return Response(content=self.metrics_registry.render(), media_type=metrics.CONTENT_TYPE)
+        
+        if self.enable_profiler:
+            @self.app.get("/admin/profile")
+            async def profile_endpoint(request: Request, seconds: float = 10.0, mode: str = "cpu",
+                                       interval: float = profiler.DEFAULT_INTERVAL,
+                                       idle: bool = False, lines: bool = False):
+                """
+                샘플링 프로파일 (flamegraph용 collapsed stack, localhost 전용)
+                
+                ?seconds=<초>       프로파일링 시간 (최대 60초)
+                ?mode=cpu|memory    스택 샘플링 / tracemalloc 할당 추적
+                ?interval=<초>      cpu 샘플 간격 (기본 0.01)
+                ?idle=true          대기 중인 스레드 포함
+                ?lines=true         프레임에 줄 번호 포함
+                """
+                if not _is_local_request(request):
+                    raise HTTPException(status_code=403, detail="Profiling is only available from localhost")
+                
+                logger.info("profiler.started", agent=self.agent.agent_id, mode=mode, seconds=seconds)
+                try:
+                    # 이벤트 루프는 계속 요청을 처리하고, 샘플러는 별도 스레드에서 실행
+                    text = await asyncio.to_thread(
+                        profiler.profile, mode, seconds, interval, idle, lines
+                    )
+                except ValueError as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+                except profiler.ProfilerBusyError as e:
+                    raise HTTPException(status_code=409, detail=str(e))
+                logger.info("profiler.finished", agent=self.agent.agent_id, mode=mode, stacks=text.count("\n"))
+                
+                filename = f"{self.agent.agent_id}-{mode}-{time.strftime('%Y%m%dT%H%M%S')}.folded"
+                return Response(
+                    content=text,
+                    media_type="text/plain; charset=utf-8",
+                    headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+                )
         
         @self.app.get("/health")
         async def health_check():
             """서버 상태 확인"""
-            return {
-                "status": "ok",
-                "agent": self.agent.agent_id,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return self.health()
         
         @self.app.get("/")
         async def root():
-            """루트 엔드포인트"""
-            return {
-                "name": self.agent.name,
-                "version": self.agent.version,
-                "protocol": "A2A v1.0",
-                "agent_card": "/.well-known/agent.json",
-                "rpc_endpoint": "/rpc",
-                "task_endpoint": "/tasks",
-                "skills": [s.name for s in self.agent.get_skills()]
-            }
+            """루트 엔드포인트 (디스패치 테이블이 바뀔 때까지 캐시)"""
+            if self._root_body is None:
+                self._root_body = codec.dumps({
+                    "name": self.agent.name,
+                    "version": self.agent.version,
+                    "protocol": "A2A v1.0",
+                    "agent_card": "/.well-known/agent.json",
+                    "rpc_endpoint": "/rpc",
+                    "stream_endpoint": "/rpc:stream",
+                    "task_endpoint": "/tasks",
+                    "skills": list(self._dispatch)
+                })
+            return Response(content=self._root_body, media_type=codec.JSON_MEDIA_TYPE)
     
     async def _process_task(self, task_id: str):
-        """Task 처리"""
+        """Task 처리 (취소되었거나 deadline이 지난 Task는 실행하지 않음)"""
         if task_id not in self.tasks_db:
             return
         
         task = self.tasks_db[task_id]
+        token = self._task_tokens.get(task_id) or CancelToken()
         
         try:
-            task.status = "working"
-            task.updatedAt = datetime.utcnow()
+            if task.status in TERMINAL_TASK_STATUSES:
+                return
+            token.raise_if_cancelled()
+            self._set_task_status(task, "working")
             
             # 입력 데이터 추출
             input_data = task.input.data or {}
             
-            # 스킬 이름 결정 (metadata 또는 첫 번째 스킬 사용)
-            skill_name = task.metadata.get("skill")
-            if not skill_name:
-                skills = self.agent.get_skills()
-                if skills:
-                    skill_name = skills[0].name
-            
+            # 스킬 이름 결정 (metadata 또는 첫 번째 스킬 사용, 입력은 생성 시 검증됨)
+            skill_name = self._task_skill_name(task.metadata)
             if not skill_name:
                 raise ValueError("No skill specified and no default skill available")
             
-            # 스킬 실행
-            result = self.agent.execute_skill(skill_name, **input_data)
+            entry = self._dispatch.get(skill_name)
+            if entry is None:
+                raise ValueError(f"Skill not found: '{skill_name}'")
+            
+            # 스킬 실행 (deadline이 지나면 기다리지 않고 취소)
+            with self._skill_span("task", entry, {"a2a.task_id": task_id}):
+                result = await self._run_skill(entry, input_data, token)
+            
+            # 실행 중에 취소되었으면 결과 버림
+            if task.status in TERMINAL_TASK_STATUSES:
+                return
             
             # 결과 저장
             task.output = TaskOutput(text=str(result))
-            task.status = "completed"
-            task.updatedAt = datetime.utcnow()
-            
+            self._set_task_status(task, "completed")
+        
+        except TaskCancelledError as e:
+            if task.status not in TERMINAL_TASK_STATUSES:
+                task.metadata["error"] = str(e)
+                self._set_task_status(task, "canceled")
+        
         except Exception as e:
-            task.status = "failed"
-            task.metadata["error"] = str(e)
-            task.updatedAt = datetime.utcnow()
+            if task.status not in TERMINAL_TASK_STATUSES:
+                task.metadata["error"] = str(e)
+                self._set_task_status(task, "failed")
+        
+        finally:
+            self._task_tokens.pop(task_id, None)
     
     def run(self, **uvicorn_kwargs):
         """서버 실행"""
@@ -203,16 +1567,33 @@ class A2AServer:
         if sys.platform == 'win32':
             sys.stdout.reconfigure(encoding='utf-8')
         
-        print(f" Starting {self.agent.name} on http://{self.host}:{self.port}")
-        print(f" Agent Card: http://localhost:{self.port}/.well-known/agent.json")
-        print(f" Skills: {', '.join([s.name for s in self.agent.get_skills()])}")
-        print()
-        
-        uvicorn.run(
-            self.app,
-            host=self.host,
-            port=self.port,
-            log_level=uvicorn_kwargs.get("log_level", "info"),
-            **{k: v for k, v in uvicorn_kwargs.items() if k != "log_level"}
+        if self.uds:
+            uvicorn_kwargs.setdefault("uds", self.uds)
+        url = self.url
+        logger.info(
+            "server.starting", agent=self.agent.name, url=url,
+            agent_card=f"{url}/.well-known/agent.json" if not self.uds else None,
+            skills=list(self._dispatch)
         )
+        
+        try:
+            uvicorn.run(
+                self.app,
+                host=self.host,
+                port=self.port,
+                log_level=uvicorn_kwargs.get("log_level", "info"),
+                **{k: v for k, v in uvicorn_kwargs.items() if k != "log_level"}
+            )
+        finally:
+            self.close()
+    
+    def close(self):
+        """in-process 등록 해제 (이 서버가 등록되어 있을 때만), push 전송 워커 종료"""
+        try:
+            with self._notifier_lock:
+                notifier, self._notifier = self._notifier, None
+            if notifier is not None:
+                notifier.close()
+        finally:
+            unregister_local_server(self.local_url, self)
 
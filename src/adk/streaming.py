@@ -0,0 +1,281 @@
+"""
+A2A Agent Development Kit - Streaming RPC
+스킬 결과를 만들어지는 대로 받고, 그 조각을 다음 스킬의 입력으로 바로 넘기는 /rpc:stream (NDJSON)
+
+요청 본문 (한 줄에 JSON 하나):
+    {"jsonrpc": "2.0", "method": "save_to_file", "params": {"title": "report"}, "id": 1}
+    {"chunk": "첫 조각"}             스킬의 스트리밍 입력 파라미터(schema.STREAM_KEY)로 전달
+    {"chunk": "다음 조각"}
+응답 본문:
+    {"chunk": "..."}                generator 스킬이 yield한 조각
+    {"jsonrpc": "2.0", "result": ..., "id": 1}   마지막 줄 (generator 스킬이면 result는 null, 실패하면 error)
+
+앞 단계의 SkillStream을 다음 호출의 input_stream으로 넘기면, 앞 에이전트가 생성하는 조각이
+도착하는 대로 다음 에이전트의 스킬로 전달됩니다.
+
+    revised = discovery.stream_skill(writer_url, "revise", draft=draft, review_feedback=review)
+    saved = discovery.stream_skill(reporter_url, "save_to_file", input_stream=revised, title="report")
+    saved.result()     # save_to_file은 revise가 생성하는 동안 파일에 쓰기 시작
+    revised.result()   # 전달된 전체 텍스트 (다음 단계에서 재사용)
+
+httpx 동기 클라이언트는 요청 본문을 다 보낸 뒤 응답을 읽으므로, 입력 스트림을 받는 호출의
+응답 조각은 입력이 끝난 뒤에 도착합니다. 입력과 겹쳐 실행되는 것은 받는 쪽 스킬의 실행입니다.
+"""
+import asyncio
+import queue
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional
+
+from . import codec
+from .cancellation import TaskCancelledError
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_END = object()
+
+
+# ============================================
+# NDJSON 레코드
+# ============================================
+
+def encode_record(record: Any) -> bytes:
+    """레코드 하나를 NDJSON 한 줄로 인코딩 (문자열 안의 줄바꿈은 JSON이 이스케이프)"""
+    return codec.dumps(record) + b"\n"
+
+
+def encode_request(payload: Dict[str, Any], input_chunks: Optional[Iterable[Any]] = None) -> Iterator[bytes]:
+    """/rpc:stream 요청 본문 (JSON-RPC 요청 다음에 입력 조각을 만들어지는 대로)"""
+    yield encode_record(payload)
+    if input_chunks is not None:
+        for chunk in input_chunks:
+            yield encode_record({"chunk": chunk})
+
+
+def iter_records(lines: Iterable[Any]) -> Iterator[Any]:
+    """NDJSON 줄 → 레코드 (빈 줄 무시)"""
+    for line in lines:
+        if line.strip():
+            yield codec.loads(line)
+
+
+async def aiter_records(data: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    바이트 스트림(요청 본문) → 레코드
+    
+    Raises:
+        ValueError: 해석할 수 없는 줄
+    """
+    buffer = b""
+    async for block in data:
+        buffer += block
+        if b"\n" not in block:
+            continue
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield codec.loads(line)
+    if buffer.strip():
+        yield codec.loads(buffer)
+
+
+async def achunks(records: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """
+    입력 레코드 → 조각
+    
+    Raises:
+        ValueError: {"chunk": ...} 형식이 아닌 레코드
+    """
+    async for record in records:
+        if not isinstance(record, dict) or "chunk" not in record:
+            raise ValueError('input records must be {"chunk": ...} objects')
+        yield record["chunk"]
+
+
+def is_response(record: Any) -> bool:
+    """마지막 JSON-RPC 응답 레코드인지 ({"chunk": ...}가 아닌지)"""
+    return not (isinstance(record, dict) and "chunk" in record and "jsonrpc" not in record)
+
+
+def collect(chunks: List[Any]) -> Any:
+    """받은 조각을 한 번에 반환할 값으로 합치기 (문자열 조각이면 이어붙임)"""
+    return "".join(chunks) if all(isinstance(c, str) for c in chunks) else chunks
+
+
+# ============================================
+# 서버: 입력 조각 전달
+# ============================================
+
+class InputPipe:
+    """
+    이벤트 루프가 받은 입력 조각을 워커 스레드의 스킬에 전달하는 동기 이터레이터
+    
+    스킬은 일반 for 루프로 읽고, 다음 조각이 도착할 때까지 기다립니다.
+    close(error)로 닫으면 스킬의 for 루프에서 그 예외가 발생합니다 (취소, 잘못된 입력).
+    """
+    
+    def __init__(self):
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    
+    def put(self, chunk: Any):
+        self._queue.put((chunk, None))
+    
+    def close(self, error: Optional[BaseException] = None):
+        self._queue.put((_END, error))
+    
+    def __iter__(self) -> "InputPipe":
+        return self
+    
+    def __next__(self) -> Any:
+        chunk, error = self._queue.get()
+        if chunk is _END:
+            # 다시 읽어도 같은 결과
+            self._queue.put((_END, error))
+            if error is not None:
+                raise error
+            raise StopIteration
+        return chunk
+
+
+async def feed(records: AsyncIterator[Any], pipe: InputPipe):
+    """입력 레코드의 조각을 파이프로 전달하고 닫기 (취소되거나 잘못된 레코드면 오류로 닫음)"""
+    try:
+        async for chunk in achunks(records):
+            pipe.put(chunk)
+    except asyncio.CancelledError:
+        pipe.close(TaskCancelledError("Stream closed"))
+        raise
+    except Exception as e:
+        pipe.close(e)
+    else:
+        pipe.close()
+
+
+# ============================================
+# 클라이언트: 스트리밍 호출 결과
+# ============================================
+
+class SkillStream:
+    """
+    스트리밍 스킬 호출 (조각 이터레이터)
+    
+    순회하면 에이전트가 보내는 조각을 도착하는 대로 반환하고, 받은 조각은 모아 둡니다.
+    요청은 처음 순회할 때(또는 result()를 호출할 때) 보내므로, 다른 호출의 input_stream으로
+    넘기면 그 호출이 입력을 보내기 시작할 때 실행됩니다.
+    
+    Usage:
+        with discovery.stream_skill(url, "write", bullets=research) as draft:
+            for chunk in draft:
+                print(chunk, end="", flush=True)
+            text = draft.result()
+    """
+    
+    def __init__(self, records: Iterator[Dict[str, Any]], skill_name: str = "",
+                 on_chunk: Optional[Callable[[Any], None]] = None):
+        """
+        Args:
+            records: 전송 계층의 rpc_stream 레코드 이터레이터
+            skill_name: 스킬 이름 (repr용)
+            on_chunk: 조각을 받을 때마다 호출 (다른 호출에 넘긴 스트림의 진행 상황 출력용)
+        """
+        self.skill_name = skill_name
+        self.on_chunk = on_chunk
+        self._records = records
+        self._chunks: List[Any] = []
+        self._response: Optional[Dict[str, Any]] = None
+    
+    @property
+    def chunks(self) -> List[Any]:
+        """지금까지 받은 조각"""
+        return list(self._chunks)
+    
+    def __iter__(self) -> "SkillStream":
+        return self
+    
+    def __next__(self) -> Any:
+        """
+        다음 조각
+        
+        Raises:
+            Exception: RPC 에러 응답
+            ConnectionError: 응답 없이 스트림이 끝났을 때
+        """
+        while self._response is None:
+            record = next(self._records, _END)
+            if record is _END:
+                raise ConnectionError(f"Stream for '{self.skill_name}' ended without a response")
+            if is_response(record):
+                self._response = record
+                # 스트림을 끝까지 읽어 연결과 호출 기록을 정리
+                for _ in self._records:
+                    pass
+                break
+            chunk = record["chunk"]
+            self._chunks.append(chunk)
+            if self.on_chunk is not None:
+                self.on_chunk(chunk)
+            return chunk
+        
+        if "error" in self._response:
+            error = self._response["error"]
+            raise Exception(f"RPC Error [{error.get('code')}]: {error.get('message')}")
+        raise StopIteration
+    
+    def result(self) -> Any:
+        """
+        남은 조각을 모두 받고 최종 결과 반환
+        
+        Returns:
+            generator 스킬이면 받은 조각 (문자열이면 이어붙인 텍스트), 아니면 스킬 결과
+        """
+        for _ in self:
+            pass
+        result = self._response.get("result")
+        return collect(self._chunks) if result is None and self._chunks else result
+    
+    def close(self):
+        """응답을 끝까지 받지 않고 종료 (HTTP 스트림을 닫으면 서버가 스킬을 취소)"""
+        close = getattr(self._records, "close", None)
+        if close is not None:
+            close()
+    
+    def __enter__(self) -> "SkillStream":
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+    
+    def __repr__(self):
+        return f"<SkillStream(skill='{self.skill_name}', chunks={len(self._chunks)})>"
+
+
+def traced(records: Iterator[Dict[str, Any]], span) -> Iterator[Dict[str, Any]]:
+    """스트림이 끝나거나 닫힐 때 client span 종료 (오류 응답/예외는 span에 기록)"""
+    try:
+        for record in records:
+            if isinstance(record, dict) and "error" in record:
+                span.record_error(record["error"].get("message"))
+            yield record
+    except Exception as e:
+        span.record_error(e)
+        raise
+    finally:
+        close = getattr(records, "close", None)
+        if close is not None:
+            close()
+        span.end()
+
+
+__all__ = [
+    'NDJSON_MEDIA_TYPE',
+    'SkillStream',
+    'InputPipe',
+    'encode_record',
+    'encode_request',
+    'iter_records',
+    'aiter_records',
+    'achunks',
+    'feed',
+    'traced',
+    'is_response',
+    'collect',
+]
@@ -0,0 +1,657 @@
+"""
+A2A Agent Development Kit - Tracing
+W3C Trace Context(traceparent)로 파이프라인 → 디스커버리 → 에이전트 → LLM 호출을 하나의 trace로 연결
+
+span은 현재 context(contextvars)에 연결되므로 같은 프로세스 안에서는 자동으로 부모-자식 관계가 만들어지고,
+HTTP 전송은 요청마다 traceparent 헤더를 보내 다른 프로세스의 에이전트 span이 같은 trace에 이어집니다.
+
+    from src.adk import tracing
+    
+    with tracing.start_span("pipeline", attributes={"query": query}) as span:
+        discovery.execute_skill(url, "write", bullets="...")   # 자식 span + traceparent 전파
+
+exporter가 설정되지 않으면 span을 만들지 않으므로(no-op) 비용이 거의 없습니다.
+
+환경 변수 (처음 span을 만들 때 읽음):
+    A2A_TRACE_FILE        span을 JSON Lines로 추가 기록할 파일 (여러 프로세스가 같은 파일 공유 가능)
+    A2A_OTLP_ENDPOINT     OTLP/HTTP(JSON) 수집기 주소 (예: http://localhost:4318)
+    A2A_SERVICE_NAME      span에 기록할 서비스 이름 (기본: 실행한 스크립트 이름)
+
+기록된 파일은 trace별 span 트리와 critical path로 볼 수 있습니다:
+    python -m src.adk.tracing traces.jsonl
+"""
+import atexit
+import contextvars
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import httpx
+
+
+TRACEPARENT_HEADER = "traceparent"
+
+# OTLP span kind
+_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+# ============================================
+# Trace Context
+# ============================================
+
+class SpanContext:
+    """다른 span/프로세스로 전파되는 trace 식별 정보"""
+    
+    __slots__ = ("trace_id", "span_id", "sampled")
+    
+    def __init__(self, trace_id: str, span_id: str, sampled: bool = True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+    
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent 헤더 값 (version 00)"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+    
+    def __repr__(self):
+        return f"SpanContext({self.traceparent})"
+
+
+def _is_hex(value: str, length: int) -> bool:
+    if len(value) != length:
+        return False
+    try:
+        int(value, 16)
+    except ValueError:
+        return False
+    # 대문자 금지, 모두 0인 ID는 무효
+    return value == value.lower() and value.strip("0") != ""
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """
+    traceparent 헤더 파싱
+    
+    Returns:
+        SpanContext (헤더가 없거나 형식이 잘못되었으면 None)
+    """
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) < 4:
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    if len(version) != 2 or version == "ff" or (version == "00" and len(parts) != 4):
+        return None
+    if not _is_hex(trace_id, 32) or not _is_hex(span_id, 16) or len(flags) != 2:
+        return None
+    try:
+        sampled = bool(int(flags, 16) & 0x01)
+    except ValueError:
+        return None
+    return SpanContext(trace_id, span_id, sampled)
+
+
+_current: contextvars.ContextVar[Optional[SpanContext]] = contextvars.ContextVar(
+    "a2a_trace_context", default=None
+)
+
+
+def current_context() -> Optional[SpanContext]:
+    """현재 실행 중인 span의 context (없으면 None)"""
+    return _current.get()
+
+
+class use_context:
+    """
+    블록 안의 코드에 ctx를 현재 trace context로 노출 (수신한 traceparent 연결용)
+        
+        with use_context(extract(request.headers)):
+            ...
+    """
+    
+    __slots__ = ("ctx", "_reset")
+    
+    def __init__(self, ctx: Optional[SpanContext]):
+        self.ctx = ctx
+    
+    def __enter__(self) -> Optional[SpanContext]:
+        self._reset = _current.set(self.ctx) if self.ctx is not None else None
+        return self.ctx
+    
+    def __exit__(self, *args):
+        if self._reset is not None:
+            _current.reset(self._reset)
+
+
+def extract(headers: Mapping[str, str]) -> Optional[SpanContext]:
+    """요청 헤더에서 trace context 추출"""
+    return parse_traceparent(headers.get(TRACEPARENT_HEADER))
+
+
+def inject(headers: Dict[str, str]) -> Dict[str, str]:
+    """현재 trace context를 요청 헤더에 추가 (context가 없으면 그대로)"""
+    ctx = _current.get()
+    if ctx is not None:
+        headers[TRACEPARENT_HEADER] = ctx.traceparent
+    return headers
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+# ============================================
+# Span
+# ============================================
+
+class Span:
+    """
+    하나의 작업 구간
+    
+    with 블록으로 쓰면 블록 안에서 현재 span이 되고, 블록을 나갈 때 끝납니다.
+    제너레이터처럼 context를 벗어나는 구간은 with 없이 만들고 end()를 직접 호출합니다.
+    """
+    
+    __slots__ = ("name", "context", "parent_id", "kind", "attributes", "status", "error",
+                 "start_ns", "end_ns", "_start_perf", "_tracer", "_reset")
+    
+    def __init__(self, tracer: "Tracer", name: str, context: SpanContext, parent_id: Optional[str],
+                 kind: str, attributes: Optional[Dict[str, Any]]):
+        self._tracer = tracer
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self._reset = None
+    
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+    
+    def record_error(self, error: Any):
+        """span을 실패로 표시 (예외 또는 메시지)"""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}" if isinstance(error, BaseException) else str(error)
+    
+    def end(self):
+        """span 종료 및 exporter로 전달 (두 번째 호출은 무시)"""
+        if self.end_ns is not None:
+            return
+        # 벽시계 시작 시각 + 단조 시계 경과 시간 (시계 보정에 영향받지 않음)
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._start_perf)
+        self._tracer._on_end(self)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """파일 exporter 레코드"""
+        return {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "service": self._tracer.service_name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+    
+    def __enter__(self) -> "Span":
+        self._reset = _current.set(self.context)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None and self.status == "ok":
+            self.record_error(exc)
+        _current.reset(self._reset)
+        self.end()
+
+
+class _NoopSpan:
+    """tracing이 꺼져 있을 때의 span (아무것도 기록하지 않음)"""
+    
+    __slots__ = ()
+    
+    context = None
+    
+    def set_attribute(self, key: str, value: Any):
+        pass
+    
+    def record_error(self, error: Any):
+        pass
+    
+    def end(self):
+        pass
+    
+    def __enter__(self) -> "_NoopSpan":
+        return self
+    
+    def __exit__(self, *args):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+# ============================================
+# Exporters
+# ============================================
+
+class FileSpanExporter:
+    """
+    span을 JSON Lines로 파일에 추가 기록
+    
+    배치 하나를 O_APPEND로 한 번에 쓰므로 여러 에이전트 프로세스가 같은 파일을 써도 줄이 섞이지 않습니다.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+    
+    def export(self, spans: List[Dict[str, Any]]):
+        data = "".join(json.dumps(s, ensure_ascii=False, default=str) + "\n" for s in spans)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data.encode("utf-8"))
+        finally:
+            os.close(fd)
+    
+    def close(self):
+        pass
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OtlpHttpSpanExporter:
+    """
+    OTLP/HTTP JSON 수집기로 전송 (OpenTelemetry Collector, Jaeger, Tempo 등)
+    
+    전송 실패는 파이프라인에 영향을 주지 않도록 무시합니다.
+    """
+    
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self.client = httpx.Client(timeout=timeout)
+    
+    def export(self, spans: List[Dict[str, Any]]):
+        by_service: Dict[str, List[Dict[str, Any]]] = {}
+        for s in spans:
+            by_service.setdefault(s["service"], []).append({
+                "traceId": s["traceId"],
+                "spanId": s["spanId"],
+                "parentSpanId": s["parentSpanId"] or "",
+                "name": s["name"],
+                "kind": _KINDS.get(s["kind"], 1),
+                "startTimeUnixNano": str(s["startTimeUnixNano"]),
+                "endTimeUnixNano": str(s["endTimeUnixNano"]),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s["attributes"].items()],
+                "status": {"code": 2, "message": s["error"] or ""} if s["status"] == "error" else {"code": 1},
+            })
+        payload = {"resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+                "scopeSpans": [{"scope": {"name": "a2a.adk"}, "spans": service_spans}],
+            }
+            for service, service_spans in by_service.items()
+        ]}
+        try:
+            self.client.post(self.url, json=payload)
+        except httpx.HTTPError:
+            pass
+    
+    def close(self):
+        self.client.close()
+
+
+class _BatchProcessor:
+    """
+    끝난 span을 모아 백그라운드 스레드에서 내보내기
+    
+    span 종료는 큐에 넣기만 하므로 스킬/LLM 호출 경로에서 파일이나 네트워크 I/O를 기다리지 않습니다.
+    """
+    
+    def __init__(self, exporters: List[Any], max_batch: int = 512, interval: float = 1.0):
+        self.exporters = exporters
+        self.max_batch = max_batch
+        self.interval = interval
+        self._queue: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    def submit(self, record: Dict[str, Any]):
+        self._queue.put(record)
+        if self._thread is None:
+            self._start()
+    
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="a2a-trace-export", daemon=True)
+                self._thread.start()
+    
+    def _drain(self, first: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        batch = [first] if first is not None else []
+        while len(batch) < self.max_batch:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not None:
+                batch.append(record)
+        return batch
+    
+    def _export(self, batch: List[Dict[str, Any]]):
+        for exporter in self.exporters:
+            try:
+                exporter.export(batch)
+            except Exception as e:
+                from .log import get_logger
+                get_logger("a2a.tracing").warning("tracing.export_failed", exporter=type(exporter).__name__, error=str(e))
+    
+    def _loop(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.interval)
+            except queue.Empty:
+                continue
+            batch = self._drain(first)
+            if batch:
+                self._export(batch)
+    
+    def flush(self):
+        """큐에 남은 span을 호출한 스레드에서 바로 내보내기"""
+        while True:
+            batch = self._drain()
+            if not batch:
+                return
+            self._export(batch)
+    
+    def shutdown(self):
+        self.flush()
+        for exporter in self.exporters:
+            exporter.close()
+
+
+# ============================================
+# Tracer
+# ============================================
+
+class Tracer:
+    """
+    span 생성기
+    
+    exporter가 없으면 모든 span이 no-op이고, 수신한 traceparent는 context로 그대로 전달됩니다.
+    """
+    
+    def __init__(self, service_name: Optional[str] = None, exporters: Optional[Iterable[Any]] = None):
+        """
+        Args:
+            service_name: span에 기록할 서비스 이름
+            exporters: export(spans), close()를 가진 exporter 목록 (비어 있으면 tracing 꺼짐)
+        """
+        self.service_name = service_name or _default_service_name()
+        exporters = list(exporters or ())
+        self._processor = _BatchProcessor(exporters) if exporters else None
+    
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """A2A_TRACE_FILE / A2A_OTLP_ENDPOINT / A2A_SERVICE_NAME 환경 변수로 생성"""
+        exporters: List[Any] = []
+        trace_file = os.getenv("A2A_TRACE_FILE")
+        if trace_file:
+            exporters.append(FileSpanExporter(trace_file))
+        endpoint = os.getenv("A2A_OTLP_ENDPOINT")
+        if endpoint:
+            exporters.append(OtlpHttpSpanExporter(endpoint))
+        return cls(os.getenv("A2A_SERVICE_NAME"), exporters)
+    
+    @property
+    def enabled(self) -> bool:
+        return self._processor is not None
+    
+    def start_span(self, name: str, kind: str = "internal",
+                   attributes: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        현재 context의 자식 span 생성 (context가 없으면 새 trace 시작)
+        
+        Args:
+            name: span 이름
+            kind: "internal", "server" (요청 수신), "client" (요청 송신)
+            attributes: span 속성
+        
+        Returns:
+            Span (tracing이 꺼져 있거나 부모가 샘플링되지 않았으면 NOOP_SPAN)
+        """
+        if self._processor is None:
+            return NOOP_SPAN
+        parent = _current.get()
+        if parent is None:
+            context = SpanContext(_new_id(16), _new_id(8))
+            return Span(self, name, context, None, kind, attributes)
+        if not parent.sampled:
+            return NOOP_SPAN
+        context = SpanContext(parent.trace_id, _new_id(8))
+        return Span(self, name, context, parent.span_id, kind, attributes)
+    
+    def _on_end(self, span: Span):
+        if self._processor is not None:
+            self._processor.submit(span.to_dict())
+    
+    def flush(self):
+        if self._processor is not None:
+            self._processor.flush()
+    
+    def shutdown(self):
+        if self._processor is not None:
+            self._processor.shutdown()
+            self._processor = None
+
+
+def _default_service_name() -> str:
+    script = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else ""
+    return os.path.splitext(script)[0] or "a2a"
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """프로세스 기본 tracer (처음 호출할 때 환경 변수로 설정)"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer.from_env()
+                atexit.register(_tracer.shutdown)
+    return _tracer
+
+
+def configure(trace_file: Optional[str] = None, otlp_endpoint: Optional[str] = None,
+              service_name: Optional[str] = None) -> Tracer:
+    """
+    프로세스 기본 tracer를 코드에서 설정 (환경 변수 대신)
+    
+    Args:
+        trace_file: JSON Lines 파일 경로
+        otlp_endpoint: OTLP/HTTP 수집기 주소
+        service_name: 서비스 이름
+    
+    Returns:
+        새 tracer (둘 다 None이면 tracing 꺼짐)
+    """
+    global _tracer
+    exporters: List[Any] = []
+    if trace_file:
+        exporters.append(FileSpanExporter(trace_file))
+    if otlp_endpoint:
+        exporters.append(OtlpHttpSpanExporter(otlp_endpoint))
+    with _tracer_lock:
+        previous, _tracer = _tracer, Tracer(service_name, exporters)
+        atexit.register(_tracer.shutdown)
+    if previous is not None:
+        previous.shutdown()
+    return _tracer
+
+
+def start_span(name: str, kind: str = "internal", attributes: Optional[Dict[str, Any]] = None) -> Any:
+    """기본 tracer로 span 생성 (Tracer.start_span 참고)"""
+    return (_tracer or get_tracer()).start_span(name, kind, attributes)
+
+
+# ============================================
+# 분석: span 트리 / critical path
+# ============================================
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """FileSpanExporter 파일 읽기 (깨진 줄은 건너뜀)"""
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except ValueError:
+                continue
+    return spans
+
+
+def critical_path(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    한 trace의 critical path (루트의 종료 시각을 결정한 span들, 시간순)
+    
+    각 span에서 끝에서부터 거꾸로, 현재 시점 전에 가장 늦게 끝난 자식을 따라갑니다.
+    순차 파이프라인이면 단계별 span이, 병렬 구간이면 가장 오래 걸린 분기가 선택됩니다.
+    """
+    by_id = {s["spanId"]: s for s in spans}
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    roots = []
+    for s in spans:
+        if s.get("parentSpanId") in by_id:
+            children.setdefault(s["parentSpanId"], []).append(s)
+        else:
+            roots.append(s)
+    if not roots:
+        return []
+    
+    path: List[Dict[str, Any]] = []
+    
+    def walk(span: Dict[str, Any]):
+        path.append(span)
+        cursor = span["endTimeUnixNano"]
+        chosen = []
+        for child in sorted(children.get(span["spanId"], ()), key=lambda c: c["endTimeUnixNano"], reverse=True):
+            if child["endTimeUnixNano"] <= cursor:
+                chosen.append(child)
+                cursor = child["startTimeUnixNano"]
+        for child in reversed(chosen):
+            walk(child)
+    
+    walk(min(roots, key=lambda s: s["startTimeUnixNano"]))
+    return path
+
+
+def format_trace(spans: List[Dict[str, Any]]) -> str:
+    """
+    한 trace를 들여쓴 span 트리로 표시 (critical path는 * 표시)
+        
+        * pipeline                                 8421.3 ms  run_dynamic_pipeline_5
+        *   analyze_query                          1203.0 ms  run_dynamic_pipeline_5
+    """
+    by_id = {s["spanId"]: s for s in spans}
+    children: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for s in spans:
+        parent = s.get("parentSpanId") if s.get("parentSpanId") in by_id else None
+        children.setdefault(parent, []).append(s)
+    critical = {s["spanId"] for s in critical_path(spans)}
+    
+    lines = []
+    
+    def walk(span: Dict[str, Any], depth: int):
+        mark = "*" if span["spanId"] in critical else " "
+        label = ("  " * depth + span["name"])[:60]
+        error = f"  ! {span['error']}" if span.get("status") == "error" else ""
+        lines.append(f"{mark} {label:<60} {span['durationMs']:>10.1f} ms  {span.get('service', '')}{error}")
+        for child in sorted(children.get(span["spanId"], ()), key=lambda c: c["startTimeUnixNano"]):
+            walk(child, depth + 1)
+    
+    for root in sorted(children.get(None, ()), key=lambda s: s["startTimeUnixNano"]):
+        walk(root, 0)
+    return "\n".join(lines)
+
+
+def _main(argv: List[str]):
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="A2A trace viewer (span tree + critical path)")
+    parser.add_argument("path", help="A2A_TRACE_FILE로 기록된 JSON Lines 파일")
+    parser.add_argument("--trace", help="표시할 trace ID (기본: 마지막 trace)")
+    parser.add_argument("--all", action="store_true", help="모든 trace 표시")
+    args = parser.parse_args(argv)
+    
+    traces: Dict[str, List[Dict[str, Any]]] = {}
+    for s in load_spans(args.path):
+        traces.setdefault(s["traceId"], []).append(s)
+    if not traces:
+        print("No spans found.")
+        return
+    
+    if args.trace:
+        selected = [args.trace] if args.trace in traces else []
+    elif args.all:
+        selected = sorted(traces, key=lambda t: min(s["startTimeUnixNano"] for s in traces[t]))
+    else:
+        selected = [max(traces, key=lambda t: min(s["startTimeUnixNano"] for s in traces[t]))]
+    
+    for trace_id in selected:
+        print(f"\nTrace {trace_id} ({len(traces[trace_id])} spans)")
+        print("-" * 90)
+        print(format_trace(traces[trace_id]))
+
+
+__all__ = [
+    'SpanContext',
+    'Span',
+    'Tracer',
+    'FileSpanExporter',
+    'OtlpHttpSpanExporter',
+    'NOOP_SPAN',
+    'TRACEPARENT_HEADER',
+    'parse_traceparent',
+    'extract',
+    'inject',
+    'current_context',
+    'use_context',
+    'start_span',
+    'get_tracer',
+    'configure',
+    'load_spans',
+    'critical_path',
+    'format_trace',
+]
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1:])
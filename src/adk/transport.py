@@ -0,0 +1,448 @@
+"""
+A2A Agent Development Kit - Transport Layer
+클라이언트와 에이전트 서버 사이의 전송 계층 추상화
+
+URL 스킴에 따라 전송 방식을 선택합니다:
+    http://host:port      → HttpTransport (기본, httpx)
+    unix:///path/to.sock  → UnixSocketTransport (같은 호스트, Unix domain socket)
+    inproc://agent_id     → InProcessTransport (같은 프로세스, HTTP/JSON 없이 직접 호출)
+"""
+import copy
+import time
+import httpx
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from . import codec
+from . import streaming
+from . import tracing
+from .cancellation import DEADLINE_HEADER
+from .idempotency import IDEMPOTENCY_HEADER
+
+if TYPE_CHECKING:
+    from .server import A2AServer
+
+
+INPROC_SCHEME = "inproc://"
+UNIX_SCHEME = "unix://"
+
+# 같은 프로세스에서 실행 중인 서버 목록 (inproc URL → 등록 순서대로의 A2AServer, 마지막 서버가 응답)
+_local_servers: Dict[str, List["A2AServer"]] = {}
+
+
+def register_local_server(url: str, server: "A2AServer"):
+    """
+    in-process 전송으로 호출할 수 있도록 서버 등록
+    
+    같은 URL(agent_id)에 다른 서버가 있으면 새 서버가 응답합니다 (테스트, 노트북, 여러 포트로 실행).
+    새 서버를 close()하면 앞의 서버가 다시 응답합니다.
+    InProcessTransport는 만들 때 서버를 잡으므로 이미 만든 클라이언트는 원래 서버를 계속 호출합니다.
+    """
+    servers = _local_servers.setdefault(url, [])
+    if server in servers:
+        servers.remove(server)
+    servers.append(server)
+
+
+def unregister_local_server(url: str, server: Optional["A2AServer"] = None):
+    """in-process 서버 등록 해제 (server를 주면 그 서버만, 없으면 URL의 모든 서버)"""
+    servers = _local_servers.get(url)
+    if servers is None:
+        return
+    if server is None:
+        servers.clear()
+    elif server in servers:
+        servers.remove(server)
+    if not servers:
+        _local_servers.pop(url, None)
+
+
+def get_local_server(url: str) -> Optional["A2AServer"]:
+    """inproc URL에 해당하는 서버 조회 (가장 나중에 등록한 서버)"""
+    servers = _local_servers.get(url.rstrip('/'))
+    return servers[-1] if servers else None
+
+
+class A2ATransport:
+    """
+    A2A 전송 계층 인터페이스
+    
+    A2AClient / A2ADiscoveryClient는 이 인터페이스를 통해서만 에이전트와 통신합니다.
+    모든 메서드는 디코딩된 Python 객체를 반환합니다.
+    """
+    
+    # 서버가 처리한 뒤 응답을 잃어버릴 수 있는지 (True면 클라이언트가 idempotency key를 붙여 재시도)
+    lossy = True
+    
+    def get_agent_card(self, etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Agent Card 조회 (조건부)
+        
+        Args:
+            etag: 이전에 받은 ETag. 카드가 바뀌지 않았으면 (None, etag) 반환
+        
+        Returns:
+            (Agent Card 또는 None, ETag)
+        """
+        raise NotImplementedError
+    
+    def rpc(self, payload: Dict[str, Any], timeout: Optional[float] = None,
+            idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        JSON-RPC 2.0 요청 전송, 응답 객체 반환
+        
+        Args:
+            payload: JSON-RPC 요청 객체
+            timeout: 이 호출의 deadline (초). 서버는 이 시간이 지나면 실행을 중단
+            idempotency_key: 같은 키로 다시 보내면 서버가 스킬을 다시 실행하지 않고 이전 응답을 반환
+        """
+        raise NotImplementedError
+    
+    def rpc_stream(self, payload: Dict[str, Any], input_chunks: Optional[Iterable[Any]] = None,
+                   timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        스트리밍 JSON-RPC 요청 (/rpc:stream, streaming 참고)
+        
+        trace context는 호출한 시점의 것을 사용하고, 요청은 반환값을 처음 순회할 때 보냅니다.
+        
+        Args:
+            payload: JSON-RPC 요청 객체
+            input_chunks: 스킬의 스트리밍 입력 파라미터로 보낼 조각 (보내는 동안 만들어져도 됨)
+            timeout: 이 호출의 deadline (초)
+        
+        Returns:
+            {"chunk": ...} 레코드와 마지막 JSON-RPC 응답을 차례로 반환하는 이터레이터
+        """
+        raise NotImplementedError
+    
+    def create_task(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Task 생성 (timeout: 이 시간 안에 끝나지 않으면 서버가 Task 취소)"""
+        raise NotImplementedError
+    
+    def create_tasks(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Task 일괄 생성 ({"tasks": [CreateTaskRequest, ...]})"""
+        raise NotImplementedError
+    
+    def cancel_task(self, task_id: str) -> Dict[str, Any]:
+        """Task 취소"""
+        raise NotImplementedError
+    
+    def get_task(self, task_id: str, fields: Optional[str] = None,
+                 wait: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Task 상태 조회
+        
+        Args:
+            task_id: Task ID
+            fields: 쉼표로 구분한 필드 목록 (예: "status")
+            wait: 상태가 바뀔 때까지 최대 대기 시간 (초, 롱폴링)
+        """
+        raise NotImplementedError
+    
+    def get_tasks(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Task 일괄 상태 조회 ({"taskIds": [...], "fields": ...})"""
+        raise NotImplementedError
+    
+    def health(self) -> Dict[str, Any]:
+        """서버 상태 확인"""
+        raise NotImplementedError
+    
+    def close(self):
+        """전송 계층 종료"""
+        pass
+
+
+class HttpTransport(A2ATransport):
+    """
+    HTTP 전송 (httpx)
+    
+    client를 넘기면 여러 에이전트가 하나의 커넥션 풀을 공유합니다.
+    이 경우 close()는 공유 클라이언트를 닫지 않습니다.
+    
+    wire_format="msgpack"이면 요청을 MessagePack으로 보내고 응답도 MessagePack으로 요청합니다.
+    서버가 MessagePack을 지원하지 않으면 JSON 응답을 받아 그대로 디코딩합니다.
+    
+    응답 압축은 httpx가 Accept-Encoding으로 협상하고 자동으로 해제합니다.
+    요청 압축은 서버가 응답의 Accept-Encoding 헤더로 지원 방식을 알린 뒤부터,
+    compression_threshold 이상인 본문에만 적용합니다.
+    """
+    
+    def __init__(self, base_url: str, timeout: float = 120.0, client: Optional[httpx.Client] = None,
+                 wire_format: str = "json",
+                 compression_threshold: Optional[int] = codec.COMPRESSION_THRESHOLD):
+        if wire_format not in codec.WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format: '{wire_format}'")
+        media_type = codec.WIRE_FORMATS[wire_format]
+        if not codec.is_supported(media_type):
+            raise ValueError(f"Wire format '{wire_format}' is not available (pip install {wire_format})")
+        
+        self.base_url = base_url.rstrip('/')
+        self.media_type = media_type
+        self.compression_threshold = compression_threshold
+        self._request_encoding: Optional[str] = None  # 서버가 받을 수 있는 요청 압축 방식
+        self._owns_client = client is None
+        self.client = client or httpx.Client(timeout=timeout)
+    
+    def _decode(self, response: httpx.Response) -> Any:
+        """응답 Content-Type에 맞게 디코딩 (압축은 httpx가 이미 해제)"""
+        advertised = response.headers.get("accept-encoding")
+        if advertised:
+            self._request_encoding = codec.choose_encoding(advertised)
+        return codec.decode(response.content, codec.media_type_of(response.headers.get("content-type")))
+    
+    def get_agent_card(self, etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        headers = tracing.inject({"Accept": self.media_type})
+        if etag:
+            headers["If-None-Match"] = etag
+        response = self.client.get(f"{self.base_url}/.well-known/agent.json", headers=headers)
+        if response.status_code == 304:
+            return None, response.headers.get("etag", etag)
+        response.raise_for_status()
+        return self._decode(response), response.headers.get("etag")
+    
+    def _post(self, path: str, payload: Optional[Dict[str, Any]] = None,
+              deadline: Optional[float] = None, timeout: Optional[float] = None,
+              idempotency_key: Optional[str] = None) -> Any:
+        body = codec.encode(payload, self.media_type) if payload is not None else b""
+        headers = tracing.inject({"Content-Type": self.media_type, "Accept": self.media_type})
+        if deadline is not None:
+            headers[DEADLINE_HEADER] = f"{deadline:.3f}"
+        if idempotency_key is not None:
+            headers[IDEMPOTENCY_HEADER] = idempotency_key
+        
+        if (self._request_encoding and self.compression_threshold is not None
+                and len(body) >= self.compression_threshold):
+            body = codec.compress(body, self._request_encoding)
+            headers["Content-Encoding"] = self._request_encoding
+        
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        response = self.client.post(f"{self.base_url}{path}", content=body, headers=headers, **kwargs)
+        response.raise_for_status()
+        return self._decode(response)
+    
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None,
+             timeout: Optional[float] = None) -> Any:
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        response = self.client.get(
+            f"{self.base_url}{path}", params=params,
+            headers=tracing.inject({"Accept": self.media_type}), **kwargs
+        )
+        response.raise_for_status()
+        return self._decode(response)
+    
+    def rpc(self, payload: Dict[str, Any], timeout: Optional[float] = None,
+            idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        # 클라이언트가 기다릴 시간을 서버에 알림 (지정하지 않으면 읽기 타임아웃)
+        deadline = timeout if timeout is not None else self.client.timeout.read
+        return self._post("/rpc", payload, deadline=deadline, timeout=timeout, idempotency_key=idempotency_key)
+    
+    def rpc_stream(self, payload: Dict[str, Any], input_chunks: Optional[Iterable[Any]] = None,
+                   timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        # 본문은 chunked 전송 (입력 조각을 만들어지는 대로), 읽기 타임아웃은 조각 사이 간격에 적용
+        deadline = timeout if timeout is not None else self.client.timeout.read
+        headers = tracing.inject({
+            "Content-Type": streaming.NDJSON_MEDIA_TYPE, "Accept": streaming.NDJSON_MEDIA_TYPE
+        })
+        if deadline is not None:
+            headers[DEADLINE_HEADER] = f"{deadline:.3f}"
+        return self._stream_records(
+            "/rpc:stream", streaming.encode_request(payload, input_chunks), headers, timeout
+        )
+    
+    def _stream_records(self, path: str, body: Iterator[bytes], headers: Dict[str, str],
+                        timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        with self.client.stream("POST", f"{self.base_url}{path}", content=body, headers=headers, **kwargs) as response:
+            response.raise_for_status()
+            yield from streaming.iter_records(response.iter_lines())
+    
+    def create_task(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        return self._post("/tasks", payload, deadline=timeout)
+    
+    def create_tasks(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        return self._post("/tasks:batch", payload, deadline=timeout)
+    
+    def cancel_task(self, task_id: str) -> Dict[str, Any]:
+        return self._post(f"/tasks/{task_id}/cancel")
+    
+    def get_task(self, task_id: str, fields: Optional[str] = None,
+                 wait: Optional[float] = None) -> Dict[str, Any]:
+        params = {}
+        if fields:
+            params["fields"] = fields
+        timeout = None
+        if wait:
+            params["wait"] = wait
+            # 롱폴링 대기 시간만큼 읽기 타임아웃 연장
+            read_timeout = self.client.timeout.read
+            if read_timeout is not None and read_timeout < wait + 10.0:
+                timeout = wait + 10.0
+        return self._get(f"/tasks/{task_id}", params=params or None, timeout=timeout)
+    
+    def get_tasks(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._post("/tasks:status", payload)
+    
+    def health(self) -> Dict[str, Any]:
+        return self._get("/health")
+    
+    def close(self):
+        if self._owns_client:
+            self.client.close()
+
+
+class UnixSocketTransport(HttpTransport):
+    """
+    Unix domain socket 전송 (같은 호스트의 에이전트)
+    
+    TCP 스택을 거치지 않으므로 loopback HTTP보다 지연이 작습니다.
+    서버는 A2AServer(agent, uds="/tmp/writer.sock")로 실행합니다.
+    """
+    
+    def __init__(self, socket_path: str, timeout: float = 120.0, wire_format: str = "json"):
+        client = httpx.Client(
+            transport=httpx.HTTPTransport(uds=socket_path),
+            timeout=timeout
+        )
+        super().__init__("http://localhost", client=client, wire_format=wire_format)
+        self.socket_path = socket_path
+        self._owns_client = True
+
+
+class InProcessTransport(A2ATransport):
+    """
+    In-process 전송 (같은 프로세스의 A2AServer)
+    
+    HTTP 요청과 JSON 직렬화 없이 서버 핸들러를 직접 호출합니다.
+    파라미터와 결과는 Python 객체 그대로 전달됩니다.
+    """
+    
+    lossy = False
+    
+    def __init__(self, server: "A2AServer"):
+        self.server = server
+    
+    def get_agent_card(self, etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        current = self.server.agent_card_etag
+        if etag == current:
+            return None, current
+        # 서버 캐시를 보호하기 위해 사본 반환
+        return copy.deepcopy(self.server.build_agent_card()), current
+    
+    def rpc(self, payload: Dict[str, Any], timeout: Optional[float] = None,
+            idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        return self.server.handle_rpc(payload, _deadline(timeout), idempotency_key)
+    
+    def rpc_stream(self, payload: Dict[str, Any], input_chunks: Optional[Iterable[Any]] = None,
+                   timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        # 조각은 Python 객체 그대로, 입력 조각은 서버의 스킬이 직접 순회
+        return self.server.handle_rpc_stream(payload, input_chunks, _deadline(timeout), tracing.current_context())
+    
+    def create_task(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        from ..a2a_protocol import CreateTaskRequest
+        
+        response = self.server.submit_task(CreateTaskRequest(**payload), _deadline(timeout))
+        return response.model_dump()
+    
+    def create_tasks(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        from ..a2a_protocol import CreateTasksRequest
+        
+        response = self.server.submit_tasks(CreateTasksRequest(**payload), _deadline(timeout))
+        return response.model_dump()
+    
+    def cancel_task(self, task_id: str) -> Dict[str, Any]:
+        task = self.server.cancel_task(task_id)
+        if task is None:
+            raise self._status_error("POST", f"/tasks/{task_id}/cancel", 404, "Task not found")
+        if task.status != "canceled":
+            raise self._status_error("POST", f"/tasks/{task_id}/cancel", 409, f"Task already {task.status}")
+        projected = self.server.project_task(task, "status,metadata")
+        return {"task": {name: _plain(value) for name, value in projected.items()}}
+    
+    def get_task(self, task_id: str, fields: Optional[str] = None,
+                 wait: Optional[float] = None) -> Dict[str, Any]:
+        task = self.server.get_task(task_id)
+        if task is None:
+            raise self._status_error("GET", f"/tasks/{task_id}", 404, "Task not found")
+        if wait:
+            self.server.wait_for_task_change_sync(
+                task_id, task.status, min(wait, self.server.max_task_wait)
+            )
+        if fields:
+            projected = self.server.project_task(task, fields)
+            return {"task": {name: _plain(value) for name, value in projected.items()}}
+        return {"task": task.model_dump(mode="json")}
+    
+    def get_tasks(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        from ..a2a_protocol import GetTasksStatusRequest
+        
+        result = self.server.get_tasks(GetTasksStatusRequest(**payload))
+        result["tasks"] = [
+            {name: _plain(value) for name, value in task.items()} for task in result["tasks"]
+        ]
+        return result
+    
+    def health(self) -> Dict[str, Any]:
+        return self.server.health()
+    
+    def _status_error(self, method: str, path: str, status_code: int, detail: str) -> httpx.HTTPStatusError:
+        """HTTP 전송과 같은 예외 (호출자가 전송 방식과 관계없이 status_code로 처리)"""
+        request = httpx.Request(method, f"{self.server.local_url}{path}")
+        response = httpx.Response(status_code, json={"detail": detail}, request=request)
+        return httpx.HTTPStatusError(f"{status_code} {detail}: {request.url}", request=request, response=response)
+
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    """남은 시간(초) → time.monotonic() 기준 마감 시각"""
+    return time.monotonic() + timeout if timeout is not None else None
+
+
+def _plain(value: Any) -> Any:
+    """HTTP 응답과 같은 형태가 되도록 모델/시각 값을 기본 타입으로 변환"""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def transport_for_url(url: str, timeout: float = 120.0,
+                      client: Optional[httpx.Client] = None,
+                      wire_format: str = "json") -> A2ATransport:
+    """
+    URL 스킴에 맞는 전송 계층 생성
+    
+    Args:
+        url: 에이전트 URL (http://, unix://, inproc://)
+        timeout: 요청 타임아웃 (초)
+        client: HTTP 전송이 공유할 httpx.Client (선택)
+        wire_format: HTTP/Unix socket 전송의 인코딩 ("json" 또는 "msgpack")
+    
+    Returns:
+        A2ATransport
+    
+    Raises:
+        ValueError: inproc URL에 해당하는 서버가 없을 때
+    """
+    url = url.rstrip('/')
+    
+    if url.startswith(INPROC_SCHEME):
+        server = get_local_server(url)
+        if server is None:
+            raise ValueError(f"No in-process server registered at '{url}'")
+        return InProcessTransport(server)
+    
+    if url.startswith(UNIX_SCHEME):
+        return UnixSocketTransport(url[len(UNIX_SCHEME):], timeout=timeout, wire_format=wire_format)
+    
+    return HttpTransport(url, timeout=timeout, client=client, wire_format=wire_format)
+
+
+__all__ = [
+    'A2ATransport',
+    'HttpTransport',
+    'UnixSocketTransport',
+    'InProcessTransport',
+    'transport_for_url',
+    'register_local_server',
+    'unregister_local_server',
+    'get_local_server',
+]
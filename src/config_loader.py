@@ -19,7 +19,9 @@ try:
     
     if env_file.exists():
         load_dotenv(env_file)
-        print(f"[Config] ✅ .env 파일 로드: {env_file}")
+        # 성공 메시지는 배너와 같이 verbose일 때만 (.env에서 A2A_VERBOSE 설정 가능)
+        if os.getenv("A2A_VERBOSE", "").lower() in ("1", "true", "yes"):
+            print(f"[Config] ✅ .env 파일 로드: {env_file}")
     else:
         print(f"[Config] ⚠️  .env 파일 없음: {env_file}")
         print(f"[Config]    env_template.txt를 .env로 복사하세요")
@@ -3,14 +3,55 @@ Google Gemini API 클라이언트
 공식 Google LLM 사용
 """
 import os
+import time
 import google.generativeai as genai
 
+from .adk import metrics, tracing
+from .adk.log import get_logger
+from .adk.cancellation import TaskCancelledError, check_cancelled, current_token, remaining_time
+
+logger = get_logger("a2a.llm")
+
+# 타임아웃이 deadline보다 이만큼(초) 일찍 끝나도 deadline 때문으로 봄
+_DEADLINE_SLACK = 0.05
+
 _model = None
 _configured_key = None
+_configured_model = None
+
+# LLM 호출 메트릭 (A2AServer의 /metrics에 함께 노출)
+_llm_requests = metrics.REGISTRY.counter(
+    "a2a_llm_requests_total", "Gemini API calls", ("model", "mode", "outcome")
+)
+_llm_latency = metrics.REGISTRY.histogram(
+    "a2a_llm_request_seconds", "Gemini API call latency (stream: until the last chunk)",
+    ("model", "mode"), buckets=metrics.LLM_BUCKETS
+)
+_llm_first_chunk = metrics.REGISTRY.histogram(
+    "a2a_llm_first_chunk_seconds", "Gemini streaming latency until the first chunk",
+    ("model",), buckets=metrics.LLM_BUCKETS
+)
+
+
+def _start_span(mode: str, prompt: str):
+    """LLM 호출 client span (A2A 서버에서 실행 중이면 스킬 span의 자식)"""
+    return tracing.start_span(f"gemini.{mode}", "client", {
+        "llm.model": _configured_model, "llm.prompt_chars": len(prompt)
+    })
+
+
+def _observe(mode: str, start: float, outcome: str, span=tracing.NOOP_SPAN, error: Exception = None):
+    _llm_latency.labels(_configured_model, mode).observe(time.perf_counter() - start)
+    _llm_requests.labels(_configured_model, mode, outcome).inc()
+    span.set_attribute("llm.outcome", outcome)
+    if error is not None:
+        span.record_error(error)
+    span.end()
+
 
 def _get_model():
     """Gemini 모델 초기화"""
-    global _model, _configured_key
+    global _model, _configured_key, _configured_model
     
     # 매번 환경변수에서 새로 읽기
     current_key = os.getenv("GEMINI_API_KEY")
@@ -24,10 +65,39 @@ def _get_model():
         genai.configure(api_key=current_key)
         _model = genai.GenerativeModel(current_model)
         _configured_key = current_key
+        _configured_model = current_model
     
     return _model
 
 
+def _request_options() -> dict:
+    """호출자의 남은 시간을 Gemini 요청 타임아웃으로 사용"""
+    remaining = remaining_time()
+    return {"timeout": remaining} if remaining is not None else {}
+
+
+def _raise_if_deadline(mode: str, start: float, span, error: Exception):
+    """
+    요청 실패가 취소나 deadline 때문이면 LLM 오류가 아니라 취소로 처리
+    
+    _request_options()의 타임아웃은 deadline에 맞춰 끝나므로 타이머 오차만큼 일찍 끝난 경우도 deadline으로 봅니다.
+    
+    Raises:
+        TaskCancelledError: Task가 취소되었거나 deadline이 (거의) 지났을 때
+    """
+    token = current_token()
+    if token is None:
+        return
+    remaining = token.remaining()
+    if remaining is not None and remaining <= _DEADLINE_SLACK:
+        token.cancel("Deadline exceeded")
+    if not token.cancelled:
+        return
+    cancelled = TaskCancelledError(token.reason)
+    _observe(mode, start, "canceled", span, cancelled)
+    raise cancelled from error
+
+
 def generate(system: str, user: str) -> str:
     """
     Gemini로 텍스트 생성
@@ -38,13 +108,21 @@ def generate(system: str, user: str) -> str:
     
     Returns:
         LLM 응답
+    
+    Raises:
+        TaskCancelledError: A2A 서버에서 실행 중인 Task가 취소되었거나 deadline이 지났을 때
     """
+    # 호출자가 이미 포기한 요청이면 API 쿼터를 쓰지 않음
+    check_cancelled()
+    
     model = _get_model()
     
     if model is None:
-        print("[LLM] Gemini API key not set. Use: $env:GEMINI_API_KEY='your-key'")
+        logger.warning("llm.no_api_key", hint="$env:GEMINI_API_KEY='your-key'")
         return f"[No Gemini API Key] System: {system[:50]}..."
     
+    start = time.perf_counter()
+    span = tracing.NOOP_SPAN
     try:
         # Gemini는 system role이 없으므로 프롬프트에 통합
         full_prompt = f"""Role: {system}
@@ -53,18 +131,32 @@ Task: {user}
 
 Response:"""
         
-        response = model.generate_content(full_prompt)
-        return response.text.strip()
+        span = _start_span("generate", full_prompt)
+        response = model.generate_content(full_prompt, request_options=_request_options())
+        text = response.text.strip()
+        span.set_attribute("llm.response_chars", len(text))
+        _observe("generate", start, "ok", span)
+        return text
     
     except Exception as e:
-        print(f"[LLM] Gemini error: {e}")
+        _raise_if_deadline("generate", start, span, e)
+        _observe("generate", start, "error", span, e)
+        logger.error("llm.error", model=_configured_model, error=str(e))
         return f"[Gemini Error] {str(e)}"
 
 
 def generate_stream(system: str, user: str):
     """
-    Gemini 스트리밍
+    Gemini 스트리밍 (Task가 취소되면 다음 청크에서 중단)
+    
+    조각은 다음 단계(save_to_file 등)로 그대로 흘러가므로, 오류를 본문 텍스트로 내보내지 않고 예외로 전달합니다.
+    
+    Raises:
+        TaskCancelledError: Task가 취소되었거나 deadline이 지났을 때
+        Exception: Gemini API 오류 (이미 반환한 조각은 그대로)
     """
+    check_cancelled()
+    
     model = _get_model()
     
     if model is None:
@@ -73,6 +165,9 @@ def generate_stream(system: str, user: str):
             yield char
         return
     
+    start = time.perf_counter()
+    first_chunk = True
+    span = tracing.NOOP_SPAN
     try:
         full_prompt = f"""Role: {system}
 
@@ -80,16 +175,35 @@ Task: {user}
 
 Response:"""
         
-        response = model.generate_content(full_prompt, stream=True)
+        # 제너레이터는 소비하는 쪽 context에서 재개되므로 span을 현재 context로 두지 않고 직접 종료
+        span = _start_span("stream", full_prompt)
+        response = model.generate_content(
+            full_prompt, stream=True, request_options=_request_options()
+        )
         
         for chunk in response:
+            check_cancelled()
+            if first_chunk:
+                _llm_first_chunk.labels(_configured_model).observe(time.perf_counter() - start)
+                span.set_attribute("llm.first_chunk_ms", round((time.perf_counter() - start) * 1000, 1))
+                first_chunk = False
             if chunk.text:
                 yield chunk.text
+        _observe("stream", start, "ok", span)
+    
+    except TaskCancelledError as e:
+        _observe("stream", start, "canceled", span, e)
+        raise
     
     except Exception as e:
-        error_msg = f"[Gemini Error] {str(e)}"
-        for char in error_msg:
-            yield char
+        _raise_if_deadline("stream", start, span, e)
+        _observe("stream", start, "error", span, e)
+        logger.error("llm.error", model=_configured_model, mode="stream", error=str(e))
+        raise
+    
+    finally:
+        # 소비자가 중간에 그만둔 경우 (GeneratorExit)
+        span.end()
 
 
 # 편의 함수